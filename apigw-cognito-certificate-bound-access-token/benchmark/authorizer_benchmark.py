@@ -0,0 +1,207 @@
+"""
+Measures authorizer latency for a cold container versus warm invocations.
+
+Generates a throwaway CA, a client certificate signed by it and an RSA
+signing key, then mints a Cognito-style access token carrying the client
+certificate's cnf/x5t#S256 thumbprint. S3 and the Cognito JWKS endpoint are
+replaced by in-memory fakes that add a configurable network latency, so no
+AWS account is needed.
+
+    pip install requests python-jose cryptography boto3
+    python benchmark/authorizer_benchmark.py --invocations 200 --latency-ms 30
+"""
+
+import argparse
+import base64
+import importlib
+import io
+import json
+import os
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from botocore.exceptions import ClientError
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from jose import jwk, jwt
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+REGION = 'us-east-1'
+USER_POOL_ID = f'{REGION}_benchmark'
+ISSUER = f'https://cognito-idp.{REGION}.amazonaws.com/{USER_POOL_ID}'
+CLIENT_ID = 'benchmark-client'
+KID = 'benchmark-kid'
+
+
+def _b64url(data):
+    return base64.urlsafe_b64encode(data).decode('ascii').rstrip('=')
+
+
+def _certificate(subject, issuer, public_key, signing_key, is_ca):
+    now = datetime.now(timezone.utc)
+    return (
+        x509.CertificateBuilder()
+        .subject_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, subject)]))
+        .issuer_name(x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, issuer)]))
+        .public_key(public_key)
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(minutes=5))
+        .not_valid_after(now + timedelta(days=1))
+        .add_extension(x509.BasicConstraints(ca=is_ca, path_length=None), critical=True)
+        .sign(signing_key, hashes.SHA256())
+    )
+
+
+def build_fixtures():
+    ca_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    ca_cert = _certificate('benchmark-ca', 'benchmark-ca', ca_key.public_key(), ca_key, True)
+    client_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    client_cert = _certificate('benchmark-client', 'benchmark-ca', client_key.public_key(), ca_key, False)
+
+    token_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    token_key_pem = token_key.private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    public_jwk = jwk.construct(token_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo), 'RS256').to_dict()
+    public_jwk = {k: v.decode() if isinstance(v, bytes) else v for k, v in public_jwk.items()}
+    public_jwk.update({'kid': KID, 'use': 'sig'})
+
+    now = int(time.time())
+    claims = {
+        'iss': ISSUER,
+        'client_id': CLIENT_ID,
+        'aud': CLIENT_ID,
+        'token_use': 'access',
+        'sub': 'benchmark-user',
+        'iat': now,
+        'exp': now + 3600,
+        'cnf': {'x5t#S256': _b64url(client_cert.fingerprint(hashes.SHA256()))},
+    }
+    token = jwt.encode(claims, token_key_pem.decode(), algorithm='RS256', headers={'kid': KID})
+    return {
+        'ca_pem': ca_cert.public_bytes(serialization.Encoding.PEM),
+        'client_pem': client_cert.public_bytes(serialization.Encoding.PEM).decode(),
+        'jwks': {'keys': [public_jwk]},
+        'token': token,
+    }
+
+
+class FakeS3Client:
+    """get_object with an ETag and conditional (IfNoneMatch) support."""
+
+    def __init__(self, body, latency):
+        self.body = body
+        self.etag = '"benchmark-ca-v1"'
+        self.latency = latency
+        self.calls = 0
+
+    def get_object(self, Bucket, Key, IfNoneMatch=None):
+        self.calls += 1
+        time.sleep(self.latency)
+        if IfNoneMatch == self.etag:
+            raise ClientError({'Error': {'Code': '304', 'Message': 'Not Modified'}}, 'GetObject')
+        return {'Body': io.BytesIO(self.body), 'ETag': self.etag}
+
+
+class _JwksResponse:
+    def __init__(self, document):
+        self.document = document
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self.document
+
+
+class FakeJwksSession:
+    def __init__(self, document, latency):
+        self.document = document
+        self.latency = latency
+        self.calls = 0
+
+    def get(self, url, timeout=None):
+        self.calls += 1
+        time.sleep(self.latency)
+        return _JwksResponse(self.document)
+
+
+def load_authorizer(fixtures, latency):
+    """Fresh import of the handler module, i.e. a cold container."""
+    sys.modules.pop('handlers.authorizer', None)
+    authorizer = importlib.import_module('handlers.authorizer')
+    authorizer.region = REGION
+    authorizer.s3_client = FakeS3Client(fixtures['ca_pem'], latency)
+    authorizer.http_session = FakeJwksSession(fixtures['jwks'], latency)
+    authorizer.logger.disabled = True
+    return authorizer
+
+
+def invoke(authorizer, event):
+    started = time.perf_counter()
+    policy = authorizer.lambda_handler(event, None)
+    elapsed = time.perf_counter() - started
+    effect = policy['policyDocument']['Statement'][0]['Effect']
+    if effect != 'Allow':
+        raise SystemExit('Authorizer denied the benchmark request; fixtures are inconsistent')
+    return elapsed
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run(invocations, cold_starts, latency):
+    os.environ.setdefault('AWS_DEFAULT_REGION', REGION)
+    os.environ['BUCKET_NAME'] = 'benchmark-bucket'
+    os.environ['CACERT_KEY'] = 'truststore.pem'
+    fixtures = build_fixtures()
+    event = {
+        'headers': {'authorization': f"Bearer {fixtures['token']}"},
+        'requestContext': {'identity': {'clientCert': {'clientCertPem': fixtures['client_pem']}}},
+        'methodArn': 'arn:aws:execute-api:us-east-1:123456789012:api/prod/GET/resource',
+    }
+
+    cold = []
+    for _ in range(cold_starts):
+        cold.append(invoke(load_authorizer(fixtures, latency), event))
+
+    authorizer = load_authorizer(fixtures, latency)
+    invoke(authorizer, event)
+    warm = [invoke(authorizer, event) for _ in range(invocations)]
+
+    def summary(values):
+        return {
+            'p50Ms': round(statistics.median(values) * 1000, 3),
+            'p99Ms': round(percentile(values, 99) * 1000, 3),
+            'meanMs': round(statistics.mean(values) * 1000, 3),
+        }
+
+    return {
+        'simulatedNetworkLatencyMs': latency * 1000,
+        'cold': summary(cold),
+        'warm': summary(warm),
+        'warmInvocations': invocations,
+        'warmS3Calls': authorizer.s3_client.calls - 1,
+        'warmJwksCalls': authorizer.http_session.calls - 1,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--invocations', type=int, default=200, help='Warm invocations to time')
+    parser.add_argument('--cold-starts', type=int, default=10, help='Cold (first) invocations to time')
+    parser.add_argument('--latency-ms', type=float, default=30, help='Simulated S3/JWKS round trip')
+    args = parser.parse_args()
+    print(json.dumps(run(args.invocations, args.cold_starts, args.latency_ms / 1000), indent=2))
+
+
+if __name__ == '__main__':
+    main()
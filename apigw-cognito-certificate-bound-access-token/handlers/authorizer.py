@@ -1,7 +1,7 @@
 import json
 import boto3
 import logging
-from jose import jwt
+from jose import jwk, jwt
 from jose.utils import base64url_decode
 from botocore.exceptions import ClientError
 from cryptography import x509
@@ -13,7 +13,10 @@ from cryptography.hazmat.primitives.asymmetric import rsa
 
 import requests
 from datetime import datetime, timezone
+from collections import OrderedDict
+import hashlib
 import os
+import time
 import traceback
 
 # Set up logging
@@ -21,6 +24,24 @@ logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
 s3_client = boto3.client('s3')
+# Keep-alive connection to the Cognito JWKS endpoint across invocations
+http_session = requests.Session()
+region = boto3.Session().region_name
+
+# Container-scoped caches, reused by warm invocations:
+#   JWKS signing keys (already constructed) by issuer and kid, refetched after the TTL or for an unknown kid
+#   the parsed CA certificate, revalidated with a conditional (ETag) GET after the TTL
+#   client certificates that already passed verification against the current CA
+JWKS_TTL_SECONDS = int(os.environ.get('JWKS_TTL_SECONDS', 3600))
+CA_CERT_TTL_SECONDS = int(os.environ.get('CA_CERT_TTL_SECONDS', 300))
+VERIFIED_CERT_TTL_SECONDS = int(os.environ.get('VERIFIED_CERT_TTL_SECONDS', 300))
+VERIFIED_CERT_CACHE_SIZE = 1024
+# Unknown kids and failed signatures may force a refetch at most this often
+MIN_REFRESH_SECONDS = 30
+
+_jwks_cache = {}                 # issuer -> {'keys': {kid: key}, 'fetched_at': ts}
+_ca_cache = {}                   # (bucket, key) -> {'cert', 'etag', 'checked_at'}
+_verified_certs = OrderedDict()  # sha256(client cert PEM) -> {'fingerprint', 'ca_etag', 'expires_at'}
 
 def lambda_handler(event, context):
     logger.info(f"Received event: {json.dumps(event)}")
@@ -70,13 +91,9 @@ def verify_jwt(token):
     payload = jwt.get_unverified_claims(token)
     user_pool_id = payload['iss'].split('/')[-1]
 
-    # Get the public keys
-    keys_url = f'https://cognito-idp.{boto3.Session().region_name}.amazonaws.com/{user_pool_id}/.well-known/jwks.json'
-    response = requests.get(keys_url)
-    keys = response.json()['keys']
-
-    # Find the correct public key
-    public_key = next((key for key in keys if key['kid'] == kid), None)
+    # Get the public key (cached by issuer and kid)
+    issuer = f'https://cognito-idp.{region}.amazonaws.com/{user_pool_id}'
+    public_key = get_signing_key(issuer, kid)
     if not public_key:
         raise Exception('Public key not found')
 
@@ -86,10 +103,28 @@ def verify_jwt(token):
         public_key,
         algorithms=['RS256'],
         audience=payload.get('aud') if payload.get('aud') else payload.get('client_id'),
-        issuer=f'https://cognito-idp.{boto3.Session().region_name}.amazonaws.com/{user_pool_id}'
+        issuer=issuer
     )
     return verified_claims
 
+def get_signing_key(issuer, kid):
+    now = time.time()
+    entry = _jwks_cache.get(issuer)
+    if entry:
+        age = now - entry['fetched_at']
+        if kid in entry['keys'] and age < JWKS_TTL_SECONDS:
+            return entry['keys'][kid]
+        # An unknown kid means the keys may have rotated, but do not let
+        # tokens with made-up kids trigger a fetch on every call
+        if kid not in entry['keys'] and age < MIN_REFRESH_SECONDS:
+            return None
+
+    response = http_session.get(f'{issuer}/.well-known/jwks.json', timeout=5)
+    response.raise_for_status()
+    keys = {key['kid']: jwk.construct(key, 'RS256') for key in response.json()['keys']}
+    _jwks_cache[issuer] = {'keys': keys, 'fetched_at': now}
+    return keys.get(kid)
+
 from datetime import datetime, timezone
 from cryptography import x509
 from cryptography.hazmat.primitives.asymmetric import padding, rsa
@@ -98,31 +133,28 @@ from cryptography.hazmat.backends import default_backend
 
 def verify_certificate(cert_pem, bucket_name, object_key):
     try:
-        # Load the client certificate
-        cert = x509.load_pem_x509_certificate(cert_pem.encode(), default_backend())
-
         # Load the CA certificate
-        ca_cert_pem = get_ca_cert(bucket_name, object_key)
-        if not ca_cert_pem:
+        ca = get_ca_cert(bucket_name, object_key)
+        if not ca:
             return False
-        ca_cert = x509.load_pem_x509_certificate(ca_cert_pem.encode(), default_backend())
+
+        # Certificates already verified against this CA version skip the crypto
+        digest = _pem_digest(cert_pem)
+        cached = _verified_certs.get(digest)
+        if cached and cached['ca_etag'] == ca['etag'] and time.time() < cached['expires_at']:
+            _verified_certs.move_to_end(digest)
+            return True
+
+        # Load the client certificate
+        cert = x509.load_pem_x509_certificate(cert_pem.encode(), default_backend())
 
         # Verify the certificate signature
-        ca_public_key = ca_cert.public_key()
-        if isinstance(ca_public_key, rsa.RSAPublicKey):
-            try:
-                ca_public_key.verify(
-                    cert.signature,
-                    cert.tbs_certificate_bytes,
-                    padding.PKCS1v15(),
-                    cert.signature_hash_algorithm
-                )
-            except InvalidSignature:
+        if not is_signed_by(cert, ca['cert']):
+            # The CA may have been rotated since it was cached
+            ca = get_ca_cert(bucket_name, object_key, force=True)
+            if not ca or not is_signed_by(cert, ca['cert']):
                 logger.error("Invalid certificate signature")
                 return False
-        else:
-            logger.error("Unsupported public key type")
-            return False
         
         # Check if the certificate has expired
         now = datetime.now(timezone.utc)
@@ -133,18 +165,64 @@ def verify_certificate(cert_pem, bucket_name, object_key):
         
         # Check revocation status
         # implement this
+
+        _verified_certs[digest] = {
+            'fingerprint': cert.fingerprint(hashes.SHA256()).hex(),
+            'ca_etag': ca['etag'],
+            'expires_at': min(time.time() + VERIFIED_CERT_TTL_SECONDS, cert.not_valid_after_utc.timestamp()),
+        }
+        while len(_verified_certs) > VERIFIED_CERT_CACHE_SIZE:
+            _verified_certs.popitem(last=False)
         
         return True
     
     except Exception as e:
         logger.error(f"Certificate verification error: {str(e)}")
         return False
+
+def is_signed_by(cert, ca_cert):
+    ca_public_key = ca_cert.public_key()
+    if not isinstance(ca_public_key, rsa.RSAPublicKey):
+        logger.error("Unsupported public key type")
+        return False
+    try:
+        ca_public_key.verify(
+            cert.signature,
+            cert.tbs_certificate_bytes,
+            padding.PKCS1v15(),
+            cert.signature_hash_algorithm
+        )
+        return True
+    except InvalidSignature:
+        return False
     
-def get_ca_cert(bucket_name, object_key):
+def get_ca_cert(bucket_name, object_key, force=False):
+    """Parsed CA certificate and its ETag, revalidated with a conditional GET after the TTL."""
+    cache_key = (bucket_name, object_key)
+    entry = _ca_cache.get(cache_key)
+    now = time.time()
+    if entry:
+        age = now - entry['checked_at']
+        if age < CA_CERT_TTL_SECONDS and (not force or age < MIN_REFRESH_SECONDS):
+            return entry
     try:
-        response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
-        return response['Body'].read().decode('utf-8')
+        if entry:
+            response = s3_client.get_object(Bucket=bucket_name, Key=object_key, IfNoneMatch=entry['etag'])
+        else:
+            response = s3_client.get_object(Bucket=bucket_name, Key=object_key)
+        ca_cert_pem = response['Body'].read().decode('utf-8')
+        entry = {
+            'cert': x509.load_pem_x509_certificate(ca_cert_pem.encode(), default_backend()),
+            'etag': response['ETag'],
+            'checked_at': now,
+        }
+        _ca_cache[cache_key] = entry
+        return entry
     except ClientError as e:
+        if entry and e.response.get('Error', {}).get('Code') in ('304', 'NotModified'):
+            # Unchanged since it was cached
+            entry['checked_at'] = now
+            return entry
         logger.error(f"Error retrieving CA cert: {str(e)}")
         return None
 
@@ -154,8 +232,7 @@ def check_revocation_status(cert):
 
 def is_cert_bound_to_token(claims, cert_pem):
     try:
-        cert = x509.load_pem_x509_certificate(cert_pem.encode(), default_backend())
-        fingerprint = cert.fingerprint(hashes.SHA256()).hex()
+        fingerprint = client_cert_fingerprint(cert_pem)
         x5t_claim = claims.get('cnf', {}).get('x5t#S256')
         
         if not x5t_claim:
@@ -171,6 +248,16 @@ def is_cert_bound_to_token(claims, cert_pem):
         logger.error(traceback.format_exc())
         return False
 
+def client_cert_fingerprint(cert_pem):
+    cached = _verified_certs.get(_pem_digest(cert_pem))
+    if cached:
+        return cached['fingerprint']
+    cert = x509.load_pem_x509_certificate(cert_pem.encode(), default_backend())
+    return cert.fingerprint(hashes.SHA256()).hex()
+
+def _pem_digest(cert_pem):
+    return hashlib.sha256(cert_pem.encode()).hexdigest()
+
 def generate_policy(principal_id, effect, resource):
     return {
         'principalId': principal_id,
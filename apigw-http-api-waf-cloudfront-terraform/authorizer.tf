@@ -10,6 +10,8 @@ resource "aws_lambda_function" "http_api_auth_lambda" {
   environment {
     variables = {
         "SECRET_NAME" = aws_secretsmanager_secret.cf_api_header_secret_store.name
+        "SECRET_CACHE_TTL_SECONDS" = var.auth_secret_cache_ttl_seconds
+        "SECRET_PREVIOUS_GRACE_SECONDS" = var.auth_secret_previous_grace_seconds
     }
   }
 }
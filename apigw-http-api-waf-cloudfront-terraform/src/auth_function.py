@@ -1,7 +1,9 @@
 import boto3
+import hmac
 import logging
 import os
 import re
+import time
 
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -13,9 +15,23 @@ client = session.client(service_name="secretsmanager", region_name=region_name)
 
 verify_id_header_name = "x-origin-verify"
 
+# The secret is cached per container and refreshed after SECRET_CACHE_TTL_SECONDS.
+# While a rotation is propagating, CloudFront can still send the previous value,
+# so AWSPREVIOUS is accepted for SECRET_PREVIOUS_GRACE_SECONDS after the current
+# version was created. A header matching neither forces an early refresh, at most
+# once every SECRET_MIN_REFRESH_SECONDS.
+secret_cache_ttl_seconds = int(os.environ.get("SECRET_CACHE_TTL_SECONDS", 300))
+secret_previous_grace_seconds = int(os.environ.get("SECRET_PREVIOUS_GRACE_SECONDS", 900))
+secret_min_refresh_seconds = 5
+secret_cache = {}
+
+# Policies only depend on the route ARN, so they are built once per route
+policy_cache = {}
+policy_cache_max_size = 256
+
 
 def lambda_handler(event, context):
-    logger.info(f"event: {event}")
+    logger.info(f"routeArn: {event.get('routeArn')}")
     logger.info(f"context {context}")
 
     # Get headers from incoming event
@@ -26,17 +42,63 @@ def lambda_handler(event, context):
         logger.error("Invalid request - No x-origin-verify header")
         raise Exception("Unauthorized")
 
-    # Get secret from Secrets Manager
-    get_secret_value_response = client.get_secret_value(SecretId=secret_name)
-    logger.info(f"get_secret_value_response {get_secret_value_response}")
-    secret_string = get_secret_value_response["SecretString"]
-
     header_verify_id = headers[verify_id_header_name]
-    if secret_string != header_verify_id:
+    if not is_valid_verify_id(header_verify_id):
         logger.error("Invalid request - Invalid x-origin-verify header")
         raise Exception("Unauthorized")
 
-    tmp = event["routeArn"].split(":")
+    return get_policy(event["routeArn"])
+
+
+def is_valid_verify_id(header_verify_id):
+    """Checks the header against the cached current (and, during a rotation, previous) secret."""
+    secrets = get_secrets()
+    if matches_any(header_verify_id, secrets):
+        return True
+    # The secret may have been rotated since it was cached
+    if time.time() - secret_cache["fetched_at"] >= secret_min_refresh_seconds:
+        return matches_any(header_verify_id, get_secrets(force_refresh=True))
+    return False
+
+
+def matches_any(header_verify_id, secrets):
+    # Check every candidate so the comparison time does not depend on which one matched
+    matched = False
+    for secret in secrets:
+        matched |= hmac.compare_digest(secret.encode(), header_verify_id.encode())
+    return matched
+
+
+def get_secrets(force_refresh=False):
+    """Returns the secret values currently accepted, fetching them from Secrets Manager when stale."""
+    now = time.time()
+    if force_refresh or not secret_cache or now - secret_cache["fetched_at"] >= secret_cache_ttl_seconds:
+        current = client.get_secret_value(SecretId=secret_name, VersionStage="AWSCURRENT")
+        try:
+            previous = client.get_secret_value(SecretId=secret_name, VersionStage="AWSPREVIOUS")
+        except client.exceptions.ResourceNotFoundException:
+            # Not rotated yet
+            previous = None
+        secret_cache.update({
+            "current": current["SecretString"],
+            "current_created": current["CreatedDate"].timestamp(),
+            "previous": previous["SecretString"] if previous else None,
+            "fetched_at": now,
+        })
+        logger.info(f"Refreshed secret {secret_name} (version {current['VersionId']})")
+
+    secrets = [secret_cache["current"]]
+    if secret_cache["previous"] and now - secret_cache["current_created"] < secret_previous_grace_seconds:
+        secrets.append(secret_cache["previous"])
+    return secrets
+
+
+def get_policy(route_arn):
+    policy = policy_cache.get(route_arn)
+    if policy is not None:
+        return policy
+
+    tmp = route_arn.split(":")
     api_gateway_arn_tmp = tmp[5].split("/")
     region = tmp[3]
     aws_account_id = tmp[4]
@@ -50,6 +112,10 @@ def lambda_handler(event, context):
     policy.allow_method(HttpVerb.GET, "/*")
     # Finally, build the policy
     auth_response = policy.build()
+
+    if len(policy_cache) >= policy_cache_max_size:
+        policy_cache.clear()
+    policy_cache[route_arn] = auth_response
     return auth_response
 
 
@@ -79,9 +145,10 @@ class AuthPolicy(object):
     of objects and each object has 2 properties: A resource ARN and a nullable
     conditions statement.
     the build method processes these lists and generates the appropriate
-    statements for the final policy"""
-    allowMethods = []
-    denyMethods = []
+    statements for the final policy. They are created per instance in __init__
+    so that policies never share (and grow) lists across invocations."""
+    allowMethods = None
+    denyMethods = None
 
     restApiId = "<<restApiId>>"
     """ Replace the placeholder value with a default API Gateway API id to be used in the policy. 
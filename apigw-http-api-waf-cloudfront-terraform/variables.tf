@@ -23,6 +23,16 @@ variable "auth_function_name" {
   default = "http-auth-lambda"
 }
 
+variable "auth_secret_cache_ttl_seconds" {
+  type = number
+  default = 300
+}
+
+variable "auth_secret_previous_grace_seconds" {
+  type = number
+  default = 900
+}
+
 variable "edge_function_name" {
   type = string
   default = "http-edge-lambda"
@@ -4,6 +4,7 @@ import os
 import logging
 from botocore.exceptions import ClientError
 from supported_model_list import MODELS_WITH_STREAMING_SUPPORT
+from websocket_sender import CoalescingSender
 
 # initialize logger
 logger = logging.getLogger()
@@ -15,6 +16,9 @@ AWS_REGION = os.environ["AWS_REGION"]
 TABLE_NAME = os.environ["WEBSOCKETS_DDB_TABLE"]
 DEFAULT_MAX_TOKENS = 256
 DEFAULT_TEMPERATURE = 0
+# Coalescing of streamed text into WebSocket messages
+STREAM_FLUSH_MAX_CHARS = int(os.environ.get("STREAM_FLUSH_MAX_CHARS", 400))
+STREAM_FLUSH_INTERVAL_MS = int(os.environ.get("STREAM_FLUSH_INTERVAL_MS", 150))
 
 # global variables - avoid creating a new client for every request
 bedrock_client = None
@@ -76,18 +80,21 @@ def get_generated_text(modelId, response):
 
 
 def post_to_websockets(apig_management_client, connection_id, message, table):
+    """Post one message; returns False if the connection is gone (and removes it)."""
     try:
         apig_management_client.post_to_connection(
             Data=message, ConnectionId=connection_id
         )
-    except ClientError:
-        logger.exception("Couldn't post to connection %s.", connection_id)
     except apig_management_client.exceptions.GoneException:
         logger.info("Connection %s is gone, removing.", connection_id)
         try:
             table.delete_item(Key={"connection_id": connection_id})
         except ClientError:
             logger.exception("Couldn't remove connection %s.", connection_id)
+        return False
+    except ClientError:
+        logger.exception("Couldn't post to connection %s.", connection_id)
+    return True
 
 
 def call_llm(table, connection_id, apig_management_client, parameters, prompt):
@@ -122,25 +129,39 @@ def call_llm(table, connection_id, apig_management_client, parameters, prompt):
     stream = response.get('body')
     
     if stream:
-        for event in stream:
-            chunk = event.get('chunk')
-            if chunk:
-                chunk_obj = json.loads(chunk.get('bytes').decode())
-                # extract generated text based on model provider
-                generated_text = get_generated_text(modelId, chunk_obj)
-
-                if generated_text == None:
-                    error_msg = "Unsupported provider: " + modelId.split(".")[0]
-                    post_to_websockets(apig_management_client, connection_id, error_msg, table)
-                    status_code = 400
-                    return status_code
-
-                # send data to WebSockets
-                post_to_websockets(apig_management_client, connection_id, generated_text, table)
-
+        # coalesce generated text into fewer WebSocket messages, posted from a background thread
+        sender = CoalescingSender(
+            lambda message: post_to_websockets(apig_management_client, connection_id, message, table),
+            connection_id,
+            max_chars=STREAM_FLUSH_MAX_CHARS,
+            max_delay=STREAM_FLUSH_INTERVAL_MS / 1000
+        )
         # send a message to indicate end of LLM response
-        end_msg = "<End of LLM response>"
-        post_to_websockets(apig_management_client, connection_id, end_msg, table)
+        final_msg = "<End of LLM response>"
+        try:
+            for event in stream:
+                # stop reading from Bedrock as soon as the client disconnects
+                if sender.gone:
+                    logger.info("Connection %s is gone, stopping the model stream.", connection_id)
+                    stream.close()
+                    break
+
+                chunk = event.get('chunk')
+                if chunk:
+                    chunk_obj = json.loads(chunk.get('bytes').decode())
+                    # extract generated text based on model provider
+                    generated_text = get_generated_text(modelId, chunk_obj)
+
+                    if generated_text == None:
+                        final_msg = "Unsupported provider: " + modelId.split(".")[0]
+                        status_code = 400
+                        break
+
+                    # send data to WebSockets
+                    sender.send(generated_text)
+        finally:
+            sender.close(final_msg)
+            sender.log_metrics()
                 
     return status_code
 
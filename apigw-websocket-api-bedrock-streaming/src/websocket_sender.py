@@ -0,0 +1,152 @@
+import json
+import logging
+import threading
+import time
+
+# initialize logger
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+# Flush thresholds for coalesced WebSocket messages
+DEFAULT_MAX_CHARS = 400
+DEFAULT_MAX_DELAY_SECONDS = 0.15
+DEFAULT_MIN_SENTENCE_CHARS = 40
+SENTENCE_ENDINGS = (".", "!", "?", "\n")
+
+
+class CoalescingSender:
+    """
+    Buffers streamed LLM text and posts it to one WebSocket connection from a
+    background thread, so reading the Bedrock stream never waits on
+    post_to_connection.
+
+    Buffered text is flushed when it reaches max_chars, when the oldest
+    buffered text is max_delay seconds old, or when it ends a sentence and is
+    at least min_sentence_chars long. While a post is in flight new text keeps
+    accumulating, so slower posts carry larger messages, but no message is
+    longer than max_chars: the rest stays buffered for the next post, which
+    also keeps messages under API Gateway's WebSocket frame limit when posts
+    stall.
+    """
+
+    def __init__(self, post, connection_id, max_chars=DEFAULT_MAX_CHARS,
+                 max_delay=DEFAULT_MAX_DELAY_SECONDS, min_sentence_chars=DEFAULT_MIN_SENTENCE_CHARS):
+        # post(message) sends one message and returns False once the connection is gone
+        self._post = post
+        self.connection_id = connection_id
+        self.max_chars = max_chars
+        self.max_delay = max_delay
+        self.min_sentence_chars = min_sentence_chars
+
+        self._condition = threading.Condition()
+        self._buffer = []
+        self._buffered_chars = 0
+        self._buffered_since = None
+        self._final_message = None
+        self._closing = False
+        self._gone = threading.Event()
+
+        self.tokens_received = 0
+        self.chunks_sent = 0
+        self.chars_sent = 0
+        self.post_seconds = 0.0
+        self._started_at = time.monotonic()
+
+        self._thread = threading.Thread(target=self._run, name=f"ws-sender-{connection_id}", daemon=True)
+        self._thread.start()
+
+    @property
+    def gone(self):
+        """True once the client has disconnected; stop reading the model stream."""
+        return self._gone.is_set()
+
+    def send(self, text):
+        """Buffer one piece of generated text."""
+        with self._condition:
+            self.tokens_received += 1
+            if self.gone or not text:
+                return
+            if self._buffered_since is None:
+                self._buffered_since = time.monotonic()
+            self._buffer.append(text)
+            self._buffered_chars += len(text)
+            if self._ready():
+                self._condition.notify()
+
+    def close(self, final_message=None, timeout=10):
+        """Flush buffered text, post final_message after it and stop the sender thread."""
+        with self._condition:
+            self._final_message = final_message
+            self._closing = True
+            self._condition.notify()
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            logger.warning("WebSocket sender for %s did not finish within %ss.", self.connection_id, timeout)
+
+    def metrics(self):
+        """Per-connection counters, e.g. to compare model tokens with WebSocket posts."""
+        return {
+            "connectionId": self.connection_id,
+            "tokensReceived": self.tokens_received,
+            "chunksSent": self.chunks_sent,
+            "charsSent": self.chars_sent,
+            "tokensPerChunk": round(self.tokens_received / self.chunks_sent, 2) if self.chunks_sent else 0,
+            "postSeconds": round(self.post_seconds, 3),
+            "elapsedSeconds": round(time.monotonic() - self._started_at, 3),
+            "connectionGone": self.gone,
+        }
+
+    def log_metrics(self):
+        logger.info("WebSocket stream metrics: %s", json.dumps(self.metrics()))
+
+    def _ready(self):
+        """Whether the buffer should be flushed now (lock held)."""
+        if not self._buffer:
+            return False
+        if self._buffered_chars >= self.max_chars:
+            return True
+        if time.monotonic() - self._buffered_since >= self.max_delay:
+            return True
+        return self._buffered_chars >= self.min_sentence_chars and self._buffer[-1].rstrip(" ").endswith(SENTENCE_ENDINGS)
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not (self._closing or self._ready()):
+                    timeout = None
+                    if self._buffer:
+                        timeout = max(0.0, self._buffered_since + self.max_delay - time.monotonic())
+                    self._condition.wait(timeout)
+                text = "".join(self._buffer)
+                message, rest = text[:self.max_chars], text[self.max_chars:]
+                # The rest keeps its age, so it follows without waiting for max_delay
+                self._buffer = [rest] if rest else []
+                self._buffered_chars = len(rest)
+                if not rest:
+                    self._buffered_since = None
+                closing = self._closing
+                final_message = self._final_message
+
+            if message and not self._deliver(message):
+                return
+            if closing:
+                with self._condition:
+                    # Text buffered while the last flush was posting goes out first
+                    if self._buffer:
+                        continue
+                if final_message is not None:
+                    self._deliver(final_message)
+                return
+
+    def _deliver(self, message):
+        if self.gone:
+            return False
+        started = time.monotonic()
+        delivered = self._post(message)
+        self.post_seconds += time.monotonic() - started
+        if delivered is False:
+            self._gone.set()
+            return False
+        self.chunks_sent += 1
+        self.chars_sent += len(message)
+        return True
@@ -6,13 +6,22 @@ to consume the full agent response stream.
 Flow:
 1. Receives agent runtime ARN, channel, and event context
 2. Calls invoke_agent_runtime and consumes the SSE stream
-3. Publishes each chunk to the AppSync Events channel
+3. Publishes chunks to the AppSync Events channel from a background thread
 4. Publishes a completion event when the stream ends
+
+Text is published as soon as it starts arriving, then coalesced into one
+chunk per CHUNK_FLUSH_INTERVAL_MS (or per sentence), so time-to-first-token
+stays low without a POST per fragment. The stream is read with a deadline,
+so pending text is flushed on time even while the agent pauses (e.g. during
+a tool call).
 """
 
+import http.client
 import json
 import os
-import urllib.request
+import queue
+import threading
+import time
 
 import boto3
 from aws_lambda_powertools import Logger, Tracer
@@ -25,32 +34,150 @@ agentcore_client = boto3.client("bedrock-agentcore")
 APPSYNC_HTTP_ENDPOINT = os.environ["APPSYNC_HTTP_ENDPOINT"]
 APPSYNC_API_KEY = os.environ["APPSYNC_API_KEY"]
 AGENT_RUNTIME_ARN = os.environ["AGENT_RUNTIME_ARN"]
+# Streamed text is published at most this often (plus at sentence ends)
+CHUNK_FLUSH_INTERVAL_SECONDS = int(os.environ.get("CHUNK_FLUSH_INTERVAL_MS", "100")) / 1000
+# AppSync Events accepts up to 5 events per publish request
+MAX_EVENTS_PER_PUBLISH = 5
+PUBLISH_TIMEOUT_SECONDS = 10
 
 
-def _publish_to_channel(channel: str, event: dict):
-    """Publish an event to an AppSync Events channel via HTTP."""
-    url = f"https://{APPSYNC_HTTP_ENDPOINT}/event"
-    body = json.dumps(
-        {
-            "channel": channel,
-            "events": [json.dumps(event)],
-        }
-    ).encode()
+class _EventsPublisher:
+    """Publishes events to AppSync Events from a background thread.
+
+    Events are queued by the relay loop and posted over one keep-alive
+    HTTPS connection, so reading the SSE stream never waits on a POST.
+    Events queued while a POST is in flight go out together in the next
+    request (up to MAX_EVENTS_PER_PUBLISH per channel). The connection is
+    reused across invocations of a warm container.
+    """
+
+    def __init__(self, host: str, api_key: str):
+        self._host = host
+        self._api_key = api_key
+        self._queue: queue.Queue = queue.Queue()
+        self._connection: http.client.HTTPSConnection | None = None
+        self.requests_sent = 0
+        self._thread = threading.Thread(target=self._run, name="appsync-events-publisher", daemon=True)
+        self._thread.start()
+
+    def publish(self, channel: str, event: dict):
+        """Queue an event; events are delivered in the order they are queued."""
+        self._queue.put((channel, event))
+
+    def flush(self):
+        """Block until every queued event has been published (or has failed)."""
+        self._queue.join()
 
-    req = urllib.request.Request(
-        url,
-        data=body,
-        method="POST",
-        headers={
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            # Take whatever else is already queued for the same channel
+            while len(batch) < MAX_EVENTS_PER_PUBLISH:
+                try:
+                    pending = self._queue.queue[0]
+                except IndexError:
+                    break
+                if pending[0] != batch[0][0]:
+                    break
+                batch.append(self._queue.get_nowait())
+            try:
+                self._post(batch[0][0], [event for _, event in batch])
+            except Exception:  # pylint: disable=broad-exception-caught
+                # The thread must survive, or flush() would block until the Lambda times out
+                logger.exception("Unexpected error publishing to %s", batch[0][0])
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _post(self, channel: str, events: list[dict]):
+        body = json.dumps(
+            {
+                "channel": channel,
+                "events": [json.dumps(event) for event in events],
+            }
+        ).encode()
+        headers = {
             "Content-Type": "application/json",
-            "x-api-key": APPSYNC_API_KEY,
-        },
-    )
-    try:
-        with urllib.request.urlopen(req) as resp:
-            logger.debug("Published to %s: %s", channel, resp.status)
-    except Exception:
-        logger.exception("Failed to publish to %s", channel)
+            "x-api-key": self._api_key,
+        }
+        # One retry on a fresh connection: the pooled one may have been closed while idle
+        for attempt in range(2):
+            try:
+                if self._connection is None:
+                    self._connection = http.client.HTTPSConnection(self._host, timeout=PUBLISH_TIMEOUT_SECONDS)
+                self._connection.request("POST", "/event", body=body, headers=headers)
+                resp = self._connection.getresponse()
+                resp.read()
+                self.requests_sent += 1
+                if resp.status >= 300:
+                    logger.error("Failed to publish to %s: HTTP %s", channel, resp.status)
+                else:
+                    logger.debug("Published %d events to %s: %s", len(events), channel, resp.status)
+                return
+            except (http.client.HTTPException, OSError):
+                self._close_connection()
+                if attempt:
+                    logger.exception("Failed to publish to %s", channel)
+
+    def _close_connection(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+_publisher: _EventsPublisher | None = None
+
+
+def _get_publisher() -> _EventsPublisher:
+    global _publisher  # pylint: disable=global-statement
+    if _publisher is None:
+        _publisher = _EventsPublisher(APPSYNC_HTTP_ENDPOINT, APPSYNC_API_KEY)
+    return _publisher
+
+
+def _publish_to_channel(channel: str, event: dict):
+    """Queue an event for publishing to an AppSync Events channel."""
+    _get_publisher().publish(channel, event)
+
+
+def _flush_published():
+    """Wait until every queued event has been sent to AppSync Events."""
+    if _publisher is not None:
+        _publisher.flush()
+
+
+_END_OF_STREAM = object()
+
+
+def _iter_lines_with_deadline(body, timeout):
+    """Yield the lines of an SSE body, or None whenever timeout() seconds pass without one.
+
+    The body is read on a background thread so the caller can act on time
+    (flush pending text) while the stream is idle. timeout() is consulted
+    before every wait; None means wait for the next line indefinitely.
+    """
+    lines: queue.Queue = queue.Queue()
+
+    def read():
+        try:
+            for line in body.iter_lines(chunk_size=1024):
+                lines.put(line)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            lines.put(exc)
+        lines.put(_END_OF_STREAM)
+
+    threading.Thread(target=read, name="agentcore-sse-reader", daemon=True).start()
+    while True:
+        try:
+            item = lines.get(timeout=timeout())
+        except queue.Empty:
+            yield None
+            continue
+        if item is _END_OF_STREAM:
+            return
+        if isinstance(item, Exception):
+            raise item
+        yield item
 
 
 @logger.inject_lambda_context
@@ -84,12 +211,37 @@ def handler(event: dict, context) -> dict:
 
     content_type = response.get("contentType", "")
     sequence = 0
-    full_response = ""
-    current_chunk = ""
+    response_parts: list[str] = []
+    chunk_parts: list[str] = []
+    last_flush = 0.0
+
+    def publish_chunk():
+        nonlocal sequence, last_flush
+        _publish_to_channel(
+            channel,
+            {
+                "type": "chunk",
+                "sequence": sequence,
+                "content": "".join(chunk_parts),
+                "eventId": event_id,
+            },
+        )
+        sequence += 1
+        chunk_parts.clear()
+        last_flush = time.monotonic()
+
+    def flush_due_in():
+        if not chunk_parts:
+            return None
+        return max(0.0, last_flush + CHUNK_FLUSH_INTERVAL_SECONDS - time.monotonic())
 
     if "text/event-stream" in content_type:
         # Streaming SSE response — consume line by line
-        for line in response["response"].iter_lines(chunk_size=1024):
+        for line in _iter_lines_with_deadline(response["response"], flush_due_in):
+            if line is None:
+                # Flush interval passed with no new line: publish what is pending
+                publish_chunk()
+                continue
             if not line:
                 continue
             decoded = line.decode("utf-8")
@@ -101,8 +253,8 @@ def handler(event: dict, context) -> dict:
                 data = json.loads(data_str)
             except json.JSONDecodeError:
                 # Raw text chunk
-                current_chunk += data_str
-                full_response += data_str
+                chunk_parts.append(data_str)
+                response_parts.append(data_str)
                 continue
 
             # Skip non-dict events (shouldn't happen but be safe)
@@ -127,21 +279,14 @@ def handler(event: dict, context) -> dict:
             # Strands streams text tokens in the "data" key
             text = data.get("data", "")
             if isinstance(text, str) and text:
-                current_chunk += text
-                full_response += text
-
-                if len(current_chunk) >= 50 or text.endswith((".", "!", "?", "\n")):
-                    _publish_to_channel(
-                        channel,
-                        {
-                            "type": "chunk",
-                            "sequence": sequence,
-                            "content": current_chunk,
-                            "eventId": event_id,
-                        },
-                    )
-                    sequence += 1
-                    current_chunk = ""
+                chunk_parts.append(text)
+                response_parts.append(text)
+
+                # First text goes out immediately; after that at most once per
+                # interval, or at a sentence end (where the agent may pause for a tool)
+                if sequence == 0 or time.monotonic() - last_flush >= CHUNK_FLUSH_INTERVAL_SECONDS or text.endswith((".", "!", "?", "\n")):
+                    publish_chunk()
+        full_response = "".join(response_parts)
     else:
         # Non-streaming JSON response
         raw = response["response"].read().decode("utf-8")
@@ -157,11 +302,12 @@ def handler(event: dict, context) -> dict:
         {
             "type": "complete",
             "sequence": sequence,
-            "content": current_chunk,
+            "content": "".join(chunk_parts),
             "response": full_response,
             "eventId": event_id,
         },
     )
+    _flush_published()
 
     logger.info(
         "Stream relay complete",
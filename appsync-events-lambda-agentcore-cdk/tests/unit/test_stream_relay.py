@@ -1,6 +1,8 @@
 """Unit tests for the stream relay Lambda handler."""
 
 import json
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 from functions.stream_relay.index import handler
@@ -125,3 +127,81 @@ def test_chunk_batching_on_punctuation(mock_ac, mock_publish, lambda_context):
     chunk_publishes = [c[0][1] for c in mock_publish.call_args_list if c[0][1]["type"] == "chunk"]
     assert len(chunk_publishes) >= 1
     assert chunk_publishes[0]["content"] == "Short."
+
+
+@patch("functions.stream_relay.index._publish_to_channel")
+@patch("functions.stream_relay.index.agentcore_client")
+def test_fragments_coalesce_between_flush_intervals(mock_ac, mock_publish, lambda_context):
+    """The first fragment is published immediately; later ones wait for the flush interval."""
+    mock_ac.invoke_agent_runtime.return_value = _mock_sse_response([f'data: {{"data": "w{i} "}}' for i in range(20)])
+
+    with patch("functions.stream_relay.index.CHUNK_FLUSH_INTERVAL_SECONDS", 60):
+        result = handler(_make_event(), lambda_context)
+
+    published = [c[0][1] for c in mock_publish.call_args_list]
+    assert [p["type"] for p in published] == ["chunk", "complete"]
+    assert published[0]["content"] == "w0 "
+    assert published[1]["content"] == "".join(f"w{i} " for i in range(1, 20))
+    assert result["chunks_sent"] == 2
+
+
+@patch("functions.stream_relay.index._publish_to_channel")
+@patch("functions.stream_relay.index.agentcore_client")
+def test_pending_text_flushes_on_timer_while_stream_is_idle(mock_ac, mock_publish, lambda_context):
+    """Text without sentence punctuation is published once the interval passes, even if no token follows."""
+
+    def lines():
+        yield b'data: {"data": "w0 "}'
+        yield b'data: {"data": "w1 "}'
+        time.sleep(0.3)  # agent pauses, e.g. for a tool call
+        yield b'data: {"data": "w2."}'
+
+    stream = MagicMock()
+    stream.iter_lines.return_value = lines()
+    mock_ac.invoke_agent_runtime.return_value = {"contentType": "text/event-stream", "response": stream}
+
+    with patch("functions.stream_relay.index.CHUNK_FLUSH_INTERVAL_SECONDS", 0.05):
+        handler(_make_event(), lambda_context)
+
+    chunks = [c[0][1]["content"] for c in mock_publish.call_args_list if c[0][1]["type"] == "chunk"]
+    assert chunks == ["w0 ", "w1 ", "w2."]
+
+
+@patch("functions.stream_relay.index.http.client.HTTPSConnection")
+def test_publisher_survives_unexpected_post_errors(mock_connection_cls):
+    """An unexpected exception in a POST is logged; later events are still published and flush() returns."""
+    from functions.stream_relay.index import _EventsPublisher
+
+    connection = mock_connection_cls.return_value
+    connection.getresponse.return_value.status = 200
+    connection.request.side_effect = [ValueError("boom"), None]
+    publisher = _EventsPublisher("test.appsync-api.example.com", "key")
+    publisher.publish("/responses/chat/c1", {"sequence": 0})
+    publisher.flush()
+    publisher.publish("/responses/chat/c1", {"sequence": 1})
+    publisher.flush()
+
+    assert connection.request.call_count == 2
+    assert publisher.requests_sent == 1
+
+
+@patch("functions.stream_relay.index.http.client.HTTPSConnection")
+def test_publisher_batches_queued_events_on_one_connection(mock_connection_cls):
+    """Events queued while a POST is in flight share one request on a reused connection."""
+    from functions.stream_relay.index import _EventsPublisher
+
+    connection = mock_connection_cls.return_value
+    connection.getresponse.return_value.status = 200
+    with patch("functions.stream_relay.index.threading.Thread"):
+        publisher = _EventsPublisher("test.appsync-api.example.com", "key")
+    # Queue everything before the worker starts, as if a POST were in flight
+    for i in range(7):
+        publisher.publish("/responses/chat/c1", {"sequence": i})
+    threading.Thread(target=publisher._run, daemon=True).start()
+    publisher.flush()
+
+    mock_connection_cls.assert_called_once()
+    bodies = [json.loads(c.kwargs["body"]) for c in connection.request.call_args_list]
+    assert [len(b["events"]) for b in bodies] == [5, 2]
+    assert [json.loads(e)["sequence"] for b in bodies for e in b["events"]] == list(range(7))
+    assert publisher.requests_sent == 2
@@ -29,6 +29,9 @@ PRIVATE_KEY_SECRET_ARN = os.environ.get('PRIVATE_KEY_SECRET_ARN', '')
 CLOUDFRONT_DOMAIN = os.environ.get('CLOUDFRONT_DOMAIN', '')
 KEY_PAIR_ID = os.environ.get('KEY_PAIR_ID', '')
 COOKIE_TTL_SECONDS = int(os.environ.get('COOKIE_TTL_SECONDS', '600'))
+# Cookie expiry is rounded up to a multiple of this, so logins within the same
+# bucket share one policy and signature (cookies may outlive the TTL by up to this)
+COOKIE_EXPIRY_BUCKET_SECONDS = int(os.environ.get('COOKIE_EXPIRY_BUCKET_SECONDS', '60'))
 COOKIE_DOMAIN = os.environ.get('COOKIE_DOMAIN', '')
 COOKIE_SAME_SITE = os.environ.get('COOKIE_SAME_SITE', 'None')
 COGNITO_REGION = os.environ.get('COGNITO_REGION', os.environ.get('AWS_REGION', ''))
@@ -36,6 +39,8 @@ COGNITO_REGION = os.environ.get('COGNITO_REGION', os.environ.get('AWS_REGION', '
 # Cache for the private key
 _private_key_cache: Dict[str, Any] = {}
 _jwks_cache: Dict[str, Any] = {}
+# Signed cookies by (resource, expires_epoch)
+_signed_cookies_cache: Dict[Tuple[str, int], Tuple[str, str, str]] = {}
 
 
 def get_private_key():
@@ -91,20 +96,40 @@ def sign_policy(policy_json: str, private_key) -> str:
     return cloudfront_safe_base64(signature)
 
 
+def quantize_expiry(now: int) -> int:
+    """Round the cookie expiry up to the next expiry bucket boundary."""
+    expires_epoch = now + COOKIE_TTL_SECONDS
+    if COOKIE_EXPIRY_BUCKET_SECONDS <= 1:
+        return expires_epoch
+    return -(-expires_epoch // COOKIE_EXPIRY_BUCKET_SECONDS) * COOKIE_EXPIRY_BUCKET_SECONDS
+
+
 def create_signed_cookies(resource: str, expires_epoch: int) -> Tuple[str, str, str]:
-    """Create the three CloudFront signed cookies."""
+    """Create the three CloudFront signed cookies, reusing the signature for a known resource and expiry."""
+    cache_key = (resource, expires_epoch)
+    cookies = _signed_cookies_cache.get(cache_key)
+    if cookies:
+        return cookies
+
     private_key = get_private_key()
     
     policy_json = create_custom_policy(resource, expires_epoch)
     policy_b64 = cloudfront_safe_base64(policy_json.encode("utf-8"))
     signature = sign_policy(policy_json, private_key)
     
-    return (
+    cookies = (
         f"CloudFront-Policy={policy_b64}",
         f"CloudFront-Signature={signature}",
         f"CloudFront-Key-Pair-Id={KEY_PAIR_ID}",
     )
 
+    # Drop signatures whose bucket has passed, they can no longer be reused
+    now = int(time.time())
+    for key in [key for key in _signed_cookies_cache if key[1] < now + COOKIE_TTL_SECONDS]:
+        del _signed_cookies_cache[key]
+    _signed_cookies_cache[cache_key] = cookies
+    return cookies
+
 
 def get_cors_headers() -> Dict[str, str]:
     """Return CORS headers based on configuration."""
@@ -207,7 +232,7 @@ def log_in_user(email: str, password: str) -> Dict[str, Any]:
         if CLOUDFRONT_DOMAIN and KEY_PAIR_ID and PRIVATE_KEY_SECRET_ARN:
             try:
                 current_time = int(time.time())
-                cf_expires_epoch = current_time + COOKIE_TTL_SECONDS
+                cf_expires_epoch = quantize_expiry(current_time)
                 resource = f"https://{CLOUDFRONT_DOMAIN}/private/*"
                 
                 policy_cookie, signature_cookie, key_pair_cookie = create_signed_cookies(
@@ -217,7 +242,7 @@ def log_in_user(email: str, password: str) -> Dict[str, Any]:
                 # Build cookie attributes
                 cf_cookie_settings = (
                     f"{get_cookie_settings(is_cloudfront=True)}; "
-                    f"Max-Age={COOKIE_TTL_SECONDS}"
+                    f"Max-Age={cf_expires_epoch - current_time}"
                 )
                 
                 cf_cookies = [
@@ -392,4 +417,25 @@ def get_jwks() -> Dict[str, Any]:
         return _jwks_cache
     except Exception as e:
         logger.error("Failed to fetch JWKS", extra={"error": str(e), "jwks_url": jwks_url})
-        raise
\ No newline at end of file
+        raise
+
+
+def preload() -> None:
+    """
+    Load the signing key and Cognito JWKS during init, so they are already in
+    memory for the first login (and captured by SnapStart or provisioned
+    concurrency). Failures are logged and retried lazily on the first request.
+    """
+    if CLOUDFRONT_DOMAIN and KEY_PAIR_ID and PRIVATE_KEY_SECRET_ARN:
+        try:
+            get_private_key()
+        except Exception:
+            logger.warning("Private key preload failed; it will be loaded on first use")
+    if COGNITO_REGION:
+        try:
+            get_jwks()
+        except Exception:
+            logger.warning("JWKS preload failed; it will be loaded on first use")
+
+
+preload()
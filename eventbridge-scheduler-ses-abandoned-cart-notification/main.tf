@@ -208,6 +208,8 @@ resource "aws_iam_role_policy" "processor_dynamodb" {
         "dynamodb:Scan",
         "dynamodb:Query",
         "dynamodb:GetItem",
+        "dynamodb:PutItem",
+        "dynamodb:DeleteItem",
         "dynamodb:UpdateItem"
       ]
       Resource = [
@@ -224,12 +226,20 @@ resource "aws_iam_role_policy" "processor_ses" {
 
   policy = jsonencode({
     Version = "2012-10-17"
-    Statement = [{
-      Sid      = "SendEmail"
-      Effect   = "Allow"
-      Action   = "ses:SendEmail"
-      Resource = var.ses_identity_arn
-    }]
+    Statement = [
+      {
+        Sid      = "SendEmail"
+        Effect   = "Allow"
+        Action   = "ses:SendEmail"
+        Resource = var.ses_identity_arn
+      },
+      {
+        Sid      = "ReadSendQuota"
+        Effect   = "Allow"
+        Action   = "ses:GetSendQuota"
+        Resource = "*"
+      }
+    ]
   })
 }
 
@@ -249,7 +259,7 @@ resource "aws_lambda_function" "processor" {
   role             = aws_iam_role.processor_role.arn
   handler          = "notification_processor.lambda_handler"
   runtime          = "python3.14"
-  timeout          = 60
+  timeout          = 900
   memory_size      = 256
   filename         = data.archive_file.processor_zip.output_path
   source_code_hash = data.archive_file.processor_zip.output_base64sha256
@@ -260,6 +270,7 @@ resource "aws_lambda_function" "processor" {
       SES_IDENTITY_ARN = var.ses_identity_arn
       SENDER_EMAIL     = var.sender_email
       PREFIX           = var.prefix
+      SEND_CONCURRENCY = "10"
     }
   }
 
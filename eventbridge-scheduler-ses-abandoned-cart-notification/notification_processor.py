@@ -2,81 +2,168 @@ import boto3
 import json
 import os
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 
+from boto3.dynamodb.types import TypeSerializer
+from botocore.config import Config
+from botocore.exceptions import ClientError
+
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
 
-dynamodb = boto3.resource("dynamodb")
-ses = boto3.client("ses")
-
 TABLE_NAME = os.environ["DYNAMODB_TABLE"]
 SENDER_EMAIL = os.environ["SENDER_EMAIL"]
 
+# Emails sent concurrently; the token bucket keeps them under the SES send rate
+SEND_CONCURRENCY = int(os.environ.get("SEND_CONCURRENCY", "10"))
+# Overrides the account's SES MaxSendRate (emails per second) when set
+SES_MAX_SEND_RATE = float(os.environ.get("SES_MAX_SEND_RATE", "0"))
+# Carts read from the GSI per query page (before the NotificationSent filter)
+QUERY_PAGE_SIZE = int(os.environ.get("QUERY_PAGE_SIZE", "200"))
+# NotificationSent updates written per TransactWriteItems call
+UPDATE_BATCH_SIZE = 25
+# Time kept in reserve after the last page, on top of the time a page needs
+SAFETY_MARGIN_SECONDS = 15
+
+# Item (outside the GSI) holding the GSI LastEvaluatedKey of an unfinished run
+CHECKPOINT_ID = "#checkpoint#notification-processor"
+
+dynamodb = boto3.resource("dynamodb")
+ses = boto3.client(
+    "ses",
+    config=Config(max_pool_connections=SEND_CONCURRENCY, retries={"mode": "standard"}),
+)
+
 table = dynamodb.Table(TABLE_NAME)
+serializer = TypeSerializer()
 
 
 def lambda_handler(event, context):
     """
     Notification Processor — invoked hourly by EventBridge Scheduler.
 
-    1. Queries the DynamoDB GSI for records where CartAbandoned = "true"
-    2. Filters for NotificationSent = "false"
-    3. Sends a personalised abandoned-cart email via SES
-    4. Marks NotificationSent = "true" so the customer is not emailed again
+    1. Queries the DynamoDB GSI page by page for records where
+       CartAbandoned = "true" and NotificationSent is not "true"
+    2. Sends a personalised abandoned-cart email via SES, concurrently,
+       within the account's SES send rate
+    3. Marks NotificationSent = "true" (in batches) so the customer is
+       not emailed again
+    4. Checkpoints the query position after each page, so a run that is
+       about to time out stops cleanly and the next run resumes there
     """
     logger.info("Received event: %s", json.dumps(event))
     invoked_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-    # ── 1. Query the GSI for all abandoned carts ──
-    abandoned = _get_abandoned_carts()
-    logger.info("Found %d abandoned cart(s) needing notification", len(abandoned))
+    send_rate = _get_send_rate()
+    limiter = TokenBucket(send_rate)
+    # Stop starting new pages once the remaining time cannot cover one
+    reserve_ms = (QUERY_PAGE_SIZE / send_rate + SAFETY_MARGIN_SECONDS) * 1000
 
-    if not abandoned:
-        return _response(invoked_at, sent=0, skipped=0, errors=0)
+    start_key = _load_checkpoint()
+    if start_key:
+        logger.info("Resuming from checkpoint %s", json.dumps(start_key))
 
     sent = 0
     skipped = 0
     errors = 0
-
-    for record in abandoned:
-        customer_id = record.get("CustomerId", "unknown")
-        email = record.get("Email", "")
-        name = record.get("CustomerName", "Customer")
-        notification_sent = record.get("NotificationSent", "false")
-
-        # ── 2. Skip if already notified ──
-        if notification_sent == "true":
-            logger.info("Skipping %s — already notified", customer_id)
-            skipped += 1
-            continue
-
-        # ── 3. Skip if no email address ──
-        if not email:
-            logger.warning("Skipping %s — no email address", customer_id)
-            skipped += 1
-            continue
-
-        # ── 4. Build and send the email ──
-        try:
-            cart_items = _format_cart_items(record.get("CartItems", []))
-            cart_total = record.get("CartTotal", "0.00")
-            abandoned_at = record.get("CartAbandonedAt", "recently")
-
-            _send_email(email, name, cart_items, cart_total, abandoned_at)
-            logger.info("Sent notification to %s (%s)", customer_id, email)
-
-            # ── 5. Mark as notified ──
-            _mark_notified(customer_id, invoked_at)
-            sent += 1
-
-        except Exception as e:
-            logger.error(
-                "Failed to notify %s (%s): %s", customer_id, email, str(e)
-            )
-            errors += 1
-
-    return _response(invoked_at, sent=sent, skipped=skipped, errors=errors)
+    complete = True
+
+    with ThreadPoolExecutor(max_workers=SEND_CONCURRENCY) as executor:
+        for records, already_notified, last_key in _abandoned_cart_pages(start_key):
+            # ── 1. Already notified carts were filtered out by DynamoDB ──
+            skipped += already_notified
+
+            # ── 2. Skip if no email address ──
+            eligible = []
+            for record in records:
+                if not record.get("Email", ""):
+                    logger.warning("Skipping %s — no email address", record.get("CustomerId", "unknown"))
+                    skipped += 1
+                else:
+                    eligible.append(record)
+
+            # ── 3. Send the emails ──
+            outcomes = executor.map(lambda record: _notify(record, limiter), eligible)
+            notified = [record["CustomerId"] for record, ok in zip(eligible, outcomes) if ok]
+            errors += len(eligible) - len(notified)
+
+            # ── 4. Mark as notified ──
+            failed_updates = _mark_notified_batch(notified, invoked_at)
+            sent += len(notified) - failed_updates
+            errors += failed_updates
+
+            if not last_key:
+                break
+            # ── 5. Checkpoint, and stop before the Lambda timeout ──
+            _save_checkpoint(last_key)
+            if context and context.get_remaining_time_in_millis() < reserve_ms:
+                logger.info("Stopping before the timeout; the next run resumes from the checkpoint")
+                complete = False
+                break
+
+    if complete:
+        _clear_checkpoint()
+
+    return _response(invoked_at, sent=sent, skipped=skipped, errors=errors, complete=complete)
+
+
+def _notify(record: dict, limiter: "TokenBucket") -> bool:
+    """Build and send one email (worker thread); returns False on failure."""
+    customer_id = record.get("CustomerId", "unknown")
+    email = record["Email"]
+    name = record.get("CustomerName", "Customer")
+    try:
+        cart_items = _format_cart_items(record.get("CartItems", []))
+        cart_total = record.get("CartTotal", "0.00")
+        abandoned_at = record.get("CartAbandonedAt", "recently")
+
+        limiter.acquire()
+        _send_email(email, name, cart_items, cart_total, abandoned_at)
+        logger.info("Sent notification to %s (%s)", customer_id, email)
+        return True
+
+    except Exception as e:
+        logger.error(
+            "Failed to notify %s (%s): %s", customer_id, email, str(e)
+        )
+        return False
+
+
+class TokenBucket:
+    """Thread-safe token bucket: acquire() blocks until a send is allowed."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def _get_send_rate() -> float:
+    """SES emails per second allowed for the account (SES_MAX_SEND_RATE overrides)."""
+    if SES_MAX_SEND_RATE > 0:
+        return SES_MAX_SEND_RATE
+    try:
+        return max(1.0, float(ses.get_send_quota()["MaxSendRate"]))
+    except ClientError as e:
+        logger.warning("Could not read the SES send quota, assuming 1/s: %s", str(e))
+        return 1.0
 
 
 # ──────────────────────────────────────────
@@ -84,33 +171,72 @@ def lambda_handler(event, context):
 # ──────────────────────────────────────────
 
 
-def _get_abandoned_carts() -> list:
+def _abandoned_cart_pages(start_key: dict = None):
     """
-    Query the GSI for all records with CartAbandoned = 'true'.
-    The GSI returns all abandoned carts; we filter NotificationSent
-    in application code for flexibility.
+    Query the GSI for records with CartAbandoned = 'true', one page at a time.
+    NotificationSent is filtered by DynamoDB, so only carts that still need
+    an email are returned. Yields (items, filtered_out_count, last_key).
     """
-    items = []
-    last_key = None
+    last_key = start_key
 
     while True:
         query_params = {
             "IndexName": "CartAbandonedIndex",
             "KeyConditionExpression": "CartAbandoned = :abandoned",
-            "ExpressionAttributeValues": {":abandoned": "true"},
+            "FilterExpression": "attribute_not_exists(NotificationSent) OR NotificationSent <> :sent",
+            "ExpressionAttributeValues": {":abandoned": "true", ":sent": "true"},
+            "Limit": QUERY_PAGE_SIZE,
         }
 
         if last_key:
             query_params["ExclusiveStartKey"] = last_key
 
         response = table.query(**query_params)
-        items.extend(response.get("Items", []))
-
+        items = response.get("Items", [])
         last_key = response.get("LastEvaluatedKey")
+        yield items, response.get("ScannedCount", len(items)) - len(items), last_key
+
         if not last_key:
             break
 
-    return items
+
+def _mark_notified_batch(customer_ids: list, notified_at: str) -> int:
+    """
+    Mark records as notified, UPDATE_BATCH_SIZE per TransactWriteItems call.
+    BatchWriteItem cannot update, and putting whole items back could
+    overwrite concurrent cart changes. Returns the number of records that
+    could not be updated.
+    """
+    failed = 0
+    for start in range(0, len(customer_ids), UPDATE_BATCH_SIZE):
+        chunk = customer_ids[start:start + UPDATE_BATCH_SIZE]
+        try:
+            table.meta.client.transact_write_items(
+                TransactItems=[
+                    {
+                        "Update": {
+                            "TableName": TABLE_NAME,
+                            "Key": {"CustomerId": serializer.serialize(customer_id)},
+                            "UpdateExpression": "SET NotificationSent = :sent, NotifiedAt = :ts",
+                            "ExpressionAttributeValues": {
+                                ":sent": serializer.serialize("true"),
+                                ":ts": serializer.serialize(notified_at),
+                            },
+                        }
+                    }
+                    for customer_id in chunk
+                ]
+            )
+        except ClientError as e:
+            # A conflicting write cancels the whole transaction; update one by one
+            logger.warning("Batch update failed (%s), retrying individually", str(e))
+            for customer_id in chunk:
+                try:
+                    _mark_notified(customer_id, notified_at)
+                except ClientError as e:
+                    logger.error("Failed to mark %s as notified: %s", customer_id, str(e))
+                    failed += 1
+    return failed
 
 
 def _mark_notified(customer_id: str, notified_at: str) -> None:
@@ -127,6 +253,25 @@ def _mark_notified(customer_id: str, notified_at: str) -> None:
     )
 
 
+def _load_checkpoint() -> dict:
+    item = table.get_item(Key={"CustomerId": CHECKPOINT_ID}, ConsistentRead=True).get("Item")
+    return json.loads(item["LastEvaluatedKey"]) if item else None
+
+
+def _save_checkpoint(last_key: dict) -> None:
+    table.put_item(
+        Item={
+            "CustomerId": CHECKPOINT_ID,
+            "LastEvaluatedKey": json.dumps(last_key),
+            "UpdatedAt": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        }
+    )
+
+
+def _clear_checkpoint() -> None:
+    table.delete_item(Key={"CustomerId": CHECKPOINT_ID})
+
+
 # ──────────────────────────────────────────
 # SES helpers
 # ──────────────────────────────────────────
@@ -248,13 +393,14 @@ def _format_cart_items(cart_items: list) -> str:
 # ──────────────────────────────────────────
 
 
-def _response(invoked_at: str, sent: int, skipped: int, errors: int) -> dict:
+def _response(invoked_at: str, sent: int, skipped: int, errors: int, complete: bool = True) -> dict:
     """Build a structured Lambda response."""
     summary = {
         "invokedAt": invoked_at,
         "notificationsSent": sent,
         "skipped": skipped,
         "errors": errors,
+        "complete": complete,
     }
     logger.info("Execution summary: %s", json.dumps(summary))
     return {"statusCode": 200, "body": json.dumps(summary)}
\ No newline at end of file
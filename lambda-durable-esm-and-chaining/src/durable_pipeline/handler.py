@@ -2,93 +2,65 @@ import json
 import os
 import boto3
 from datetime import datetime
+from decimal import Decimal
 from typing import Dict, Any, List
 from aws_durable_execution_sdk_python import DurableContext, durable_execution
+from aws_durable_execution_sdk_python.config import CompletionConfig, MapConfig
 
 # Initialize AWS clients
 dynamodb = boto3.resource('dynamodb')
 lambda_client = boto3.client('lambda')
 
+# Processing modes (PROCESSING_MODE):
+#   sequential - records run one after another (default)
+#   parallel   - records fan out through context.map, MAX_CONCURRENCY at a time
+# Storage modes (STORAGE_MODE, parallel only):
+#   per_record - each record invokes the storage function (default)
+#   batch      - one durable step writes the whole batch with batch_writer
+DEFAULT_MAX_CONCURRENCY = 5
+
+
 @durable_execution
 def lambda_handler(event: Dict[str, Any], context: DurableContext) -> Dict[str, Any]:
     """
     Main durable pipeline function that processes SQS events directly via ESM.
     Demonstrates lambda invoke chaining with checkpointing and recovery.
     Limited to 15 minutes total execution time due to ESM constraints.
+    Failed records are returned as batchItemFailures so only they are redriven.
     """
-    
+
     # Extract configuration from environment
-    validation_function_arn = os.environ['VALIDATION_FUNCTION_ARN']
-    transformation_function_arn = os.environ['TRANSFORMATION_FUNCTION_ARN']
-    storage_function_arn = os.environ['STORAGE_FUNCTION_ARN']
-    processed_data_table = os.environ['PROCESSED_DATA_TABLE']
-    environment = os.environ.get('ENVIRONMENT', 'dev')
-    
-    print(f"Processing SQS batch with {len(event.get('Records', []))} records")
-    
-    # Process each SQS record in the batch
-    batch_results = []
-    
-    for record in event.get('Records', []):
-        try:
-            # Extract data from SQS record
-            message_id = record['messageId']
-            data = json.loads(record['body'])
-            execution_name = f"{environment}-esm-{message_id}"
-            
-            print(f"Processing record: {message_id}")
-            
-            # Step 1: Validate data by invoking validation function
-            validation_result = context.invoke(
-                validation_function_arn,
-                {'data': data, 'execution_id': execution_name},
-                name=f'validate-data-{message_id}'
-            )
-            
-            if not validation_result.get('is_valid', False):
-                batch_results.append({
-                    'message_id': message_id,
-                    'status': 'failed',
-                    'reason': 'validation_failed'
-                })
-                continue
-            
-            # Step 2: Transform data by invoking transformation function
-            transformation_result = context.invoke(
-                transformation_function_arn,
-                {'data': data, 'execution_id': execution_name},
-                name=f'transform-data-{message_id}'
-            )
-            
-            # Step 3: Store processed data by invoking storage function
-            storage_result = context.invoke(
-                storage_function_arn,
-                {
-                    'transformed_data': transformation_result,
-                    'execution_id': execution_name,
-                    'original_data': data
-                },
-                name=f'store-data-{message_id}'
-            )
-            
-            batch_results.append({
-                'message_id': message_id,
-                'status': 'completed',
-                'execution_id': execution_name
-            })
-            
-        except Exception as e:
-            print(f"Error processing record {record.get('messageId', 'unknown')}: {str(e)}")
-            batch_results.append({
-                'message_id': record.get('messageId', 'unknown'),
-                'status': 'error',
-                'error': str(e)
-            })
-    
+    config = {
+        'validation_function_arn': os.environ['VALIDATION_FUNCTION_ARN'],
+        'transformation_function_arn': os.environ['TRANSFORMATION_FUNCTION_ARN'],
+        'storage_function_arn': os.environ['STORAGE_FUNCTION_ARN'],
+        'processed_data_table': os.environ['PROCESSED_DATA_TABLE'],
+        'environment': os.environ.get('ENVIRONMENT', 'dev'),
+    }
+    processing_mode = os.environ.get('PROCESSING_MODE', 'sequential')
+    storage_mode = os.environ.get('STORAGE_MODE', 'per_record')
+    max_concurrency = int(os.environ.get('MAX_CONCURRENCY', DEFAULT_MAX_CONCURRENCY))
+
+    records = event.get('Records', [])
+    # Every failure is reported by messageId; without one the partial batch
+    # response would be rejected, so fail the whole batch and let SQS retry it
+    missing = [i for i, record in enumerate(records) if not record.get('messageId')]
+    if missing:
+        raise ValueError(f"SQS records without a messageId at positions {missing}")
+    print(f"Processing SQS batch with {len(records)} records ({processing_mode} mode)")
+
+    if processing_mode == 'parallel':
+        batch_results = process_records_parallel(
+            context, records, config, max_concurrency, bulk_store=storage_mode == 'batch'
+        )
+    else:
+        # Process each SQS record in the batch
+        batch_results = [process_record(context, record, config) for record in records]
+
     # Return batch processing summary
     successful_records = len([r for r in batch_results if r['status'] == 'completed'])
     failed_records = len([r for r in batch_results if r['status'] in ['failed', 'error']])
-    
+
     return {
         'batch_summary': {
             'total_records': len(batch_results),
@@ -96,5 +68,210 @@ def lambda_handler(event: Dict[str, Any], context: DurableContext) -> Dict[str,
             'failed_records': failed_records
         },
         'record_results': batch_results,
-        'processed_at': datetime.utcnow().isoformat()
+        'processed_at': datetime.utcnow().isoformat(),
+        # Partial batch response: ESM deletes everything except these messages
+        'batchItemFailures': [
+            {'itemIdentifier': r['message_id']}
+            for r in batch_results
+            if r['status'] in ['failed', 'error']
+        ]
     }
+
+
+def process_record(
+    context: DurableContext,
+    record: Dict[str, Any],
+    config: Dict[str, str],
+    store: bool = True
+) -> Dict[str, Any]:
+    """
+    Run one SQS record through the validate -> transform -> store chain.
+    With store=False the chain stops after transformation and the result
+    carries the data for a later bulk write (status 'transformed').
+    """
+    try:
+        # Extract data from SQS record
+        message_id = record['messageId']
+        data = json.loads(record['body'])
+        execution_name = f"{config['environment']}-esm-{message_id}"
+
+        print(f"Processing record: {message_id}")
+
+        # Step 1: Validate data by invoking validation function
+        validation_result = context.invoke(
+            config['validation_function_arn'],
+            {'data': data, 'execution_id': execution_name},
+            name=f'validate-data-{message_id}'
+        )
+
+        if not validation_result.get('is_valid', False):
+            return {
+                'message_id': message_id,
+                'status': 'failed',
+                'reason': 'validation_failed'
+            }
+
+        # Step 2: Transform data by invoking transformation function
+        transformation_result = context.invoke(
+            config['transformation_function_arn'],
+            {'data': data, 'execution_id': execution_name},
+            name=f'transform-data-{message_id}'
+        )
+
+        if not store:
+            return {
+                'message_id': message_id,
+                'status': 'transformed',
+                'execution_id': execution_name,
+                'transformed_data': transformation_result,
+                'original_data': data
+            }
+
+        # Step 3: Store processed data by invoking storage function
+        storage_result = context.invoke(
+            config['storage_function_arn'],
+            {
+                'transformed_data': transformation_result,
+                'execution_id': execution_name,
+                'original_data': data
+            },
+            name=f'store-data-{message_id}'
+        )
+
+        if not storage_result.get('success', False):
+            return {
+                'message_id': message_id,
+                'status': 'error',
+                'error': storage_result.get('error', 'storage_failed')
+            }
+
+        return {
+            'message_id': message_id,
+            'status': 'completed',
+            'execution_id': execution_name
+        }
+
+    except Exception as e:
+        print(f"Error processing record {record['messageId']}: {str(e)}")
+        return {
+            'message_id': record['messageId'],
+            'status': 'error',
+            'error': str(e)
+        }
+
+
+def process_records_parallel(
+    context: DurableContext,
+    records: List[Dict[str, Any]],
+    config: Dict[str, str],
+    max_concurrency: int,
+    bulk_store: bool
+) -> List[Dict[str, Any]]:
+    """
+    Fan records out through context.map so their invoke chains overlap.
+    Every record runs to completion regardless of other records' failures.
+    With bulk_store the storage invokes are replaced by a single
+    batch_writer step over all transformed records.
+    """
+    if not records:
+        return []
+
+    batch = context.map(
+        records,
+        lambda ctx, record, index, _: process_record(ctx, record, config, store=not bulk_store),
+        name='process-records',
+        config=MapConfig(
+            max_concurrency=max_concurrency,
+            completion_config=CompletionConfig.all_completed()
+        )
+    )
+
+    # One result per input record, in input order; a branch that failed
+    # outright (rather than returning an error result) is reported as an error
+    results = [
+        {'message_id': records[i]['messageId'], 'status': 'error', 'error': 'map item did not complete'}
+        for i in range(len(records))
+    ]
+    for item in batch.all:
+        if item.result is not None:
+            results[item.index] = item.result
+        elif item.error is not None:
+            results[item.index]['error'] = str(item.error)
+
+    if bulk_store:
+        results = store_transformed_batch(context, results, config['processed_data_table'])
+    return results
+
+
+def store_transformed_batch(
+    context: DurableContext,
+    results: List[Dict[str, Any]],
+    table_name: str
+) -> List[Dict[str, Any]]:
+    """Write every 'transformed' record in one checkpointed batch_writer step."""
+    pending = [r for r in results if r['status'] == 'transformed']
+    if not pending:
+        return results
+
+    stored = context.step(
+        lambda _: write_batch(table_name, pending),
+        name='store-data-batch'
+    )
+
+    final_results = []
+    for result in results:
+        if result['status'] != 'transformed':
+            final_results.append(result)
+        elif stored.get('success'):
+            final_results.append({
+                'message_id': result['message_id'],
+                'status': 'completed',
+                'execution_id': result['execution_id']
+            })
+        else:
+            final_results.append({
+                'message_id': result['message_id'],
+                'status': 'error',
+                'error': stored.get('error', 'batch_storage_failed')
+            })
+    return final_results
+
+
+def write_batch(table_name: str, records: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Store processed data for many records with DynamoDB batch writes
+    (25 items per request, unprocessed items retried by batch_writer).
+    Items match those written by the storage function.
+    """
+    print(f"Storing {len(records)} processed records in one batch")
+
+    try:
+        table = dynamodb.Table(table_name)
+        stored_at = datetime.utcnow().isoformat()
+        with table.batch_writer(overwrite_by_pkeys=['execution_id']) as writer:
+            for record in records:
+                original_data = record['original_data']
+                item = {
+                    'execution_id': record['execution_id'],
+                    'original_data': original_data,
+                    'transformed_data': record['transformed_data'],
+                    'stored_at': stored_at,
+                    'data_source': original_data.get('data_source', 'unknown'),
+                    'processing_type': original_data.get('processing_type', 'standard')
+                }
+                # DynamoDB rejects Python floats; round-trip numbers as Decimal
+                writer.put_item(Item=json.loads(json.dumps(item), parse_float=Decimal))
+
+        return {
+            'success': True,
+            'stored_count': len(records),
+            'table_name': table_name,
+            'stored_at': stored_at
+        }
+
+    except Exception as e:
+        print(f"Error storing batch: {str(e)}")
+        return {
+            'success': False,
+            'error': str(e)
+        }
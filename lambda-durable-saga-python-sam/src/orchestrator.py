@@ -17,6 +17,7 @@ from datetime import datetime, timezone
 from decimal import Decimal
 
 import boto3
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
 from aws_durable_execution_sdk_python.context import DurableContext, StepContext, durable_step
 from aws_durable_execution_sdk_python.execution import durable_execution
 
@@ -27,6 +28,12 @@ dynamodb = boto3.resource("dynamodb")
 orders_table = dynamodb.Table(os.environ["ORDERS_TABLE"])
 payments_table = dynamodb.Table(os.environ["PAYMENTS_TABLE"])
 inventory_table = dynamodb.Table(os.environ["INVENTORY_TABLE"])
+dynamodb_client = dynamodb.meta.client
+
+# DynamoDB limit on actions in a single TransactWriteItems call
+MAX_TRANSACTION_ITEMS = 100
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
 
 
 # ─── FORWARD STEPS ───────────────────────────────────────────────────────────
@@ -34,34 +41,28 @@ inventory_table = dynamodb.Table(os.environ["INVENTORY_TABLE"])
 
 @durable_step
 def reserve_inventory(step_context: StepContext, order_id: str, items: list) -> dict:
-    """Step 1: Reserve inventory for each item in the order."""
+    """
+    Step 1: Reserve inventory for every item in the order.
+
+    Each chunk of line items is reserved in one TransactWriteItems call with
+    the availability check as the condition, so a chunk reserves all of its
+    items or none of them. If a later chunk fails, earlier chunks are released
+    before raising, so a failed step never leaves a partial reservation behind.
+    """
     step_context.logger.info("Reserving inventory for order %s", order_id)
 
     reservation_id = str(uuid.uuid4())
-    reserved_items = []
-
-    for item in items:
-        item_id = item["item_id"]
-        quantity = item["quantity"]
-
-        # Check availability and reserve
-        response = inventory_table.get_item(Key={"item_id": item_id})
-        stock = response.get("Item")
-
-        if not stock or int(stock.get("available", 0)) < quantity:
-            raise InsufficientInventoryError(
-                f"Insufficient stock for item {item_id}: "
-                f"requested {quantity}, available {stock.get('available', 0) if stock else 0}"
-            )
-
-        # Decrement available stock
-        inventory_table.update_item(
-            Key={"item_id": item_id},
-            UpdateExpression="SET available = available - :qty, reserved = reserved + :qty",
-            ExpressionAttributeValues={":qty": quantity},
-            ConditionExpression="available >= :qty",
-        )
-        reserved_items.append({"item_id": item_id, "quantity": quantity})
+    reserved_items = _merge_line_items(items)
+
+    committed = []
+    for chunk in _chunks(reserved_items, MAX_TRANSACTION_ITEMS):
+        try:
+            _transact_inventory_update(chunk, reserve=True)
+        except Exception:
+            for done in committed:
+                _transact_inventory_update(done, reserve=False)
+            raise
+        committed.append(chunk)
 
     return {"reservation_id": reservation_id, "reserved_items": reserved_items}
 
@@ -146,16 +147,76 @@ def compensate_inventory(step_context: StepContext, reservation: dict) -> dict:
     """Compensation: Release reserved inventory back to available stock."""
     step_context.logger.info("Compensating inventory reservation %s", reservation["reservation_id"])
 
-    for item in reservation["reserved_items"]:
-        inventory_table.update_item(
-            Key={"item_id": item["item_id"]},
-            UpdateExpression="SET available = available + :qty, reserved = reserved - :qty",
-            ExpressionAttributeValues={":qty": item["quantity"]},
-        )
+    for index, chunk in enumerate(_chunks(reservation["reserved_items"], MAX_TRANSACTION_ITEMS)):
+        # Retrying the step must not release the same chunk twice, so each
+        # chunk's transaction is idempotent for DynamoDB's 10 minute window
+        token = str(uuid.uuid5(uuid.NAMESPACE_URL, f"{reservation['reservation_id']}/release/{index}"))
+        _transact_inventory_update(chunk, reserve=False, client_request_token=token)
 
     return {"reservation_id": reservation["reservation_id"], "status": "RELEASED"}
 
 
+# ─── INVENTORY HELPERS ───────────────────────────────────────────────────────
+
+
+def _merge_line_items(items: list) -> list:
+    """Sum quantities per item_id; a transaction may touch each key only once."""
+    quantities = {}
+    for item in items:
+        quantities[item["item_id"]] = quantities.get(item["item_id"], 0) + item["quantity"]
+    return [{"item_id": item_id, "quantity": quantity} for item_id, quantity in quantities.items()]
+
+
+def _chunks(items: list, size: int) -> list:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def _transact_inventory_update(items: list, reserve: bool, client_request_token: str = None) -> None:
+    """
+    Move stock between available and reserved for items in one transaction.
+    Reservations are conditional on available >= quantity for every item.
+    """
+    update = {
+        "TableName": inventory_table.name,
+        "UpdateExpression": (
+            "SET available = available - :qty, reserved = reserved + :qty"
+            if reserve else
+            "SET available = available + :qty, reserved = reserved - :qty"
+        ),
+    }
+    if reserve:
+        update["ConditionExpression"] = "available >= :qty"
+        update["ReturnValuesOnConditionCheckFailure"] = "ALL_OLD"
+
+    transact_items = [
+        {
+            "Update": {
+                **update,
+                "Key": {"item_id": _serializer.serialize(item["item_id"])},
+                "ExpressionAttributeValues": {":qty": _serializer.serialize(item["quantity"])},
+            }
+        }
+        for item in items
+    ]
+    request = {"TransactItems": transact_items}
+    if client_request_token:
+        request["ClientRequestToken"] = client_request_token
+
+    try:
+        dynamodb_client.transact_write_items(**request)
+    except dynamodb_client.exceptions.TransactionCanceledException as err:
+        reasons = err.response.get("CancellationReasons", [])
+        for item, reason in zip(items, reasons):
+            if reason.get("Code") == "ConditionalCheckFailed":
+                stock = reason.get("Item")
+                available = _deserializer.deserialize(stock["available"]) if stock and "available" in stock else 0
+                raise InsufficientInventoryError(
+                    f"Insufficient stock for item {item['item_id']}: "
+                    f"requested {item['quantity']}, available {available}"
+                ) from err
+        raise
+
+
 # ─── ORCHESTRATOR ────────────────────────────────────────────────────────────
 
 
@@ -0,0 +1,17 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+from .filters import TypeFilter
+from .pipeline import TelemetryHTTPHandler, TelemetryPipeline, create_server
+from .sinks import EmfSink, FileSink, S3Sink, Sink
+
+__all__ = [
+    "EmfSink",
+    "FileSink",
+    "S3Sink",
+    "Sink",
+    "TelemetryHTTPHandler",
+    "TelemetryPipeline",
+    "TypeFilter",
+    "create_server",
+]
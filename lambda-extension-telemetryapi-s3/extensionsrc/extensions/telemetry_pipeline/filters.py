@@ -0,0 +1,34 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+
+class TypeFilter:
+    """
+    Keeps records whose Telemetry API type matches one of the given patterns.
+
+    A pattern is either a full record type ("platform.report", "function") or
+    a category prefix ("platform" keeps every "platform.*" record). An empty
+    pattern list keeps everything.
+    """
+
+    def __init__(self, patterns):
+        self.types = set()
+        self.categories = set()
+        for pattern in patterns:
+            if "." in pattern:
+                self.types.add(pattern)
+            else:
+                self.categories.add(pattern)
+
+    def __call__(self, records):
+        if not self.types and not self.categories:
+            return records
+        return [record for record in records if self.matches(record.get("type", ""))]
+
+    def matches(self, record_type):
+        return record_type in self.types or record_type.split(".", 1)[0] in self.categories
+
+    @classmethod
+    def from_env(cls, value):
+        """Build from a comma separated list, e.g. "platform.report,function"."""
+        return cls([pattern.strip() for pattern in value.split(",") if pattern.strip()])
@@ -0,0 +1,159 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Full, Queue
+from threading import Condition, Lock, Thread
+
+_STOP = object()
+
+
+class TelemetryPipeline:
+    """
+    Bounded queue -> filter stages -> sinks.
+
+    The Telemetry API listener submits each batch it receives. Batches are
+    queued without blocking: when the queue is full the batch is dropped and
+    counted, so a slow sink can never back up the listener (or the function).
+    A dispatcher thread runs each batch through the filters in order and
+    writes the surviving records to every sink.
+
+    Once closed the pipeline rejects (and counts as dropped) any batch still
+    submitted, since nothing would process it.
+    """
+
+    def __init__(self, filters, sinks, max_queue_batches=1000):
+        self.filters = list(filters)
+        self.sinks = list(sinks)
+        self._queue = Queue(maxsize=max_queue_batches)
+        self._lock = Lock()
+        self._submitted = Condition(self._lock)
+        self._closed = False
+        self._counters = {
+            'batches_received': 0,
+            'batches_dropped': 0,
+            'records_received': 0,
+            'records_filtered': 0,
+            'records_written': 0,
+            'sink_errors': 0,
+        }
+        self._thread = Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def submit(self, records):
+        """Queue one Telemetry API batch; returns False if it was dropped."""
+        with self._lock:
+            self._counters['batches_received'] += 1
+            self._submitted.notify_all()
+            if self._closed:
+                self._counters['batches_dropped'] += 1
+                return False
+            try:
+                self._queue.put_nowait(records)
+                return True
+            except Full:
+                self._counters['batches_dropped'] += 1
+                return False
+
+    def stats(self):
+        with self._lock:
+            stats = dict(self._counters)
+        stats['queue_depth'] = self._queue.qsize()
+        return stats
+
+    def close(self, timeout=None, final_batch_wait=0.0):
+        """
+        Process everything queued, then close (and flush) every sink.
+
+        The Telemetry API usually delivers the last batch (with the final
+        platform.report) after SHUTDOWN, so with final_batch_wait the
+        pipeline first waits up to that many seconds for one more batch.
+        """
+        with self._lock:
+            if final_batch_wait:
+                seen = self._counters['batches_received']
+                self._submitted.wait_for(lambda: self._counters['batches_received'] > seen, final_batch_wait)
+            self._closed = True
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        stats = self.stats()
+        for sink in self.sinks:
+            self._call_sink(sink.record_stats, stats)
+            self._call_sink(sink.close)
+        return stats
+
+    def _run(self):
+        while True:
+            batch = self._queue.get()
+            if batch is _STOP:
+                return
+            self.process(batch)
+
+    def process(self, records):
+        """Filter one batch and write it to the sinks (dispatcher thread)."""
+        if not isinstance(records, list):
+            records = [records]
+        invokes = sum(1 for record in records if record.get('type') == 'platform.report')
+        kept = records
+        for stage in self.filters:
+            kept = stage(kept)
+        with self._lock:
+            self._counters['records_received'] += len(records)
+            self._counters['records_filtered'] += len(records) - len(kept)
+            self._counters['records_written'] += len(kept)
+        if kept:
+            for sink in self.sinks:
+                self._call_sink(sink.write, kept)
+        if invokes:
+            stats = self.stats()
+            for sink in self.sinks:
+                self._call_sink(sink.record_stats, stats)
+
+    def _call_sink(self, method, *args):
+        try:
+            method(*args)
+        except Exception as e:
+            with self._lock:
+                self._counters['sink_errors'] += 1
+            print(f"[telemetry_pipeline] Sink error in {method.__qualname__}: {e}", flush=True)
+
+
+class TelemetryHTTPHandler(BaseHTTPRequestHandler):
+    """Telemetry API destination: parses each batch before acknowledging it."""
+
+    # Keep-alive, so the Telemetry API reuses one connection for its batches
+    protocol_version = "HTTP/1.1"
+    pipeline = None
+
+    def do_POST(self):
+        try:
+            content = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            records = json.loads(content.decode("utf-8"))
+        except (ValueError, UnicodeDecodeError) as e:
+            print(f"[telemetry_pipeline] Invalid telemetry batch: {e}", flush=True)
+            self._reply(400)
+            return
+        if not self.pipeline.submit(records):
+            print("[telemetry_pipeline] Telemetry batch dropped (queue full or pipeline closed)", flush=True)
+        self._reply(200)
+
+    def _reply(self, status):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        # Access logs would end up in the function's log stream
+        pass
+
+
+def create_server(host, port, pipeline):
+    """Threaded HTTP server that submits every received batch to pipeline."""
+    handler = type('BoundTelemetryHTTPHandler', (TelemetryHTTPHandler,), {'pipeline': pipeline})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
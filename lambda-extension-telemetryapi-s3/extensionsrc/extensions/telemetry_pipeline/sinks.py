@@ -0,0 +1,217 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+import gzip
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from threading import Condition, Lock, Thread
+
+
+class Sink:
+    """
+    Destination for filtered telemetry records.
+
+    write() is called from the pipeline's dispatcher thread with a list of
+    records; record_stats() is called once per invoke (and at shutdown) with
+    the pipeline counters; close() must flush anything buffered.
+    """
+
+    def write(self, records):
+        raise NotImplementedError
+
+    def record_stats(self, stats):
+        pass
+
+    def close(self):
+        pass
+
+
+def _default_s3_client():
+    # One client (and its connection pool) for every upload
+    import boto3
+    from botocore.config import Config
+    return boto3.client('s3', config=Config(max_pool_connections=2, retries={'max_attempts': 5, 'mode': 'standard'}))
+
+
+class S3Sink(Sink):
+    """
+    Aggregates Telemetry API batches into gzipped newline-delimited JSON objects.
+
+    Records are buffered in memory and uploaded by a dedicated thread once the
+    buffer reaches max_bytes or its oldest record is max_age_seconds old, so
+    uploads never run on the invoke path.
+    close() uploads whatever is left synchronously (on SHUTDOWN).
+
+    Objects are written under Hive-style date partitions so they can be
+    queried with Athena:
+    <prefix>function=<name>/year=YYYY/month=MM/day=DD/hour=HH/<timestamp>-<id>.ndjson.gz
+    """
+
+    def __init__(self, bucket, function_name, max_bytes=5 * 1024 * 1024,
+                 max_age_seconds=60, prefix='telemetry/', client=None):
+        self.bucket = bucket
+        self.function_name = function_name
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self.prefix = prefix
+        self.client = client or _default_s3_client()
+        self.objects_written = 0
+        self.records_written = 0
+        self._condition = Condition()
+        self._lines = []
+        self._buffered_bytes = 0
+        self._oldest = None
+        self._closed = False
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def write(self, records):
+        lines = [json.dumps(record, separators=(',', ':')).encode('utf-8') + b'\n' for record in records]
+        with self._condition:
+            if self._oldest is None:
+                self._oldest = time.monotonic()
+            self._lines.extend(lines)
+            self._buffered_bytes += sum(len(line) for line in lines)
+            if self._buffered_bytes >= self.max_bytes:
+                self._condition.notify()
+
+    def close(self):
+        """Stop the upload thread and synchronously upload everything still buffered."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self._upload(self._take())
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._closed and not self._due():
+                    timeout = None
+                    if self._oldest is not None:
+                        timeout = max(0.0, self._oldest + self.max_age_seconds - time.monotonic())
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                lines = self._take()
+            self._upload(lines)
+
+    def _due(self):
+        """Whether the buffer should be uploaded now (condition held)."""
+        if not self._lines:
+            return False
+        return (self._buffered_bytes >= self.max_bytes
+                or time.monotonic() - self._oldest >= self.max_age_seconds)
+
+    def _take(self):
+        with self._condition:
+            lines = self._lines
+            self._lines = []
+            self._buffered_bytes = 0
+            self._oldest = None
+        return lines
+
+    def _object_key(self, now):
+        return (f"{self.prefix}function={self.function_name}/"
+                f"year={now:%Y}/month={now:%m}/day={now:%d}/hour={now:%H}/"
+                f"{now:%Y%m%dT%H%M%S%fZ}-{uuid.uuid4().hex[:8]}.ndjson.gz")
+
+    def _upload(self, lines):
+        if not lines:
+            return
+        key = self._object_key(datetime.now(timezone.utc))
+        try:
+            self.client.put_object(
+                Bucket=self.bucket,
+                Key=key,
+                Body=gzip.compress(b''.join(lines)),
+                ContentType='application/x-ndjson',
+                ContentEncoding='gzip'
+            )
+            self.objects_written += 1
+            self.records_written += len(lines)
+        except Exception as e:
+            print(f"[telemetry_pipeline] Error sending {len(lines)} log records to S3 {e}", flush=True)
+
+
+class FileSink(Sink):
+    """Appends records as newline-delimited JSON to a local file (e.g. under /tmp)."""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def write(self, records):
+        self._file.write(''.join(json.dumps(record, separators=(',', ':')) + '\n' for record in records))
+
+    def close(self):
+        self._file.close()
+
+
+class EmfSink(Sink):
+    """
+    Emits CloudWatch Embedded Metric Format lines on stdout.
+
+    Each platform.report record becomes one EMF line with the invoke's
+    duration, billed duration, memory and init duration. Pipeline counters,
+    including the number of batches dropped because the queue was full, are
+    emitted once per invoke.
+    """
+
+    NAMESPACE = 'TelemetryExtension'
+    REPORT_METRICS = {
+        'durationMs': 'Milliseconds',
+        'billedDurationMs': 'Milliseconds',
+        'maxMemoryUsedMB': 'Megabytes',
+        'initDurationMs': 'Milliseconds',
+    }
+    STATS_METRICS = {
+        'batches_dropped': 'TelemetryBatchesDropped',
+        'records_received': 'TelemetryRecordsReceived',
+        'records_filtered': 'TelemetryRecordsFiltered',
+        'queue_depth': 'TelemetryQueueDepth',
+    }
+
+    def __init__(self, function_name, stream=None):
+        self.function_name = function_name
+        self.stream = stream or sys.stdout
+        self._lock = Lock()
+        self._last_stats = {}
+
+    def write(self, records):
+        for record in records:
+            if record.get('type') != 'platform.report':
+                continue
+            metrics = record.get('record', {}).get('metrics', {})
+            values = {name: metrics[name] for name in self.REPORT_METRICS if name in metrics}
+            if values:
+                self._emit(values, {name: unit for name, unit in self.REPORT_METRICS.items() if name in values})
+
+    def record_stats(self, stats):
+        # Counters are cumulative; emit what changed since the last call
+        values = {}
+        for key, name in self.STATS_METRICS.items():
+            value = stats.get(key, 0)
+            values[name] = value if key == 'queue_depth' else value - self._last_stats.get(key, 0)
+        self._last_stats = dict(stats)
+        self._emit(values, {name: 'Count' for name in values})
+
+    def _emit(self, values, units):
+        line = {
+            '_aws': {
+                'Timestamp': int(time.time() * 1000),
+                'CloudWatchMetrics': [{
+                    'Namespace': self.NAMESPACE,
+                    'Dimensions': [['FunctionName']],
+                    'Metrics': [{'Name': name, 'Unit': unit} for name, unit in units.items()],
+                }],
+            },
+            'FunctionName': self.function_name,
+            **values,
+        }
+        with self._lock:
+            self.stream.write(json.dumps(line, separators=(',', ':')) + '\n')
+            self.stream.flush()
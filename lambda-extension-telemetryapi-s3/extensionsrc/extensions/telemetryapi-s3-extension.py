@@ -6,52 +6,55 @@ import json
 import os
 import sys
 from pathlib import Path
-from http.server import BaseHTTPRequestHandler, HTTPServer
 import urllib.request
 from threading import Event, Thread
-from datetime import datetime
-from queue import Queue
 
 lib_folder = Path(__file__).parent / "lib"
 sys.path.insert(0,str(lib_folder))
 
 import requests
-import boto3
+
+from telemetry_pipeline import EmfSink, FileSink, S3Sink, TypeFilter, TelemetryPipeline, create_server
 
 LAMBDA_EXTENSION_NAME = os.path.basename(__file__)
 HOST_NAME = "sandbox"
 # LOCAL_DEBUGGING_IP = "0.0.0.0"
 HOST_PORT = 8080
 LAMBDA_AGENT_IDENTIFIER_HEADER_KEY = "Lambda-Extension-Identifier"
-s3_bucket = (os.environ['S3_BUCKET_NAME'])
-s3 = boto3.resource('s3')
+s3_bucket = os.environ.get('S3_BUCKET_NAME')
+# Uncompressed NDJSON bytes buffered before an upload is started
+S3_FLUSH_MAX_BYTES = int(os.environ.get('S3_FLUSH_MAX_BYTES', 5 * 1024 * 1024))
+# Maximum age in seconds of the oldest buffered record before an upload is started
+S3_FLUSH_MAX_AGE_SECONDS = float(os.environ.get('S3_FLUSH_MAX_AGE_SECONDS', 60))
+S3_KEY_PREFIX = os.environ.get('S3_KEY_PREFIX', 'telemetry/')
+# Comma separated record types to keep, e.g. "platform.report,function" (empty keeps everything)
+TELEMETRY_TYPES = os.environ.get('TELEMETRY_TYPES', '')
+# Comma separated sinks: s3, file, emf
+TELEMETRY_SINKS = os.environ.get('TELEMETRY_SINKS', 's3')
+TELEMETRY_FILE_PATH = os.environ.get('TELEMETRY_FILE_PATH', '/tmp/telemetry.ndjson')
+# Telemetry API batches queued before new batches are dropped
+TELEMETRY_QUEUE_MAX_BATCHES = int(os.environ.get('TELEMETRY_QUEUE_MAX_BATCHES', 1000))
+# How long to wait on SHUTDOWN for the Telemetry API's final batch (its buffering timeout)
+TELEMETRY_SHUTDOWN_WAIT_MS = int(os.environ.get('TELEMETRY_SHUTDOWN_WAIT_MS', 1000))
 extension_id = ""
-pending_queue = Queue()
-
-class TelemetryHTTPHandler(BaseHTTPRequestHandler): 
-    def do_POST(self):
-        try:
-            cl = self.headers.get("Content-Length")
-            if cl:
-                data_len = int(cl)
-            else:
-                data_len = 0
-            content = self.rfile.read(data_len)
-            self.send_response(200)
-            self.end_headers()
-            msg = json.loads(content.decode("utf-8"))
-            print(f"Incoming message ={msg}")
-            pending_queue.put(msg)
-        except Exception as e:
-            print(f"Error processing message: {e}")
-
-def push_log_to_s3(msg):
-    s3_filename = (os.environ['AWS_LAMBDA_FUNCTION_NAME'])+'-'+(datetime.now().strftime('%Y-%m-%d-%H:%M:%S.%f'))+'.log'
-    try:
-        response = s3.Bucket(s3_bucket).put_object(Key=s3_filename, Body=str(msg))
-        # print(f"ResponseS3 = {response}")
-    except Exception as e:
-        raise Exception(f"Error sending log to S3 {e}") from e
+pipeline = None
+
+
+def create_pipeline():
+    function_name = os.environ['AWS_LAMBDA_FUNCTION_NAME']
+    sinks = []
+    for name in [n.strip() for n in TELEMETRY_SINKS.split(',') if n.strip()]:
+        if name == 's3':
+            sinks.append(S3Sink(s3_bucket, function_name, max_bytes=S3_FLUSH_MAX_BYTES,
+                                max_age_seconds=S3_FLUSH_MAX_AGE_SECONDS, prefix=S3_KEY_PREFIX))
+        elif name == 'file':
+            sinks.append(FileSink(TELEMETRY_FILE_PATH))
+        elif name == 'emf':
+            sinks.append(EmfSink(function_name))
+        else:
+            raise ValueError(f"Unknown telemetry sink: {name}")
+    return TelemetryPipeline([TypeFilter.from_env(TELEMETRY_TYPES)], sinks,
+                             max_queue_batches=TELEMETRY_QUEUE_MAX_BATCHES).start()
 
 
 def register_extension():
@@ -90,17 +93,17 @@ def process_events(ext_id):
         )
         event = json.loads(response.text)
         if event['eventType'] == 'SHUTDOWN':
-            print(f"[{LAMBDA_EXTENSION_NAME}] Received SHUTDOWN event. Exiting.", flush=True)
+            print(f"[{LAMBDA_EXTENSION_NAME}] Received SHUTDOWN event. Flushing telemetry sinks.", flush=True)
+            stats = pipeline.close(final_batch_wait=TELEMETRY_SHUTDOWN_WAIT_MS / 1000)
+            print(f"[{LAMBDA_EXTENSION_NAME}] Telemetry pipeline stats: {json.dumps(stats)}. Exiting.", flush=True)
             sys.exit(0)
         else:
             execute_custom_processing(event)
 
 def execute_custom_processing(event):
     # perform custom per-event processing here
+    # Telemetry is processed by the pipeline's threads, off the invoke path
     print(f"[{LAMBDA_EXTENSION_NAME}] Received event: {json.dumps(event)}", flush=True)
-    while not pending_queue.empty():
-        msg = pending_queue.get_nowait()
-        push_log_to_s3(msg)
 
 def subscribe_telemetry_api(ext_id):
     print(f"Start telemetry api subscription")
@@ -145,7 +148,7 @@ def serve(started_event, server):
             server.shutdown()
 
 def start_listener():
-    webServer = HTTPServer((HOST_NAME, HOST_PORT), TelemetryHTTPHandler)
+    webServer = create_server(HOST_NAME, HOST_PORT, pipeline)
 
     started_event = Event()
     server_thread = Thread(target=serve, daemon=True, args=(started_event, webServer,))
@@ -155,16 +158,16 @@ def start_listener():
         raise Exception("server_thread has timed out before starting")
 
 def main():
-    #Prepare S3 bucket
-    s3_bucket = (os.environ['S3_BUCKET_NAME'])
-    s3 = boto3.resource('s3')
+    global pipeline
+    #Prepare filters and sinks
+    pipeline = create_pipeline()
     #Start HTTP listener to listen to Telemetry API
     start_listener()
     # Register Extension API and Subscribe to Telemetry API with HTTP Listener which created previously 
     extension_id = register_extension()
     subscribe_telemetry_api(extension_id)
-    #While HTTP Listener listen to Teleymetry API and put log to the queue, 
-    #process events will check the queue and put the log to S3 and then send signal to Extension API for next event 
+    #While HTTP Listener listen to Teleymetry API and submit batches to the pipeline,
+    #process events signals Extension API for next event and flushes the sinks on SHUTDOWN
     process_events(extension_id)
     
 
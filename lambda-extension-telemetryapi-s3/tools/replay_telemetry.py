@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+"""
+Replays recorded Telemetry API batches through the extension's pipeline
+locally, to benchmark listener and dispatcher overhead.
+
+Batches are POSTed to the same threaded HTTP listener the extension runs,
+over one keep-alive connection, exactly as the Telemetry API would send
+them. The S3 sink uses a client that discards uploads (objects are still
+serialized and gzipped), so no AWS credentials are needed.
+
+    python tools/replay_telemetry.py --repeat 2000 --sinks s3,file,emf --types platform.report
+"""
+
+import argparse
+import http.client
+import io
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from threading import Thread
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "extensionsrc" / "extensions"))
+
+from telemetry_pipeline import EmfSink, FileSink, S3Sink, TelemetryPipeline, TypeFilter, create_server  # noqa: E402
+
+
+class _DiscardingS3Client:
+    def put_object(self, **kwargs):
+        pass
+
+
+def build_sinks(names, workdir):
+    sinks = []
+    for name in names:
+        if name == 's3':
+            sinks.append(S3Sink('replay-bucket', 'replay-function', client=_DiscardingS3Client()))
+        elif name == 'file':
+            sinks.append(FileSink(str(Path(workdir) / 'telemetry.ndjson')))
+        elif name == 'emf':
+            sinks.append(EmfSink('replay-function', stream=io.StringIO()))
+        else:
+            raise ValueError(f"Unknown telemetry sink: {name}")
+    return sinks
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def replay(batches, repeat, sink_names, types, max_queue_batches):
+    with tempfile.TemporaryDirectory() as workdir:
+        pipeline = TelemetryPipeline([TypeFilter.from_env(types)], build_sinks(sink_names, workdir),
+                                     max_queue_batches=max_queue_batches)
+        # Time spent in the dispatcher thread (filters + sinks)
+        dispatch_seconds = [0.0]
+        process = pipeline.process
+
+        def timed_process(records):
+            started = time.perf_counter()
+            process(records)
+            dispatch_seconds[0] += time.perf_counter() - started
+
+        pipeline.process = timed_process
+        pipeline.start()
+
+        server = create_server('127.0.0.1', 0, pipeline)
+        Thread(target=server.serve_forever, daemon=True).start()
+        connection = http.client.HTTPConnection('127.0.0.1', server.server_address[1])
+
+        bodies = [json.dumps(batch).encode('utf-8') for batch in batches]
+        post_seconds = []
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for body in bodies:
+                sent = time.perf_counter()
+                connection.request('POST', '/', body=body, headers={'Content-Type': 'application/json'})
+                connection.getresponse().read()
+                post_seconds.append(time.perf_counter() - sent)
+        posted = time.perf_counter()
+        stats = pipeline.close()
+        finished = time.perf_counter()
+        server.shutdown()
+        connection.close()
+
+    records = stats['records_received']
+    invokes = repeat * sum(1 for batch in batches for record in batch if record.get('type') == 'platform.report')
+    return {
+        'batches': len(post_seconds),
+        'records': records,
+        'invokes': invokes,
+        'sinks': sink_names,
+        'types': types or '*',
+        'wallSeconds': round(finished - started, 3),
+        'drainSeconds': round(finished - posted, 3),
+        'recordsPerSecond': round(records / (finished - started)),
+        'postLatencyMs': {
+            'p50': round(statistics.median(post_seconds) * 1000, 3),
+            'p99': round(percentile(post_seconds, 99) * 1000, 3),
+        },
+        'dispatchMsPerInvoke': round(dispatch_seconds[0] * 1000 / invokes, 4) if invokes else None,
+        'pipeline': stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--batches', default=str(Path(__file__).resolve().parent / 'sample-telemetry.json'),
+                        help='JSON file with a list of recorded Telemetry API batches')
+    parser.add_argument('--repeat', type=int, default=1000, help='Times to replay the recorded batches')
+    parser.add_argument('--sinks', default='s3', help='Comma separated sinks: s3, file, emf')
+    parser.add_argument('--types', default='', help='Record types to keep, e.g. platform.report,function')
+    parser.add_argument('--max-queue-batches', type=int, default=1000)
+    args = parser.parse_args()
+
+    batches = json.loads(Path(args.batches).read_text())
+    sink_names = [name.strip() for name in args.sinks.split(',') if name.strip()]
+    print(json.dumps(replay(batches, args.repeat, sink_names, args.types, args.max_queue_batches), indent=2))
+
+
+if __name__ == '__main__':
+    main()
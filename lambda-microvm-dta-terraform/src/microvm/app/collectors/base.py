@@ -25,7 +25,11 @@ class CollectorStatus:
 
 
 class Collector:
-    """Lifecycle: ``setup`` (pre-launch) → target runs → ``finish`` (post-exit).
+    """Lifecycle: ``setup`` (pre-launch) → ``before_launch`` → target runs → ``finish`` (post-exit).
+
+    ``before_launch`` runs once every collector has been set up, immediately
+    before the target is spawned, so changes made by other collectors' setup
+    (canary files) can be told apart from the target's own.
 
     A collector that needs to observe a live PID implements
     :meth:`on_target_started`, which the supervisor calls from the launcher's
@@ -44,6 +48,9 @@ class Collector:
     def setup(self) -> None:  # before target launch
         self.status.status = "running"
 
+    def before_launch(self) -> None:  # all collectors set up, target not spawned yet
+        pass
+
     def on_target_started(self, pid: int) -> None:  # target is live
         pass
 
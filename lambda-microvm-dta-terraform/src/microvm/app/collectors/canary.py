@@ -116,7 +116,7 @@ class CanaryCollector(Collector):
     def _strace_opened_paths(self) -> set[str]:
         opened: set[str] = set()
         canary_dir = str(self.workspace.canary.resolve())
-        for event in self.sink.events():
+        for event in self.sink.iter_events():
             if event.type != "syscall.file_open" or not event.file:
                 continue
             path = str(event.file.get("path") or "")
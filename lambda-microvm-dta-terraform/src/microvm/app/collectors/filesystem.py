@@ -7,16 +7,20 @@ tmp dirs — it never scans the whole MicroVM filesystem in v0.2.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import hashlib
+import os
 import stat
 
 from .base import Collector
 
 # Only hash files at or below this size to keep snapshots cheap.
 _HASH_SIZE_LIMIT = 1_048_576  # 1 MiB
+# Hashing is I/O-bound (hashlib releases the GIL), so a small thread pool is enough.
+_HASH_WORKERS = min(8, (os.cpu_count() or 1) + 2)
 
 
 @dataclass(frozen=True)
@@ -25,15 +29,29 @@ class _FileState:
     mtime_ns: int
     mode: int
     sha256: Optional[str]
+    inode: int = 0
+    ctime_ns: int = 0
 
     @property
     def is_executable(self) -> bool:
         return bool(self.mode & (stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH))
 
+    def same_content_as(self, other: "_FileState") -> bool:
+        """Whether a previous hash can be reused for this file.
 
-def _sha256(path: Path) -> Optional[str]:
+        ctime is included because, unlike mtime, the target cannot set it back.
+        """
+        return (
+            self.size == other.size
+            and self.mtime_ns == other.mtime_ns
+            and self.inode == other.inode
+            and self.ctime_ns == other.ctime_ns
+        )
+
+
+def _sha256(path: str, size: Optional[int] = None) -> Optional[str]:
     try:
-        if path.stat().st_size > _HASH_SIZE_LIMIT:
+        if (os.stat(path).st_size if size is None else size) > _HASH_SIZE_LIMIT:
             return None
         h = hashlib.sha256()
         with open(path, "rb") as f:
@@ -44,42 +62,79 @@ def _sha256(path: Path) -> Optional[str]:
         return None
 
 
-def _snapshot(roots, *, no_hash_roots=()) -> Dict[str, _FileState]:
+def _walk(root: str, no_hash: Tuple[str, ...], skip_hash: bool) -> Iterator[Tuple[str, os.stat_result, bool]]:
+    """Yield ``(path, stat, skip_hash)`` for regular files under ``root``.
+
+    Uses ``os.scandir`` so each file costs one ``lstat`` (often served from the
+    directory read itself); symlinks are neither followed nor reported.
+    """
+    stack = [(root, skip_hash)]
+    while stack:
+        directory, dir_skip = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            if stat.S_ISDIR(st.st_mode):
+                stack.append((entry.path, dir_skip or entry.path in no_hash))
+            elif stat.S_ISREG(st.st_mode):
+                yield entry.path, st, dir_skip
+
+
+def _snapshot(roots, *, no_hash_roots=(), previous: Optional[Dict[str, _FileState]] = None) -> Dict[str, _FileState]:
     """Snapshot files under ``roots``.
 
     Files under any directory in ``no_hash_roots`` are stat-only (no content
     read), so snapshotting does not advance their access time. This matters for
     the canary directory, whose atime is used as a (low-confidence) read signal.
+
+    With ``previous`` (the "before" snapshot), files whose size, mtime, inode
+    and ctime are unchanged keep their earlier hash; only new or changed files
+    are read, and those are hashed on a thread pool.
     """
-    no_hash = [Path(r).resolve() for r in no_hash_roots]
+    no_hash = tuple(str(Path(r).resolve()) for r in no_hash_roots)
+    previous = previous or {}
     snap: Dict[str, _FileState] = {}
+    to_hash: List[Tuple[str, int]] = []
     for root in roots:
-        root = Path(root)
-        if not root.exists():
+        root_path = Path(root).resolve()
+        if not root_path.is_dir():
             continue
-        for path in root.rglob("*"):
-            if not path.is_file() or path.is_symlink():
-                continue
-            try:
-                st = path.stat()
-            except OSError:
-                continue
-            skip_hash = any(_under(path, nh) for nh in no_hash)
-            snap[str(path)] = _FileState(
+        root_str = str(root_path)
+        root_skip = any(root_str == nh or root_str.startswith(nh + os.sep) for nh in no_hash)
+        for path, st, skip_hash in _walk(root_str, no_hash, root_skip):
+            state = _FileState(
                 size=st.st_size,
                 mtime_ns=st.st_mtime_ns,
                 mode=st.st_mode,
-                sha256=None if skip_hash else _sha256(path),
+                sha256=None,
+                inode=st.st_ino,
+                ctime_ns=st.st_ctime_ns,
             )
+            prev = previous.get(path)
+            if not skip_hash:
+                if prev is not None and state.same_content_as(prev):
+                    state = replace(state, sha256=prev.sha256)
+                elif st.st_size <= _HASH_SIZE_LIMIT:
+                    to_hash.append((path, st.st_size))
+            snap[path] = state
+    if to_hash:
+        for (path, _), digest in zip(to_hash, _hash_many(to_hash)):
+            snap[path] = replace(snap[path], sha256=digest)
     return snap
 
 
-def _under(child: Path, parent: Path) -> bool:
-    try:
-        child.resolve().relative_to(parent)
-        return True
-    except ValueError:
-        return False
+def _hash_many(items: List[Tuple[str, int]]) -> Iterable[Optional[str]]:
+    if len(items) == 1:
+        return [_sha256(*items[0])]
+    with ThreadPoolExecutor(max_workers=_HASH_WORKERS) as pool:
+        return list(pool.map(lambda item: _sha256(*item), items))
 
 
 def _is_temp_like(path: str, tmp_root: Path) -> bool:
@@ -102,8 +157,15 @@ class FilesystemCollector(Collector):
         self._before = _snapshot(self.workspace.monitored_dirs, no_hash_roots=[self.workspace.canary])
 
     def finish(self, launch_result) -> None:
-        after = _snapshot(self.workspace.monitored_dirs, no_hash_roots=[self.workspace.canary])
-        before = self._before
+        after = _snapshot(
+            self.workspace.monitored_dirs,
+            no_hash_roots=[self.workspace.canary],
+            previous=self._before,
+        )
+        self._report_diff(self._before, after)
+        super().finish(launch_result)
+
+    def _report_diff(self, before: Dict[str, _FileState], after: Dict[str, _FileState]) -> None:
         tmp_root = self.workspace.tmp
 
         for path, state in after.items():
@@ -147,4 +209,3 @@ class FilesystemCollector(Collector):
                     message="File deleted by target",
                     file={"path": path},
                 )
-        super().finish(launch_result)
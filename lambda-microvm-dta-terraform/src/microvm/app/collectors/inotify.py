@@ -0,0 +1,394 @@
+"""inotify filesystem change journal (Linux).
+
+Watches the monitored workspace directories with inotify while the target runs
+and journals create / modify / delete / chmod events with their observation
+time. Compared with the before/after snapshot diff this catches files that are
+created and deleted during the run, and it replaces the two hashed tree walks
+with one stat-only walk plus hashing of just the files that were touched.
+
+inotify is reached through ``ctypes`` against libc, so there are no native
+dependencies. Where inotify is unavailable (non-Linux, no libc symbol, watch
+limit reached) the collector falls back to the snapshot diff of
+:class:`FilesystemCollector`, so the same ``file.*`` summary events are always
+produced.
+"""
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, Optional, Set
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import stat
+import struct
+import sys
+import threading
+
+from .filesystem import FilesystemCollector, _FileState, _hash_many, _sha256, _snapshot, _walk
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_DONT_FOLLOW = 0x02000000
+IN_ISDIR = 0x40000000
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+
+_WATCH_MASK = (
+    IN_CREATE | IN_MODIFY | IN_ATTRIB | IN_DELETE | IN_MOVED_FROM | IN_MOVED_TO
+    | IN_ONLYDIR | IN_DONT_FOLLOW
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+_POLL_SECONDS = 0.1
+
+
+class InotifyUnavailable(OSError):
+    pass
+
+
+class _Inotify:
+    """Minimal ctypes binding: one inotify fd plus a wd -> directory map."""
+
+    def __init__(self) -> None:
+        if not sys.platform.startswith("linux"):
+            raise InotifyUnavailable("inotify requires Linux")
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        try:
+            self._init1 = libc.inotify_init1
+            self._add_watch = libc.inotify_add_watch
+        except AttributeError as exc:
+            raise InotifyUnavailable("libc has no inotify symbols") from exc
+        self._add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        fd = self._init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            err = ctypes.get_errno()
+            raise InotifyUnavailable(err, f"inotify_init1 failed: {os.strerror(err)}")
+        self.fd = fd
+        self.dirs: Dict[int, str] = {}
+
+    def add_watch(self, directory: str) -> None:
+        wd = self._add_watch(self.fd, os.fsencode(directory), _WATCH_MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            raise InotifyUnavailable(err, f"inotify_add_watch({directory}) failed: {os.strerror(err)}")
+        self.dirs[wd] = directory
+
+    def read(self, timeout: float):
+        """Yield ``(mask, path)`` for queued events, waiting up to ``timeout``."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return
+        try:
+            buf = os.read(self.fd, _READ_SIZE)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(buf):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            raw_name = buf[offset : offset + length].rstrip(b"\0")
+            offset += length
+            if mask & IN_IGNORED:
+                self.dirs.pop(wd, None)
+                continue
+            directory = self.dirs.get(wd)
+            if mask & IN_Q_OVERFLOW or directory is None:
+                yield mask, ""
+                continue
+            yield mask, os.path.join(directory, os.fsdecode(raw_name)) if raw_name else directory
+
+    def close(self) -> None:
+        try:
+            os.close(self.fd)
+        except OSError:
+            pass
+
+
+def _snapshot_paths(paths) -> Dict[str, _FileState]:
+    """Stat-only states for the regular files among ``paths``."""
+    states: Dict[str, _FileState] = {}
+    for path in paths:
+        try:
+            st = os.lstat(path)
+        except OSError:
+            continue
+        if stat.S_ISREG(st.st_mode):
+            states[path] = _FileState(
+                size=st.st_size, mtime_ns=st.st_mtime_ns, mode=st.st_mode, sha256=None,
+                inode=st.st_ino, ctime_ns=st.st_ctime_ns,
+            )
+    return states
+
+
+class InotifyCollector(FilesystemCollector):
+    """Filesystem collector that journals changes with inotify as they happen.
+
+    Emits ``file.journal_*`` events live (one ``file.journal_modified`` per path,
+    however many writes follow), then at finish the same ``file.created`` /
+    ``file.modified`` / ``file.deleted`` / executable events as the snapshot
+    diff, plus ``file.created_and_deleted`` for files that never survived to the
+    end of the run.
+    """
+
+    name = "filesystem"
+
+    def __init__(self, sink, workspace) -> None:
+        super().__init__(sink, workspace)
+        self._inotify: Optional[_Inotify] = None
+        self._baseline: Dict[str, _FileState] = {}
+        self._created: Set[str] = set()
+        self._modified: Set[str] = set()
+        self._attrib: Set[str] = set()
+        self._deleted: Set[str] = set()
+        self._prelaunch: Set[str] = set()
+        self._overflowed = False
+        self._recording = False
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def journaling(self) -> bool:
+        return self._inotify is not None
+
+    def setup(self) -> None:
+        try:
+            self._inotify = _Inotify()
+            for root in self.workspace.monitored_dirs:
+                self._watch_tree(str(Path(root).resolve()))
+        except OSError as exc:
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+            self.sink.record(
+                "collector.inotify_unavailable", severity="none", source="filesystem",
+                message="inotify unavailable; falling back to snapshot diff",
+                data={"reason": str(exc)},
+            )
+            super().setup()
+            return
+        self.status.status = "running"
+        # One stat-only walk: the baseline for "pre-existing" and for mode changes.
+        dirs = self.workspace.monitored_dirs
+        self._baseline = _snapshot(dirs, no_hash_roots=dirs)
+        self.sink.record(
+            "collector.inotify_started", source="filesystem",
+            message="inotify change journal armed",
+            data={"watches": len(self._inotify.dirs)},
+        )
+
+    def before_launch(self) -> None:
+        if self._inotify is None:
+            return
+        # Changes queued while other collectors set up (e.g. canary files) are
+        # not the target's: fold them into the baseline, then start journaling.
+        # This must happen before the target is spawned, or its first writes
+        # would be folded in as pre-existing files.
+        self._drain(0)
+        with self._lock:
+            prelaunch, self._prelaunch = self._prelaunch, set()
+            for path in prelaunch:
+                self._baseline.pop(path, None)
+            self._baseline.update(_snapshot_paths(prelaunch))
+            self._recording = True
+        self._thread = threading.Thread(target=self._read_loop, daemon=True)
+        self._thread.start()
+
+    def _watch_tree(self, root: str) -> None:
+        assert self._inotify is not None
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                self._inotify.add_watch(directory)
+            except OSError as exc:
+                # A subdirectory removed between listing and watching is gone,
+                # not unwatchable.
+                if exc.errno == errno.ENOENT and directory != root:
+                    continue
+                raise
+            try:
+                with os.scandir(directory) as it:
+                    stack.extend(e.path for e in it if e.is_dir(follow_symlinks=False))
+            except OSError:
+                continue
+
+    def _read_loop(self) -> None:
+        # This thread owns the fd once started: it drains what was queued
+        # between target exit and stop, then closes it.
+        assert self._inotify is not None
+        try:
+            while not self._stop.is_set():
+                self._drain(_POLL_SECONDS)
+            self._drain(0)
+        finally:
+            self._inotify.close()
+
+    def _drain(self, timeout: float) -> None:
+        assert self._inotify is not None
+        try:
+            for mask, path in self._inotify.read(timeout):
+                self._handle(mask, path)
+        except OSError as exc:
+            if exc.errno != errno.EBADF:
+                self.status.errors.append(f"inotify read error: {exc}")
+
+    def _handle(self, mask: int, path: str) -> None:
+        if mask & IN_Q_OVERFLOW or not path:
+            if not self._overflowed:
+                self._overflowed = True
+                self.status.errors.append("inotify queue overflowed; journal is incomplete, using a full walk")
+                self.sink.record(
+                    "collector.inotify_overflow", severity="low", source="filesystem",
+                    message="inotify queue overflowed; some filesystem changes were not journaled",
+                )
+            return
+        if mask & IN_ISDIR:
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                self._watch_new_dir(path)
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                self._dir_removed(path)
+            return
+        with self._lock:
+            if not self._recording:
+                self._prelaunch.add(path)
+                return
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                self._journal("created", path, self._created)
+            if mask & IN_MODIFY:
+                if path not in self._modified:
+                    self._journal("modified", path, self._modified)
+            if mask & IN_ATTRIB:
+                self._journal("permission_changed", path, self._attrib)
+            if mask & (IN_DELETE | IN_MOVED_FROM):
+                self._journal("deleted", path, self._deleted)
+
+    def _journal(self, kind: str, path: str, bucket: Set[str]) -> None:
+        bucket.add(path)
+        self.sink.record(
+            f"file.journal_{kind}", severity="none", source="filesystem",
+            message=f"inotify observed file {kind.replace('_', ' ')}",
+            file={"path": path},
+        )
+
+    def _watch_new_dir(self, directory: str) -> None:
+        # Files can land in a new directory before its watch exists; journal
+        # whatever is already there as created.
+        try:
+            self._watch_tree(directory)
+        except OSError as exc:
+            # Short-lived directories are often removed before the watch is
+            # added; their removal is journaled from the parent's events.
+            if exc.errno != errno.ENOENT:
+                self.status.errors.append(f"could not watch {directory}: {exc}")
+        for path, _st, _skip in _walk(directory, (), False):
+            self._handle(IN_CREATE, path)
+
+    def _dir_removed(self, directory: str) -> None:
+        # Moving a directory out produces no events for its files, and a
+        # delete may race the per-file events: report every file known under
+        # it that has not been journaled as deleted yet.
+        prefix = directory + os.sep
+        with self._lock:
+            known = set(self._baseline) | self._created
+            gone = sorted(p for p in known if p.startswith(prefix) and p not in self._deleted)
+        for path in gone:
+            self._handle(IN_DELETE, path)
+
+    def finish(self, launch_result) -> None:
+        if self._inotify is None:
+            super().finish(launch_result)
+            return
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=2)
+            if self._thread.is_alive():
+                # The reader still owns the fd; without its final drain the
+                # journal may be missing the last events.
+                self.status.errors.append("inotify reader did not stop; using a full walk")
+                self._overflowed = True
+        else:
+            self._drain(0)
+            self._inotify.close()
+
+        if self._overflowed:
+            before, after = self._baseline, self._walk_after()
+        else:
+            before, after = self._journal_diff()
+        self._report_diff(before, after)
+        super(FilesystemCollector, self).finish(launch_result)
+
+    def _walk_after(self) -> Dict[str, _FileState]:
+        """Full after-walk, for when the journal is incomplete (queue overflow).
+
+        Compared with the stat-only baseline; only files that are new or whose
+        size / mtime / inode changed are hashed, so unchanged files keep
+        ``sha256=None`` on both sides.
+        """
+        dirs = self.workspace.monitored_dirs
+        after = _snapshot(dirs, no_hash_roots=dirs)
+        no_hash = str(self.workspace.canary.resolve())
+        to_hash = []
+        for path, state in after.items():
+            prev = self._baseline.get(path)
+            changed = prev is None or (prev.size, prev.mtime_ns, prev.inode) != (state.size, state.mtime_ns, state.inode)
+            if changed and not (path == no_hash or path.startswith(no_hash + os.sep)):
+                to_hash.append((path, state.size))
+        if to_hash:
+            for (path, _), digest in zip(to_hash, _hash_many(to_hash)):
+                after[path] = replace(after[path], sha256=digest)
+        with self._lock:
+            created = set(self._created)
+        for path in sorted(created):
+            if path not in after and path not in self._baseline:
+                self._record_created_and_deleted(path)
+        return after
+
+    def _record_created_and_deleted(self, path: str) -> None:
+        self.sink.record(
+            "file.created_and_deleted", severity="low", source="filesystem",
+            message="File created and deleted by target during the run",
+            file={"path": path},
+        )
+
+    def _journal_diff(self):
+        """Before/after states of just the files the journal saw touched."""
+        with self._lock:
+            created, modified = set(self._created), set(self._modified)
+            touched = created | modified | self._attrib | self._deleted
+        no_hash = str(self.workspace.canary.resolve())
+        before: Dict[str, _FileState] = {p: self._baseline[p] for p in touched if p in self._baseline}
+        after: Dict[str, _FileState] = {}
+        for path in sorted(touched):
+            try:
+                st = os.lstat(path)
+            except OSError:
+                if path in created and path not in self._baseline:
+                    self._record_created_and_deleted(path)
+                continue
+            if not stat.S_ISREG(st.st_mode):
+                continue
+            # Only written or new files are read; an attrib-only change keeps
+            # sha256=None on both sides so it is not reported as a modification.
+            rehash = (path in modified or path not in self._baseline) and not (
+                path == no_hash or path.startswith(no_hash + os.sep)
+            )
+            after[path] = _FileState(
+                size=st.st_size,
+                mtime_ns=st.st_mtime_ns,
+                mode=st.st_mode,
+                sha256=_sha256(path, st.st_size) if rehash else None,
+                inode=st.st_ino,
+                ctime_ns=st.st_ctime_ns,
+            )
+        return before, after
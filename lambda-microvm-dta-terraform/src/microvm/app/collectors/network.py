@@ -5,15 +5,23 @@ observed connections. This is host-metadata evidence — it sees sockets owned b
 the network namespace, not just the target — so it is corroborating rather than
 authoritative. The strace collector provides per-process ``connect``/``socket``
 evidence, and (in AWS mode) VPC Flow Logs add the AWS-side view.
+
+Scanning is incremental: a row is only parsed the first time its socket inode
+(in a given remote address / state) is seen. New inodes are attributed to the
+target by mapping them through ``/proc/<pid>/fd`` for the target's process
+tree, so events carry a ``pid`` when the socket belongs to the target. The poll
+interval tightens while new sockets keep appearing and relaxes back to the
+configured interval when idle, never beyond it.
 """
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
+import os
 import threading
-import time
 
 from .base import Collector
+from .process import read_children
 
 _PROC_NET_FILES = {
     "tcp": Path("/proc/net/tcp"),
@@ -24,6 +32,14 @@ _PROC_NET_FILES = {
 
 # TCP state 01 == ESTABLISHED in /proc/net/tcp.
 _TCP_ESTABLISHED = "01"
+# Column index of the socket inode in /proc/net/{tcp,udp}[6] rows.
+_INODE_COL = 9
+
+# Adaptive polling: tighten towards the minimum while the target keeps opening
+# sockets, relax back to the configured poll interval while nothing changes.
+# Never slower than that interval, or short-lived connections would be missed.
+_MIN_POLL_SECONDS = 0.05
+_BACKOFF_FACTOR = 1.5
 
 
 def _parse_hex_ipv4(hexip: str) -> str:
@@ -40,6 +56,37 @@ def _parse_addr(field: str, ipv6: bool) -> Tuple[str, int]:
     return (_parse_hex_ipv4(addr), port_num)
 
 
+def _process_tree(root_pid: int) -> Set[int]:
+    """The root PID plus every descendant reachable via ``task/*/children``."""
+    tree: Set[int] = set()
+    stack = [root_pid]
+    while stack:
+        pid = stack.pop()
+        if pid in tree:
+            continue
+        tree.add(pid)
+        stack.extend(read_children(pid))
+    return tree
+
+
+def _socket_inodes(pid: int) -> List[str]:
+    """Socket inodes held open by ``pid`` (``/proc/<pid>/fd/* -> socket:[N]``)."""
+    fd_dir = f"/proc/{pid}/fd"
+    inodes: List[str] = []
+    try:
+        fds = os.listdir(fd_dir)
+    except OSError:
+        return inodes
+    for fd in fds:
+        try:
+            link = os.readlink(f"{fd_dir}/{fd}")
+        except OSError:
+            continue
+        if link.startswith("socket:["):
+            inodes.append(link[8:-1])
+    return inodes
+
+
 class NetworkCollector(Collector):
     name = "network"
 
@@ -48,47 +95,93 @@ class NetworkCollector(Collector):
         self._poll_interval = poll_interval
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
-        self._seen: Set[Tuple[str, str, int]] = set()
+        self._root_pid: Optional[int] = None
+        self._seen: Set[Tuple[str, str, int, Optional[int]]] = set()
+        # Rows already handled, keyed by (proto, inode, remote field, state):
+        # re-reading them only costs a split, never a parse.
+        self._seen_rows: Set[Tuple[str, str, str, str]] = set()
+        self._inode_pids: Dict[str, int] = {}
+        # Inodes found not to be the target's, for the current scan only:
+        # inode numbers are reused, so a later socket may well be the target's.
+        self._foreign_inodes: Set[str] = set()
         self._observed_any = False
 
     def on_target_started(self, pid: int) -> None:
         if not any(p.exists() for p in _PROC_NET_FILES.values()):
             return  # not Linux / no procfs: stay silent, finish() notes no egress
+        self._root_pid = pid
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
 
     def _poll_loop(self) -> None:
+        interval = self._poll_interval
         while not self._stop.is_set():
+            new_rows = 0
+            self._foreign_inodes.clear()
             for proto, path in _PROC_NET_FILES.items():
-                self._scan(proto, path)
-            time.sleep(self._poll_interval)
-
-    def _scan(self, proto: str, path: Path) -> None:
+                new_rows += self._scan(proto, path)
+            if new_rows:
+                interval = max(min(_MIN_POLL_SECONDS, self._poll_interval), interval / _BACKOFF_FACTOR)
+            else:
+                interval = min(self._poll_interval, interval * _BACKOFF_FACTOR)
+            self._stop.wait(interval)
+
+    def _attribute(self, inode: str) -> Optional[int]:
+        """Map a socket inode to a PID in the target's process tree, if any.
+
+        The fd tables are only walked when an unknown inode shows up; inodes
+        that turn out not to be the target's are remembered as foreign until
+        the next scan.
+        """
+        if inode in self._inode_pids:
+            return self._inode_pids[inode]
+        if self._root_pid is None or inode == "0" or inode in self._foreign_inodes:
+            return None
+        for pid in _process_tree(self._root_pid):
+            for sock in _socket_inodes(pid):
+                self._inode_pids.setdefault(sock, pid)
+        if inode not in self._inode_pids:
+            self._foreign_inodes.add(inode)
+            return None
+        return self._inode_pids[inode]
+
+    def _scan(self, proto: str, path: Path) -> int:
+        """Process rows not seen before; returns how many were new."""
         try:
             lines = path.read_text(encoding="utf-8", errors="replace").splitlines()[1:]
         except (FileNotFoundError, PermissionError, OSError):
-            return
+            return 0
         ipv6 = proto.endswith("6")
+        new_rows = 0
         for line in lines:
             cols = line.split()
-            if len(cols) < 4:
+            if len(cols) <= _INODE_COL:
+                continue
+            row_key = (proto, cols[_INODE_COL], cols[2], cols[3])
+            if row_key in self._seen_rows:
                 continue
+            self._seen_rows.add(row_key)
+            new_rows += 1
             rem_ip, rem_port = _parse_addr(cols[2], ipv6)
             state = cols[3]
             if rem_port == 0:
                 continue  # listening / unconnected
             if proto.startswith("tcp") and state != _TCP_ESTABLISHED:
                 continue
-            key = (proto, rem_ip, rem_port)
+            pid = self._attribute(cols[_INODE_COL])
+            key = (proto, rem_ip, rem_port, pid)
             if key in self._seen:
                 continue
             self._seen.add(key)
             self._observed_any = True
+            network = {"protocol": proto, "destinationIp": rem_ip, "destinationPort": rem_port,
+                       "inode": int(cols[_INODE_COL]), "attributedToTarget": pid is not None}
             self.sink.record(
                 "network.procnet_connection_observed", severity="low", source="network",
                 message="Observed an active connection via /proc/net",
-                network={"protocol": proto, "destinationIp": rem_ip, "destinationPort": rem_port},
+                pid=pid, network=network,
             )
+        return new_rows
 
     def finish(self, launch_result) -> None:
         self._stop.set()
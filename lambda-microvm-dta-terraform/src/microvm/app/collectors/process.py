@@ -1,19 +1,49 @@
 """Process collector: observes the target process tree from outside.
 
-Polls ``/proc/<pid>`` for the root PID and any observed children while the
-target runs, then records terminal events (exit / timeout / nonzero) from the
-launch result. Environment values are never recorded (only variable names), so
-canary or injected values cannot leak into the report.
+Tracks the target's whole descendant tree while it runs, then records terminal
+events (exit / timeout / nonzero) from the launch result. Environment values
+are never recorded (only variable names), so canary or injected values cannot
+leak into the report.
+
+Descendants are discovered by :class:`ProcessTree`, which reads the PPID of
+each *new* PID under ``/proc`` once per tick. Where the kernel allows it the
+tick is driven by events instead of a timer: the netlink proc connector
+reports forks as they happen (so short-lived children are not missed), and a
+pidfd on the root wakes the tracker the moment the target exits. Without
+either, polling adapts — fast while the tree is growing, slower while idle.
 """
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+import os
+import select
+import socket
+import struct
 import threading
-import time
 
 from .base import Collector
 
+# Adaptive polling bounds for the fallback (and for catching anything the
+# event source missed).
+_MIN_POLL_SECONDS = 0.02
+_MAX_POLL_SECONDS = 1.0
+_BACKOFF_FACTOR = 1.5
+
+# Netlink proc connector (linux/connector.h, linux/cn_proc.h).
+_NETLINK_CONNECTOR = 11
+_CN_IDX_PROC = 1
+_CN_VAL_PROC = 1
+_PROC_CN_MCAST_LISTEN = 1
+_PROC_EVENT_FORK = 0x00000001
+_PROC_EVENT_EXEC = 0x00000002
+_NLMSG_DONE = 3
+_NLMSG_HDR = struct.Struct("=IHHII")
+_CN_MSG_HDR = struct.Struct("=IIIIHH")
+_PROC_EVENT_HDR = struct.Struct("=IIQ")
+_FORK_EVENT = struct.Struct("=IIII")  # parent_pid, parent_tgid, child_pid, child_tgid
+_EXEC_EVENT = struct.Struct("=II")  # process_pid, process_tgid
+
 
 def _read_proc_text(pid: int, name: str) -> Optional[str]:
     try:
@@ -37,8 +67,11 @@ def _read_exe(pid: int) -> Optional[str]:
         return None
 
 
-def _read_children(pid: int) -> Set[int]:
-    """Best-effort child discovery via /proc/<pid>/task/*/children."""
+def read_children(pid: int) -> Set[int]:
+    """Best-effort child discovery via /proc/<pid>/task/*/children.
+
+    Public for other collectors that follow the target's process tree.
+    """
     children: Set[int] = set()
     task_dir = Path(f"/proc/{pid}/task")
     try:
@@ -58,6 +91,127 @@ def _read_proc_text_path(path: Path) -> Optional[str]:
         return None
 
 
+def _read_ppid(pid: int) -> Optional[int]:
+    """PPID from ``/proc/<pid>/stat``; comm may contain spaces or parens."""
+    raw = _read_proc_text(pid, "stat")
+    if raw is None:
+        return None
+    fields = raw.rpartition(")")[2].split()
+    try:
+        return int(fields[1])
+    except (IndexError, ValueError):
+        return None
+
+
+def _list_pids() -> Set[int]:
+    try:
+        return {int(name) for name in os.listdir("/proc") if name.isdigit()}
+    except OSError:
+        return set()
+
+
+class ProcessTree:
+    """Incrementally tracks every descendant of a root PID.
+
+    Each :meth:`scan` lists ``/proc`` once and reads ``stat`` only for PIDs not
+    seen on a previous scan, so the per-tick cost follows process churn rather
+    than the number of processes on the host. Members are kept after they exit
+    (and after reparenting), so depth and parent are as first observed.
+    """
+
+    def __init__(self, root_pid: int) -> None:
+        self.root_pid = root_pid
+        self.parent: Dict[int, Optional[int]] = {root_pid: None}
+        self.depth: Dict[int, int] = {root_pid: 0}
+        self._known: Set[int] = {root_pid}
+
+    def __contains__(self, pid: int) -> bool:
+        return pid in self.depth
+
+    def add(self, pid: int, ppid: int) -> bool:
+        """Attach ``pid`` under ``ppid`` if the parent is in the tree."""
+        if pid in self.depth or ppid not in self.depth:
+            return False
+        self.parent[pid] = ppid
+        self.depth[pid] = self.depth[ppid] + 1
+        return True
+
+    def scan(self) -> List[int]:
+        """One pass over ``/proc``; returns PIDs newly attached to the tree."""
+        current = _list_pids()
+        fresh = {pid: _read_ppid(pid) for pid in current - self._known}
+        self._known = current
+        added: List[int] = []
+        # Parents can be as new as their children; attach to a fixpoint.
+        pending = {pid: ppid for pid, ppid in fresh.items() if ppid is not None}
+        progress = True
+        while pending and progress:
+            progress = False
+            for pid in sorted(pending):
+                if self.add(pid, pending[pid]):
+                    added.append(pid)
+                    del pending[pid]
+                    progress = True
+                elif pending[pid] not in pending:
+                    del pending[pid]
+        return added
+
+
+class _ProcConnector:
+    """Netlink proc-connector subscription yielding fork and exec events.
+
+    Needs CAP_NET_ADMIN; construction raises ``OSError`` where it is not
+    permitted or the kernel lacks CONFIG_PROC_EVENTS.
+    """
+
+    def __init__(self) -> None:
+        self.sock = socket.socket(socket.AF_NETLINK, socket.SOCK_DGRAM, _NETLINK_CONNECTOR)
+        try:
+            self.sock.bind((0, _CN_IDX_PROC))
+            op = struct.pack("=I", _PROC_CN_MCAST_LISTEN)
+            cn = _CN_MSG_HDR.pack(_CN_IDX_PROC, _CN_VAL_PROC, 0, 0, len(op), 0)
+            nl = _NLMSG_HDR.pack(_NLMSG_HDR.size + len(cn) + len(op), _NLMSG_DONE, 0, 0, 0)
+            self.sock.send(nl + cn + op)
+            self.sock.setblocking(False)
+        except OSError:
+            self.sock.close()
+            raise
+
+    def fileno(self) -> int:
+        return self.sock.fileno()
+
+    def events(self) -> Iterator[Tuple[int, int, int]]:
+        """Drain queued messages.
+
+        Yields ``(_PROC_EVENT_FORK, child_tgid, parent_tgid)`` for new processes
+        and ``(_PROC_EVENT_EXEC, tgid, 0)`` for execs.
+        """
+        while True:
+            try:
+                data = self.sock.recv(65536)
+            except (BlockingIOError, InterruptedError):
+                return
+            offset = 0
+            while offset + _NLMSG_HDR.size <= len(data):
+                msg_len = _NLMSG_HDR.unpack_from(data, offset)[0]
+                if msg_len < _NLMSG_HDR.size:
+                    break
+                body = offset + _NLMSG_HDR.size + _CN_MSG_HDR.size
+                payload = body + _PROC_EVENT_HDR.size
+                if payload + _FORK_EVENT.size <= offset + msg_len:
+                    what = _PROC_EVENT_HDR.unpack_from(data, body)[0]
+                    if what == _PROC_EVENT_FORK:
+                        _ppid, ptgid, cpid, ctgid = _FORK_EVENT.unpack_from(data, payload)
+                        if cpid == ctgid:  # new process, not a new thread
+                            yield _PROC_EVENT_FORK, ctgid, ptgid
+                    elif what == _PROC_EVENT_EXEC:
+                        yield _PROC_EVENT_EXEC, _EXEC_EVENT.unpack_from(data, payload)[1], 0
+                offset += (msg_len + 3) & ~3
+
+    def close(self) -> None:
+        self.sock.close()
+
+
 class ProcessCollector(Collector):
     name = "process"
 
@@ -67,7 +221,8 @@ class ProcessCollector(Collector):
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._root_pid: Optional[int] = None
-        self._seen_children: Set[int] = set()
+        self._tree: Optional[ProcessTree] = None
+        self._event_source = "poll"
 
     def on_target_started(self, pid: int) -> None:
         self._root_pid = pid
@@ -85,26 +240,97 @@ class ProcessCollector(Collector):
 
     def _poll_loop(self, root_pid: int) -> None:
         # /proc is Linux-only; on other platforms this simply observes nothing.
-        proc_available = Path("/proc").is_dir()
-        while not self._stop.is_set():
-            if proc_available:
-                for child in _read_children(root_pid):
-                    if child not in self._seen_children:
-                        self._seen_children.add(child)
-                        self.sink.record(
-                            "process.child_observed",
-                            severity="low",
-                            source="process",
-                            message="Observed a child process spawned by the target",
-                            pid=child,
-                            process={"argv": _read_cmdline(child), "exe": _read_exe(child)},
-                        )
-            time.sleep(self._poll_interval)
+        if not Path("/proc").is_dir():
+            return
+        tree = self._tree = ProcessTree(root_pid)
+        connector: Optional[_ProcConnector] = None
+        pidfd: Optional[int] = None
+        try:
+            connector = _ProcConnector()
+            self._event_source = "netlink"
+        except (OSError, AttributeError):
+            connector = None
+        try:
+            pidfd = os.pidfd_open(root_pid)
+            if connector is None:
+                self._event_source = "pidfd"
+        except (OSError, AttributeError):
+            pidfd = None
+        wake = [f for f in (connector.fileno() if connector else None, pidfd) if f is not None]
+
+        interval = self._poll_interval
+        # Forked children are recorded at their exec (so argv is the new
+        # program's) or, if they never exec, on the following wake-up.
+        deferred: Set[int] = set()
+        try:
+            while not self._stop.is_set():
+                grew = False
+                for child in sorted(deferred):
+                    self._record_child(child)
+                deferred = set()
+                if connector is not None:
+                    for what, pid, parent in connector.events():
+                        if what == _PROC_EVENT_FORK and tree.add(pid, parent):
+                            deferred.add(pid)
+                            grew = True
+                        elif what == _PROC_EVENT_EXEC and pid in deferred:
+                            deferred.discard(pid)
+                            self._record_child(pid)
+                for child in tree.scan():
+                    self._record_child(child)
+                    grew = True
+                if pidfd is not None and select.select([pidfd], [], [], 0)[0]:
+                    # Root exited: one last scan catches reparented stragglers.
+                    for child in tree.scan():
+                        self._record_child(child)
+                    break
+                if grew:
+                    interval = max(_MIN_POLL_SECONDS, interval / _BACKOFF_FACTOR)
+                else:
+                    interval = min(_MAX_POLL_SECONDS, interval * _BACKOFF_FACTOR)
+                if wake:
+                    select.select(wake, [], [], interval)
+                else:
+                    self._stop.wait(interval)
+        finally:
+            for child in sorted(deferred):
+                self._record_child(child)
+            if connector is not None:
+                connector.close()
+            if pidfd is not None:
+                os.close(pidfd)
+
+    def _record_child(self, child: int) -> None:
+        assert self._tree is not None
+        self.sink.record(
+            "process.child_observed",
+            severity="low",
+            source="process",
+            message="Observed a child process spawned by the target",
+            pid=child,
+            process={
+                "argv": _read_cmdline(child),
+                "exe": _read_exe(child),
+                "parentPid": self._tree.parent.get(child),
+                "depth": self._tree.depth.get(child),
+            },
+        )
 
     def finish(self, launch_result) -> None:
         self._stop.set()
         if self._thread is not None:
             self._thread.join(timeout=2)
+        if self._tree is not None:
+            self.sink.record(
+                "process.tree_summary", source="process",
+                message="Target process tree tracked",
+                pid=self._root_pid,
+                data={
+                    "descendants": len(self._tree.depth) - 1,
+                    "maxDepth": max(self._tree.depth.values()),
+                    "eventSource": self._event_source,
+                },
+            )
 
         lr = launch_result
         self.sink.record(
@@ -5,6 +5,12 @@ target is its child — user-space syscall tracing via ptrace, no eBPF/Tracee/
 Falco required. After the target exits, the per-PID strace logs are parsed into
 normalized syscall events and kept as raw artifacts.
 
+In live mode the per-PID logs are tailed while the target runs instead: each
+file's read offset is remembered, only complete lines are consumed (a
+partially written line waits for the next pass), and new data is parsed on a
+process pool with events emitted into the sink as they arrive. Parse latency
+then overlaps the target's runtime rather than landing after it exits.
+
 Limitations (documented in the support boundary): strace adds runtime overhead,
 can miss anti-debugging targets, and is not a high-performance production
 sensor. It is appropriate for CI DTA-style analysis where the supervisor
@@ -12,14 +18,23 @@ launches the target.
 """
 from __future__ import annotations
 
+from concurrent.futures import Executor, ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+import multiprocessing
+import os
 import re
 import shutil
+import subprocess
+import threading
 
 from .base import Collector
 
 _STRACE_CLASSES = "process,file,network,signal"
+# --seccomp-bpf (strace >= 5.3) makes the kernel stop only on traced syscalls
+_SECCOMP_BPF_MIN_VERSION = (5, 3)
+_VERSION_RE = re.compile(r"version (\d+)\.(\d+)")
 
 # Syscalls we normalize. Mapping: syscall name -> (event type, severity).
 _SYSCALL_EVENTS: Dict[str, tuple[str, str]] = {
@@ -73,15 +88,171 @@ _CONNECT_PORT_RE = re.compile(r"sin_port=htons\((?P<port>\d+)\)")
 _CONNECT6_ADDR_RE = re.compile(r'inet_pton\([^,]+,\s*"(?P<ip>[0-9a-fA-F:]+)"')
 _FIRST_STR_ARG_RE = re.compile(r'"((?:[^"\\]|\\.)*)"')
 
+# Live tailing: how often trace files are polled, the most bytes taken from one
+# file per pass, and the size below which a chunk is parsed inline because a
+# process-pool round trip would cost more than the parse itself.
+_TAIL_INTERVAL_SECONDS = 0.25
+_TAIL_MAX_READ_BYTES = 8 * 1024 * 1024
+_POOL_MIN_CHUNK_BYTES = 64 * 1024
+
+# A parsed syscall ready to emit: (event_type, severity, call, pid, sections).
+ParsedSyscall = Tuple[str, str, str, Optional[int], Dict[str, Any]]
+
+
+def syscall_name(line: str) -> str:
+    """Cheaply extract the syscall name from an strace line, without regex.
+
+    Returns the token immediately before the first ``(`` once the optional
+    ``[pid N]`` prefix and ``-ttt`` timestamp are skipped — the same token
+    ``_LINE_RE`` would capture as ``call`` — or ``""`` when there is none.
+    """
+    if line.startswith("[pid"):
+        close = line.find("]")
+        if close == -1:
+            return ""
+        line = line[close + 1 :]
+    paren = line.find("(")
+    if paren <= 0:
+        return ""
+    head = line[:paren].split()
+    return head[-1] if head else ""
+
+
+def parse_trace_text(text: str, pid: Optional[int], calls: Optional[FrozenSet[str]] = None) -> List[ParsedSyscall]:
+    """Parse strace output into emit-ready records.
+
+    Pure and module-level so it can run in a process-pool worker; the sink is
+    only touched by the collector in the supervisor process. Most traced lines
+    are calls we never normalize (``read``, ``mmap``, ``close`` ...), so the
+    syscall name is checked first and only lines for mapped ``calls`` (default:
+    every call in ``_SYSCALL_EVENTS``) pay for the full regex.
+    """
+    wanted = _SYSCALL_EVENTS.keys() if calls is None else calls
+    records: List[ParsedSyscall] = []
+    for line in text.splitlines():
+        if syscall_name(line) not in wanted:
+            continue
+        m = _LINE_RE.match(line)
+        if not m:
+            continue
+        call = m.group("call")
+        event_type, severity = _SYSCALL_EVENTS[call]
+        line_pid = int(m.group("pid")) if m.group("pid") else pid
+        records.append((event_type, severity, call, line_pid, _syscall_sections(call, m.group("args"))))
+    return records
+
+
+def _syscall_sections(call: str, args: str) -> Dict[str, Any]:
+    sections: Dict[str, Any] = {"process": {"syscall": call}, "network": None, "file": None}
+    parser = _ARG_PARSERS.get(call)
+    if parser is not None:
+        parser(args, sections)
+    return sections
+
+
+def _execve_sections(args: str, sections: Dict[str, Any]) -> None:
+    argv = _parse_execve_argv(args)
+    if argv:
+        sections["process"]["argv"] = argv
+
+
+def _path_sections(args: str, sections: Dict[str, Any]) -> None:
+    # openat's first string is often the dirfd symbol; take the last path-looking string
+    paths = _FIRST_STR_ARG_RE.findall(args)
+    if paths and paths[-1]:
+        sections["file"] = {"path": paths[-1]}
+
+
+def _connect_sections(args: str, sections: Dict[str, Any]) -> None:
+    sections["network"] = _parse_connect(args)
+
+
+# Argument parsing is per call: everything else emits only the syscall name.
+_ARG_PARSERS = {
+    "execve": _execve_sections,
+    "execveat": _execve_sections,
+    "open": _path_sections,
+    "openat": _path_sections,
+    "creat": _path_sections,
+    "unlink": _path_sections,
+    "unlinkat": _path_sections,
+    "chmod": _path_sections,
+    "chown": _path_sections,
+    "connect": _connect_sections,
+    "sendto": _connect_sections,
+}
+
+
+def trace_calls_for_event_types(event_types: Iterable[str]) -> FrozenSet[str]:
+    """The syscalls whose normalized events are in ``event_types``."""
+    wanted = set(event_types)
+    return frozenset(call for call, (event_type, _) in _SYSCALL_EVENTS.items() if event_type in wanted)
+
+
+def _strace_version(strace_path: str) -> Tuple[int, int]:
+    try:
+        out = subprocess.run(
+            [strace_path, "-V"], capture_output=True, text=True, timeout=5, check=False
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return (0, 0)
+    match = _VERSION_RE.search(out)
+    return (int(match.group(1)), int(match.group(2))) if match else (0, 0)
+
+
+def _parse_execve_argv(args: str) -> Optional[List[str]]:
+    # execve("/path", ["a", "b"], 0x...) -> capture the bracketed list
+    start = args.find("[")
+    end = args.find("]", start)
+    if start == -1 or end == -1:
+        return None
+    inner = args[start + 1 : end]
+    return [m.group(1) for m in _FIRST_STR_ARG_RE.finditer(inner)] or None
+
+
+def _parse_connect(args: str) -> Optional[Dict[str, object]]:
+    ip_m = _CONNECT_ADDR_RE.search(args)
+    port_m = _CONNECT_PORT_RE.search(args)
+    ip6_m = _CONNECT6_ADDR_RE.search(args)
+    info: Dict[str, object] = {}
+    if ip_m:
+        info["destinationIp"] = ip_m.group("ip")
+    elif ip6_m:
+        info["destinationIp"] = ip6_m.group("ip")
+    if port_m:
+        info["destinationPort"] = int(port_m.group("port"))
+    return info or None
+
 
 class StraceCollector(Collector):
     name = "strace"
 
-    def __init__(self, sink, workspace, fail_closed: bool = True) -> None:
+    def __init__(
+        self,
+        sink,
+        workspace,
+        fail_closed: bool = True,
+        live: bool = False,
+        parse_workers: int = 0,
+        trace_calls: Optional[Iterable[str]] = None,
+    ) -> None:
         super().__init__(sink, workspace)
         self._fail_closed = fail_closed
         self._trace_dir = workspace.artifacts / "strace"
         self._strace_path: Optional[str] = None
+        self._seccomp_bpf = False
+        self._live = live
+        # A narrower ``-e trace=`` set (e.g. derived from the loaded rules);
+        # None traces _STRACE_CLASSES. It only cuts ptrace stops inside the
+        # target when strace supports --seccomp-bpf; otherwise strace still
+        # stops on every syscall and just filters its output.
+        self._trace_calls: Optional[FrozenSet[str]] = frozenset(trace_calls) if trace_calls else None
+        self._parse_workers = parse_workers or (os.cpu_count() or 1)
+        self._offsets: Dict[Path, int] = {}
+        self._event_count = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._pool: Optional[Executor] = None
 
     @staticmethod
     def is_available() -> bool:
@@ -98,6 +269,7 @@ class StraceCollector(Collector):
                 message="strace is not available; syscall evidence will be missing",
             )
             return
+        self._seccomp_bpf = _strace_version(self._strace_path) >= _SECCOMP_BPF_MIN_VERSION
         self.sink.record("collector.strace_started", source="strace", message="strace collector armed")
 
     @property
@@ -105,20 +277,41 @@ class StraceCollector(Collector):
         if self._strace_path is None:
             return None
         trace_prefix = str(self._trace_dir / "trace")
-        return [
+        wrapper = [
             self._strace_path,
             "-ff",
             "-ttt",
             "-s", "256",
             "-o", trace_prefix,
-            "-e", f"trace={_STRACE_CLASSES}",
-            "--",
         ]
+        if self._trace_calls:
+            # "?" lets strace skip names this architecture lacks (e.g. open,
+            # creat, fork, chmod on aarch64) instead of refusing to start.
+            trace_expr = ",".join(f"?{call}" for call in sorted(self._trace_calls))
+            if self._seccomp_bpf:
+                wrapper.append("--seccomp-bpf")
+        else:
+            trace_expr = _STRACE_CLASSES
+        return wrapper + ["-e", f"trace={trace_expr}", "--"]
 
     @property
     def available(self) -> bool:
         return self._strace_path is not None
 
+    def on_target_started(self, pid: int) -> None:
+        if not self._live or self._strace_path is None:
+            return
+        self._thread = threading.Thread(target=self._tail_loop, daemon=True)
+        self._thread.start()
+
+    def _tail_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._tail_pass(final=False)
+            except Exception as exc:  # keep tailing; finish() drains the rest
+                self.status.errors.append(f"live parse error: {exc}")
+            self._stop.wait(_TAIL_INTERVAL_SECONDS)
+
     def finish(self, launch_result) -> None:
         if self._strace_path is None:
             # already recorded failure in setup
@@ -126,23 +319,34 @@ class StraceCollector(Collector):
                 self.fail("strace unavailable")
             super().finish(launch_result)
             return
-        trace_files = sorted(self._trace_dir.glob("trace.*"))
-        if not trace_files:
-            self.fail("strace produced no trace files")
-            self.sink.record(
-                "collector.strace_failed", severity="medium", source="strace",
-                message="strace produced no output",
-            )
-            super().finish(launch_result)
-            return
-        total = 0
-        for tf in trace_files:
-            pid = self._pid_from_filename(tf)
-            total += self._parse_file(tf, pid)
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        try:
+            trace_files = sorted(self._trace_dir.glob("trace.*"))
+            if not trace_files:
+                self.fail("strace produced no trace files")
+                self.sink.record(
+                    "collector.strace_failed", severity="medium", source="strace",
+                    message="strace produced no output",
+                )
+                super().finish(launch_result)
+                return
+            # Live mode only has the unread tail left; batch mode parses everything.
+            self._tail_pass(final=True)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
         self.sink.record(
             "collector.strace_completed", source="strace",
             message="strace parsing complete",
-            data={"files": len(trace_files), "events": total},
+            data={
+                "files": len(trace_files),
+                "events": self._event_count,
+                "live": self._live,
+                "traceCalls": sorted(self._trace_calls) if self._trace_calls else _STRACE_CLASSES,
+            },
         )
         super().finish(launch_result)
 
@@ -151,73 +355,58 @@ class StraceCollector(Collector):
         suffix = path.name.rsplit(".", 1)[-1]
         return int(suffix) if suffix.isdigit() else None
 
-    def _parse_file(self, path: Path, pid: Optional[int]) -> int:
-        count = 0
+    def _tail_pass(self, *, final: bool) -> None:
+        """Parse whatever each trace file gained since the last pass.
+
+        Until ``final`` only complete lines are consumed, so a line strace is
+        still writing is re-read whole on the next pass.
+        """
+        chunks: List[Tuple[str, Optional[int]]] = []
+        for path in sorted(self._trace_dir.glob("trace.*")):
+            text = self._read_new(path, final=final)
+            if text:
+                chunks.append((text, self._pid_from_filename(path)))
+        if not chunks:
+            return
+        big = sum(1 for text, _ in chunks if len(text) >= _POOL_MIN_CHUNK_BYTES)
+        if big > 1 and self._parse_workers > 1:
+            texts, pids = zip(*chunks)
+            results = self._get_pool().map(parse_trace_text, texts, pids, repeat(self._trace_calls))
+        else:
+            results = (parse_trace_text(text, pid, self._trace_calls) for text, pid in chunks)
+        for records in results:
+            for record in records:
+                self._emit(record)
+
+    def _get_pool(self) -> Executor:
+        if self._pool is None:
+            # spawn, not fork: the supervisor is multi-threaded by now.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self._parse_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._pool
+
+    def _read_new(self, path: Path, *, final: bool) -> str:
+        offset = self._offsets.get(path, 0)
         try:
-            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+            with open(path, "rb") as f:
+                f.seek(offset)
+                data = f.read(-1 if final else _TAIL_MAX_READ_BYTES)
         except OSError as exc:
             self.status.errors.append(f"could not read {path}: {exc}")
-            return 0
-        for line in lines:
-            m = _LINE_RE.match(line)
-            if not m:
-                continue
-            call = m.group("call")
-            mapping = _SYSCALL_EVENTS.get(call)
-            if mapping is None:
-                continue
-            event_type, severity = mapping
-            args = m.group("args")
-            line_pid = int(m.group("pid")) if m.group("pid") else pid
-            self._emit(event_type, severity, call, args, line_pid)
-            count += 1
-        return count
-
-    def _emit(self, event_type: str, severity: str, call: str, args: str, pid: Optional[int]) -> None:
-        process: Dict[str, object] = {"syscall": call}
-        network: Optional[Dict[str, object]] = None
-        file_info: Optional[Dict[str, object]] = None
-
-        if call in ("execve", "execveat"):
-            argv = self._parse_execve_argv(args)
-            if argv:
-                process["argv"] = argv
-        elif call in ("open", "openat", "creat", "unlink", "unlinkat", "chmod", "chown"):
-            sm = _FIRST_STR_ARG_RE.search(args)
-            # openat's first string is often the dirfd symbol; take the last path-looking string
-            paths = _FIRST_STR_ARG_RE.findall(args)
-            path_val = paths[-1] if paths else (sm.group(1) if sm else None)
-            if path_val:
-                file_info = {"path": path_val}
-        elif call in ("connect", "sendto"):
-            network = self._parse_connect(args)
+            return ""
+        if not final:
+            end = data.rfind(b"\n")
+            data = data[: end + 1] if end != -1 else b""
+        self._offsets[path] = offset + len(data)
+        return data.decode("utf-8", errors="replace")
 
+    def _emit(self, record: ParsedSyscall) -> None:
+        event_type, severity, call, pid, sections = record
         self.sink.record(
             event_type, severity=severity, source="strace",
             message=f"strace observed {call}()",
-            pid=pid, process=process, network=network, file=file_info,
+            pid=pid, **sections,
         )
-
-    @staticmethod
-    def _parse_execve_argv(args: str) -> Optional[List[str]]:
-        # execve("/path", ["a", "b"], 0x...) -> capture the bracketed list
-        start = args.find("[")
-        end = args.find("]", start)
-        if start == -1 or end == -1:
-            return None
-        inner = args[start + 1 : end]
-        return [m.group(1) for m in _FIRST_STR_ARG_RE.finditer(inner)] or None
-
-    @staticmethod
-    def _parse_connect(args: str) -> Optional[Dict[str, object]]:
-        ip_m = _CONNECT_ADDR_RE.search(args)
-        port_m = _CONNECT_PORT_RE.search(args)
-        ip6_m = _CONNECT6_ADDR_RE.search(args)
-        info: Dict[str, object] = {}
-        if ip_m:
-            info["destinationIp"] = ip_m.group("ip")
-        elif ip6_m:
-            info["destinationIp"] = ip6_m.group("ip")
-        if port_m:
-            info["destinationPort"] = int(port_m.group("port"))
-        return info or None
+        self._event_count += 1
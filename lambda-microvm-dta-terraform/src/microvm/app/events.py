@@ -4,14 +4,21 @@ Collectors observe the target from *outside* the target process and emit
 normalized events. Events are written to ``events.jsonl`` (one JSON object per
 line) and consumed by the rule engine. This module deliberately uses only the
 standard library.
+
+For chatty targets the sink can spill to disk: events are written as
+time-ordered chunk files once an in-memory budget is reached, and the final
+``events.jsonl`` is produced by a k-way merge of those chunks, so memory stays
+bounded regardless of how many events the collectors emit.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+import heapq
 import json
+import shutil
 import threading
 
 SEVERITY_ORDER = {
@@ -83,22 +90,79 @@ class Event:
             out["message"] = self.message
         return out
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Event":
+        return cls(
+            type=str(data["type"]),
+            severity=str(data.get("severity", "none")),
+            source=str(data.get("source", "supervisor")),
+            message=str(data.get("message", "")),
+            timestamp=str(data.get("timestamp", "")),
+            pid=data.get("pid"),
+            process=data.get("process"),
+            file=data.get("file"),
+            network=data.get("network"),
+            canary=data.get("canary"),
+            data=dict(data.get("data") or {}),
+        )
+
+
+def _event_line(event: Event) -> str:
+    return json.dumps(event.to_dict(), sort_keys=True)
+
+
+def _timestamp_key(event: Event) -> str:
+    return event.timestamp
+
+
+def iter_jsonl(path: str | Path) -> Iterator[Event]:
+    """Stream events back from an ``events.jsonl`` (or spill chunk) file."""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield Event.from_dict(json.loads(line))
+
 
 class EventSink:
     """Thread-safe collector for normalized events.
 
     Collectors may run concurrently (e.g. the process poller while strace
-    writes), so appends are guarded by a lock. Events are buffered in memory and
-    flushed to ``events.jsonl`` once via :meth:`write_jsonl`.
+    writes), so appends are guarded by a lock. By default events are buffered in
+    memory and flushed to ``events.jsonl`` once via :meth:`write_jsonl`.
+
+    With ``spill_dir`` set, at most ``max_buffered_events`` events are held in
+    memory; each time the buffer fills it is sorted and written to a chunk file
+    in ``spill_dir``. :meth:`write_jsonl` then k-way merges the chunks. The
+    merge is stable, so the output is identical to the in-memory mode.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, spill_dir: str | Path | None = None, max_buffered_events: int = 100_000) -> None:
+        if max_buffered_events <= 0:
+            raise ValueError("max_buffered_events must be > 0")
         self._lock = threading.Lock()
         self._events: List[Event] = []
+        self._spill_dir = Path(spill_dir) if spill_dir is not None else None
+        self._max_buffered = max_buffered_events
+        self._chunks: List[Path] = []
+        self._count = 0
+
+    @property
+    def spilling(self) -> bool:
+        return self._spill_dir is not None
+
+    @property
+    def count(self) -> int:
+        """Total events emitted, including any already spilled to disk."""
+        with self._lock:
+            return self._count
 
     def emit(self, event: Event) -> None:
         with self._lock:
             self._events.append(event)
+            self._count += 1
+            if self._spill_dir is not None and len(self._events) >= self._max_buffered:
+                self._spill_locked()
 
     def record(self, type: str, severity: str = "none", source: str = "supervisor", message: str = "", **sections: Any) -> Event:
         """Convenience for building and emitting an event.
@@ -111,16 +175,55 @@ class EventSink:
         self.emit(event)
         return event
 
-    def events(self) -> List[Event]:
+    def _spill_locked(self) -> None:
+        assert self._spill_dir is not None
+        self._spill_dir.mkdir(parents=True, exist_ok=True)
+        chunk = self._spill_dir / f"chunk-{len(self._chunks):05d}.jsonl"
+        with open(chunk, "w", encoding="utf-8") as f:
+            for event in sorted(self._events, key=_timestamp_key):
+                f.write(_event_line(event) + "\n")
+        self._chunks.append(chunk)
+        self._events = []
+
+    def iter_events(self) -> Iterator[Event]:
+        """Stream every event in emission order (spilled chunks, then buffer).
+
+        Chunk files are immutable once written, so only the snapshot is taken
+        under the lock and emitters are never blocked by the read-back.
+        """
+        with self._lock:
+            chunks = list(self._chunks)
+            buffered = list(self._events)
+        for chunk in chunks:
+            yield from iter_jsonl(chunk)
+        yield from buffered
+
+    def iter_sorted(self) -> Iterator[Event]:
+        """Stream every event ordered by timestamp via a k-way merge."""
         with self._lock:
-            return list(self._events)
+            chunks = list(self._chunks)
+            buffered = sorted(self._events, key=_timestamp_key)
+        if not chunks:
+            return iter(buffered)
+        return heapq.merge(*(iter_jsonl(c) for c in chunks), buffered, key=_timestamp_key)
+
+    def events(self) -> List[Event]:
+        return list(self.iter_events())
 
     def sorted_events(self) -> List[Event]:
-        return sorted(self.events(), key=lambda e: e.timestamp)
+        return list(self.iter_sorted())
 
     def write_jsonl(self, path: str | Path) -> Path:
         out = Path(path)
         out.parent.mkdir(parents=True, exist_ok=True)
-        lines = [json.dumps(e.to_dict(), sort_keys=True) for e in self.sorted_events()]
-        out.write_text("\n".join(lines) + ("\n" if lines else ""), encoding="utf-8")
+        with open(out, "w", encoding="utf-8") as f:
+            for event in self.iter_sorted():
+                f.write(_event_line(event) + "\n")
         return out
+
+    def discard_spill(self) -> None:
+        """Remove spilled chunk files once ``events.jsonl`` has been written."""
+        with self._lock:
+            self._chunks = []
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
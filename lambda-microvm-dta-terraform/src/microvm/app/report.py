@@ -5,7 +5,7 @@ collector statuses, rule evaluation, and policy result.
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 import os
 import platform
 import uuid
@@ -25,19 +25,29 @@ def build_report(
     microvm_id: Optional[str],
     image_identifier: Optional[str],
     target: Dict[str, Any],
-    events: List[Event],
+    events: Iterable[Event],
     collector_statuses: List[Dict[str, Any]],
     evaluation: Evaluation,
     policy_result: PolicyResult,
     policy_config: Dict[str, Any],
     include_evidence: bool = True,
+    event_count: Optional[int] = None,
 ) -> Dict[str, Any]:
+    """Build the report dict.
+
+    ``events`` may be a stream (e.g. read back from a spilled ``events.jsonl``);
+    it is only materialized when ``include_evidence`` is set. Pass
+    ``event_count`` when the events are not being materialized.
+    """
+    evidence = [e.to_dict() for e in events] if include_evidence else []
+    if event_count is None:
+        event_count = len(evidence) if include_evidence else sum(1 for _ in events)
     collector_error_count = sum(1 for c in collector_statuses if c.get("status") == "failed")
     summary = {
         "status": policy_result.status,
         "verdict": evaluation.verdict,
         "maxSeverity": evaluation.max_severity,
-        "eventCount": len(events),
+        "eventCount": event_count,
         "matchedRuleCount": len(evaluation.matches),
         "collectorErrorCount": collector_error_count,
     }
@@ -58,7 +68,7 @@ def build_report(
         "summary": summary,
         "collectors": collector_statuses,
         "matchedRules": [m.to_dict() for m in evaluation.matches],
-        "evidence": [e.to_dict() for e in events] if include_evidence else [],
+        "evidence": evidence,
         "policy": {
             "failOnSeverity": policy_config.get("failOnSeverity", "high"),
             "failOnPolicyViolation": policy_config.get("failOnPolicyViolation", True),
@@ -9,7 +9,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
 import json
 
 from .events import Event, SEVERITY_ORDER, max_severity, severity_gte
@@ -139,22 +139,76 @@ def load_rules(path: str | Path) -> List[Rule]:
     return parse_rules(data)
 
 
-def evaluate_events(events: List[Event], rules: List[Rule]) -> Evaluation:
+class CompiledRuleSet:
+    """Rules pre-indexed for evaluation against large event streams.
+
+    ``Rule.matches`` is fine for a handful of events, but strace runs produce
+    hundreds of thousands of syscall events and the nested event × rule loop
+    dominates post-run time. The compiled set indexes rules by event type and
+    pre-builds each rule's ``argvContainsAny`` token set, so an event only meets
+    the rules that can match it and its argv is normalized at most once.
+
+    Matching is exactly equivalent to ``Rule.matches``: rules for an event are
+    returned in their declared order, so ``RuleMatch`` output is unchanged.
+    """
+
+    def __init__(self, rules: List[Rule]) -> None:
+        self.rules = list(rules)
+        self._by_type: Dict[str, List[Tuple[Rule, Optional[FrozenSet[str]]]]] = {}
+        for rule in self.rules:
+            tokens = frozenset(rule.argv_contains_any) if rule.argv_contains_any else None
+            # dict.fromkeys de-duplicates repeated eventTypeAny entries so a rule
+            # still matches an event at most once.
+            for event_type in dict.fromkeys(rule.event_types):
+                self._by_type.setdefault(event_type, []).append((rule, tokens))
+
+    @property
+    def event_types(self) -> FrozenSet[str]:
+        return frozenset(self._by_type)
+
+    def matching_rules(self, event: Event) -> List[Rule]:
+        candidates = self._by_type.get(event.type)
+        if not candidates:
+            return []
+        argv_tokens: Optional[FrozenSet[str]] = None
+        matched: List[Rule] = []
+        for rule, tokens in candidates:
+            if tokens is not None:
+                if argv_tokens is None:
+                    argv_tokens = _argv_tokens(event)
+                if tokens.isdisjoint(argv_tokens):
+                    continue
+            matched.append(rule)
+        return matched
+
+
+def _argv_tokens(event: Event) -> FrozenSet[str]:
+    argv = (event.process or {}).get("argv") or []
+    if not isinstance(argv, list):
+        return frozenset()
+    return frozenset(str(a) for a in argv)
+
+
+def compile_rules(rules: List[Rule] | CompiledRuleSet) -> CompiledRuleSet:
+    return rules if isinstance(rules, CompiledRuleSet) else CompiledRuleSet(rules)
+
+
+def evaluate_events(events: Iterable[Event], rules: List[Rule] | CompiledRuleSet) -> Evaluation:
+    compiled = compile_rules(rules)
     matches: List[RuleMatch] = []
     for event in events:
-        for rule in rules:
-            if rule.matches(event):
-                matches.append(
-                    RuleMatch(
-                        rule_id=rule.id,
-                        name=rule.name,
-                        severity=rule.severity,
-                        verdict=rule.verdict,
-                        event_type=event.type,
-                        event_timestamp=event.timestamp,
-                        message=event.message,
-                    )
+        for rule in compiled.matching_rules(event):
+            matches.append(
+                RuleMatch(
+                    rule_id=rule.id,
+                    name=rule.name,
+                    severity=rule.severity,
+                    verdict=rule.verdict,
+                    event_type=event.type,
+                    event_timestamp=event.timestamp,
+                    message=event.message,
                 )
+            )
     if matches:
         verdict = max((m.verdict for m in matches), key=lambda v: _VERDICT_RANK.get(v, 0))
         sev = max_severity(m.severity for m in matches)
@@ -4,14 +4,23 @@ Exposes the analysis lifecycle and result artifacts over the authenticated
 MicroVM endpoint. The supervisor receives a target config (via POST body or the
 run hook payload), runs the analysis through :mod:`app.supervisor`, and serves
 report.json, events.jsonl, and artifacts.
+
+Files are streamed (``sendfile`` where the socket supports it) rather than read
+into memory, and honor single-range ``Range`` / ``If-Range`` requests so an
+interrupted download can resume. ``events.jsonl`` is also offered with
+``Content-Encoding: gzip`` when the client asks for it; the compressed copy is
+built once and then served (and ranged) like any other file.
 """
 from __future__ import annotations
 
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
+import gzip
 import json
 import os
+import re
+import shutil
 import threading
 import traceback
 
@@ -44,12 +53,96 @@ def _json_response(handler: BaseHTTPRequestHandler, status: int, payload: Dict[s
     handler.wfile.write(body)
 
 
-def _bytes_response(handler: BaseHTTPRequestHandler, status: int, body: bytes, content_type: str) -> None:
-    handler.send_response(status)
-    handler.send_header("Content-Type", content_type)
-    handler.send_header("Content-Length", str(len(body)))
-    handler.end_headers()
-    handler.wfile.write(body)
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+_gzip_lock = threading.Lock()
+
+
+def _etag(st: os.stat_result) -> str:
+    return f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+
+
+def _parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """Resolve a single ``bytes=`` range to inclusive ``(start, end)``.
+
+    Returns None for an absent or unsupported (e.g. multi-range) header, which
+    is served as a full 200 response; raises ValueError when unsatisfiable.
+    """
+    if not header:
+        return None
+    m = _RANGE_RE.match(header.strip())
+    if not m:
+        return None
+    first, last = m.group(1), m.group(2)
+    if not first and not last:
+        return None
+    if not first:  # suffix range: the final N bytes
+        length = int(last)
+        if length == 0:
+            raise ValueError("empty suffix range")
+        return (max(0, size - length), size - 1)
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise ValueError("range not satisfiable")
+    return (start, end)
+
+
+def _gzip_copy(path: Path) -> Path:
+    """Compress ``path`` once to ``<path>.gz`` (rebuilt if the source changes)."""
+    gz = path.with_name(path.name + ".gz")
+    with _gzip_lock:
+        if not gz.is_file() or gz.stat().st_mtime_ns < path.stat().st_mtime_ns:
+            tmp = gz.with_name(gz.name + ".tmp")
+            with open(path, "rb") as src, gzip.open(tmp, "wb", compresslevel=6) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+            os.replace(tmp, gz)
+    return gz
+
+
+def _file_response(
+    handler: BaseHTTPRequestHandler,
+    path: Path,
+    content_type: str,
+    *,
+    allow_gzip: bool = False,
+) -> None:
+    """Stream ``path`` to the client with Range and optional gzip support."""
+    encoding = None
+    accept = handler.headers.get("Accept-Encoding") or ""
+    if allow_gzip and "gzip" in accept.lower():
+        path = _gzip_copy(path)
+        encoding = "gzip"
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        size = st.st_size
+        etag = _etag(st)
+        range_header = handler.headers.get("Range")
+        if_range = handler.headers.get("If-Range")
+        if if_range and if_range != etag:
+            range_header = None  # representation changed: send it whole
+        try:
+            byte_range = _parse_range(range_header, size)
+        except ValueError:
+            handler.send_response(416)
+            handler.send_header("Content-Range", f"bytes */{size}")
+            handler.send_header("Content-Length", "0")
+            handler.end_headers()
+            return
+        start, end = byte_range if byte_range else (0, size - 1)
+        length = max(0, end - start + 1)
+        handler.send_response(206 if byte_range else 200)
+        handler.send_header("Content-Type", content_type)
+        handler.send_header("Content-Length", str(length))
+        handler.send_header("Accept-Ranges", "bytes")
+        handler.send_header("ETag", etag)
+        if encoding:
+            handler.send_header("Content-Encoding", encoding)
+        if byte_range:
+            handler.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        handler.end_headers()
+        if length:
+            # socket.sendfile uses os.sendfile where available, else a send loop.
+            handler.connection.sendfile(f, offset=start, count=length)
 
 
 def _read_json(handler: BaseHTTPRequestHandler) -> Dict[str, Any]:
@@ -145,11 +238,11 @@ class Handler(BaseHTTPRequestHandler):
             _json_response(self, 404, {"error": "events not ready"})
             return
         try:
-            body = Path(result.events_path).read_bytes()
+            _file_response(self, Path(result.events_path), "application/x-ndjson", allow_gzip=True)
+        except (BrokenPipeError, ConnectionResetError):
+            return  # client went away mid-download; it can resume with Range
         except OSError as exc:
             _json_response(self, 500, {"error": str(exc)})
-            return
-        _bytes_response(self, 200, body, "application/x-ndjson")
 
     def _serve_artifact(self, name: str) -> None:
         with _state_lock:
@@ -168,7 +261,12 @@ class Handler(BaseHTTPRequestHandler):
         if not target.is_file():
             _json_response(self, 404, {"error": "artifact not found", "name": name})
             return
-        _bytes_response(self, 200, target.read_bytes(), "application/octet-stream")
+        try:
+            _file_response(self, target, "application/octet-stream")
+        except (BrokenPipeError, ConnectionResetError):
+            return  # client went away mid-download; it can resume with Range
+        except OSError as exc:
+            _json_response(self, 500, {"error": str(exc)})
 
     # --- POST ---
     def do_POST(self) -> None:  # noqa: N802
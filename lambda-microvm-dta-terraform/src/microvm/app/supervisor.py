@@ -3,7 +3,8 @@
 Flow:
   1. prepare workspace, materialize the (untrusted) target
   2. construct enabled collectors; canary presents fake assets
-  3. start collectors (pre-launch snapshots / arming)
+  3. start collectors (pre-launch snapshots / arming), then let them settle
+     with before_launch once all are set up
   4. launch the target as a child, optionally wrapped by strace; collectors
      observe via the on_started hook
   5. stop collectors, normalize events to events.jsonl
@@ -15,21 +16,23 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 import json
+import time
 
-from .events import EventSink, utc_now
+from .events import Event, EventSink, iter_jsonl, utc_now
 from .launcher import build_child_env, launch_target
 from .report import build_report
-from .rules import apply_policy, evaluate_events, load_rules
+from .rules import apply_policy, compile_rules, evaluate_events, load_rules
 from .target_config import AnalysisConfig
 from .workspace import materialize_target, prepare_workspace
 
 from .collectors.process import ProcessCollector
 from .collectors.filesystem import FilesystemCollector
+from .collectors.inotify import InotifyCollector
 from .collectors.canary import CanaryCollector
 from .collectors.network import NetworkCollector
-from .collectors.strace_collector import StraceCollector
+from .collectors.strace_collector import StraceCollector, trace_calls_for_event_types
 
 
 @dataclass
@@ -54,7 +57,13 @@ def run_analysis(
     image_identifier: Optional[str] = None,
 ) -> AnalysisResult:
     ws = prepare_workspace(root)
-    sink = EventSink()
+    if config.events.spill_to_disk:
+        sink = EventSink(
+            spill_dir=ws.artifacts / "events-spill",
+            max_buffered_events=config.events.max_buffered_events,
+        )
+    else:
+        sink = EventSink()
 
     # Build collectors per config. Canary is constructed first so its env can be
     # merged into the target environment.
@@ -63,14 +72,30 @@ def run_analysis(
     if config.collectors.process:
         collectors.append(ProcessCollector(sink, ws))
     if config.collectors.filesystem:
-        collectors.append(FilesystemCollector(sink, ws))
+        fs_cls = InotifyCollector if config.collectors.filesystem_inotify else FilesystemCollector
+        collectors.append(fs_cls(sink, ws))
     if canary is not None:
         collectors.append(canary)
     if config.collectors.network_procnet:
         collectors.append(NetworkCollector(sink, ws))
+    rules = None
     strace: Optional[StraceCollector] = None
     if config.collectors.strace:
-        strace = StraceCollector(sink, ws, fail_closed=config.policy.fail_closed)
+        trace_calls = None
+        if config.collectors.strace_trace_scope == "rules":
+            rules = compile_rules(load_rules(rules_file))
+            needed = set(rules.event_types)
+            if canary is not None:
+                needed.add("syscall.file_open")  # high-confidence canary reads
+            # An empty set would be an invalid -e trace=; keep the default classes.
+            trace_calls = trace_calls_for_event_types(needed) or None
+        strace = StraceCollector(
+            sink, ws,
+            fail_closed=config.policy.fail_closed,
+            live=config.collectors.strace_live,
+            parse_workers=config.collectors.strace_parse_workers,
+            trace_calls=trace_calls,
+        )
         collectors.append(strace)
 
     target_error = False
@@ -86,12 +111,17 @@ def run_analysis(
         sink.record("target.materialization_failed", severity="medium", source="supervisor",
                     message=f"Could not materialize target: {exc}")
 
+    # Per-collector setup/finish wall time, reported in run-metadata.json.
+    collector_timings: Dict[str, Dict[str, float]] = {c.name: {} for c in collectors}
+
     # Pre-launch setup for all collectors.
     for c in collectors:
+        started = time.monotonic()
         try:
             c.setup()
         except Exception as exc:  # a collector setup failure must not crash the run
             c.fail(f"setup error: {exc}")
+        collector_timings[c.name]["setupSeconds"] = round(time.monotonic() - started, 4)
 
     launch_result = None
     if not target_error:
@@ -105,6 +135,12 @@ def run_analysis(
 
         wrapper = strace.strace_wrapper if (strace is not None and strace.available) else None
 
+        for c in collectors:
+            try:
+                c.before_launch()
+            except Exception as exc:
+                c.fail(f"before_launch error: {exc}")
+
         def on_started(pid: int) -> None:
             for c in collectors:
                 try:
@@ -142,16 +178,29 @@ def run_analysis(
         key=lambda c: 0 if isinstance(c, StraceCollector) else (2 if isinstance(c, CanaryCollector) else 1),
     )
     for c in finish_order:
+        started = time.monotonic()
         try:
             c.finish(launch_result)
         except Exception as exc:
             c.fail(f"finish error: {exc}")
+        collector_timings[c.name]["finishSeconds"] = round(time.monotonic() - started, 4)
 
-    events = sink.sorted_events()
+    # In spill mode the events never exist as one list: events.jsonl is
+    # produced by a k-way merge and the rule engine streams it back from disk.
+    events: Iterable[Event]
     events_path = sink.write_jsonl(ws.root / "events.jsonl")
+    event_count = sink.count
+    if sink.spilling:
+        sink.discard_spill()
+        events = ()
+        rule_input: Iterable[Event] = iter_jsonl(events_path)
+    else:
+        events = sink.sorted_events()
+        rule_input = events
 
-    rules = load_rules(rules_file)
-    evaluation = evaluate_events(events, rules)
+    if rules is None:
+        rules = compile_rules(load_rules(rules_file))
+    evaluation = evaluate_events(rule_input, rules)
     collector_statuses = [c.status.to_dict() for c in collectors]
     collector_errors = sum(1 for s in collector_statuses if s["status"] == "failed")
 
@@ -173,6 +222,8 @@ def run_analysis(
         image_identifier=image_identifier,
         target=target_meta,
         events=events,
+        event_count=event_count,
+        include_evidence=not sink.spilling,
         collector_statuses=collector_statuses,
         evaluation=evaluation,
         policy_result=policy_result,
@@ -201,6 +252,7 @@ def run_analysis(
             "stderr": "artifacts/stderr.log",
             "straceDir": "artifacts/strace",
         },
+        "collectorTimings": collector_timings,
         "cloudwatch": {},
     }
     metadata_path = ws.root / "run-metadata.json"
@@ -46,8 +46,18 @@ class TargetSpec:
 class CollectorsSpec:
     process: bool = True
     filesystem: bool = True
+    # Journal changes with inotify while the target runs (Linux); the
+    # before/after snapshot diff remains the fallback.
+    filesystem_inotify: bool = False
     canary: bool = True
     strace: bool = False
+    # Tail and parse strace logs while the target runs (vs. after it exits).
+    strace_live: bool = False
+    # Process-pool size for parsing per-PID trace files; 0 means os.cpu_count().
+    strace_parse_workers: int = 0
+    # "classes" traces the default syscall classes; "rules" narrows -e trace=
+    # to the syscalls the loaded rules (and canary detection) actually need.
+    strace_trace_scope: str = "classes"
     network_procnet: bool = True
     network_vpc_flow_logs: bool = False
 
@@ -59,11 +69,20 @@ class PolicySpec:
     fail_closed: bool = True
 
 
+@dataclass(frozen=True)
+class EventsSpec:
+    # Spill events to time-ordered chunk files instead of holding them all in
+    # memory; events.jsonl is then produced by a k-way merge.
+    spill_to_disk: bool = False
+    max_buffered_events: int = 100_000
+
+
 @dataclass(frozen=True)
 class AnalysisConfig:
     target: TargetSpec
     collectors: CollectorsSpec
     policy: PolicySpec
+    events: EventsSpec = field(default_factory=EventsSpec)
     raw: Dict[str, Any] = field(default_factory=dict)
 
 
@@ -216,18 +235,38 @@ def parse_target_config(data: Dict[str, Any], *, allow_shell_strings: bool = Fal
 
     collectors = _parse_collectors(data.get("collectors") or {})
     policy = _parse_policy(data.get("policy") or {})
-    return AnalysisConfig(target=target, collectors=collectors, policy=policy, raw=data)
+    events = _parse_events(data.get("events") or {})
+    return AnalysisConfig(target=target, collectors=collectors, policy=policy, events=events, raw=data)
 
 
 def _parse_collectors(raw: Dict[str, Any]) -> CollectorsSpec:
     network = raw.get("network") or {}
     if not isinstance(network, dict):
         network = {}
+    # ``filesystem`` is either a bool or a mapping: {enabled, inotify}.
+    filesystem = raw.get("filesystem", True)
+    filesystem_opts: Dict[str, Any] = filesystem if isinstance(filesystem, dict) else {"enabled": filesystem}
+    # ``strace`` is either a bool or a mapping: {enabled, live, parseWorkers}.
+    strace = raw.get("strace", False)
+    strace_opts: Dict[str, Any] = strace if isinstance(strace, dict) else {"enabled": strace}
+    try:
+        parse_workers = int(strace_opts.get("parseWorkers", 0))
+    except (TypeError, ValueError):
+        raise TargetConfigError("collectors.strace.parseWorkers must be an integer")
+    if parse_workers < 0:
+        raise TargetConfigError("collectors.strace.parseWorkers must be >= 0")
+    trace_scope = str(strace_opts.get("traceScope", "classes"))
+    if trace_scope not in {"classes", "rules"}:
+        raise TargetConfigError(f"collectors.strace.traceScope must be 'classes' or 'rules', got {trace_scope!r}")
     return CollectorsSpec(
         process=bool(raw.get("process", True)),
-        filesystem=bool(raw.get("filesystem", True)),
+        filesystem=bool(filesystem_opts.get("enabled", True)),
+        filesystem_inotify=bool(filesystem_opts.get("inotify", False)),
         canary=bool(raw.get("canary", True)),
-        strace=bool(raw.get("strace", False)),
+        strace=bool(strace_opts.get("enabled", True)),
+        strace_live=bool(strace_opts.get("live", False)),
+        strace_parse_workers=parse_workers,
+        strace_trace_scope=trace_scope,
         network_procnet=bool(network.get("procNet", True)),
         network_vpc_flow_logs=bool(network.get("vpcFlowLogs", False)),
     )
@@ -239,3 +278,16 @@ def _parse_policy(raw: Dict[str, Any]) -> PolicySpec:
         fail_on_policy_violation=bool(raw.get("failOnPolicyViolation", True)),
         fail_closed=bool(raw.get("failClosed", True)),
     )
+
+
+def _parse_events(raw: Dict[str, Any]) -> EventsSpec:
+    if not isinstance(raw, dict):
+        raise TargetConfigError("events must be a mapping")
+    budget = raw.get("maxBufferedEvents", 100_000)
+    try:
+        budget = int(budget)
+    except (TypeError, ValueError):
+        raise TargetConfigError("events.maxBufferedEvents must be an integer")
+    if budget <= 0:
+        raise TargetConfigError("events.maxBufferedEvents must be > 0")
+    return EventsSpec(spill_to_disk=bool(raw.get("spillToDisk", False)), max_buffered_events=budget)
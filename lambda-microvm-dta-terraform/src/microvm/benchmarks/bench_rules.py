@@ -0,0 +1,118 @@
+"""Benchmark: compiled rule set vs. the nested event × rule loop.
+
+Generates a synthetic strace-heavy event stream and a large rule pack, checks
+that both evaluators produce identical ``RuleMatch`` output, and prints timings.
+
+    python benchmarks/bench_rules.py --events 200000 --rules 120
+"""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import List
+import argparse
+import random
+import sys
+import time
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.events import Event  # noqa: E402
+from app.rules import Evaluation, Rule, RuleMatch, compile_rules, evaluate_events, max_severity  # noqa: E402
+from app.rules import _VERDICT_RANK  # noqa: E402
+
+_SYSCALL_TYPES = [
+    "syscall.execve", "syscall.clone", "syscall.file_open", "syscall.file_delete",
+    "syscall.file_write_path", "syscall.socket", "syscall.connect", "syscall.mprotect",
+]
+_OTHER_TYPES = ["file.created", "file.modified", "process.child_observed", "network.procnet_connection_observed"]
+_ARGV_POOL = ["/bin/sh", "sh", "bash", "python3", "-c", "curl", "wget", "ls", "/usr/bin/env", "echo", "hi"]
+
+
+def _nested_loop(events: List[Event], rules: List[Rule]) -> Evaluation:
+    """The pre-compiled-rule-set evaluator, kept verbatim as the baseline."""
+    matches: List[RuleMatch] = []
+    for event in events:
+        for rule in rules:
+            if rule.matches(event):
+                matches.append(
+                    RuleMatch(
+                        rule_id=rule.id,
+                        name=rule.name,
+                        severity=rule.severity,
+                        verdict=rule.verdict,
+                        event_type=event.type,
+                        event_timestamp=event.timestamp,
+                        message=event.message,
+                    )
+                )
+    if matches:
+        verdict = max((m.verdict for m in matches), key=lambda v: _VERDICT_RANK.get(v, 0))
+        sev = max_severity(m.severity for m in matches)
+    else:
+        verdict = "clean"
+        sev = "none"
+    return Evaluation(matches=matches, verdict=verdict, max_severity=sev)
+
+
+def _make_rules(n: int, rng: random.Random) -> List[Rule]:
+    types = _SYSCALL_TYPES + _OTHER_TYPES + [f"custom.type_{i}" for i in range(n)]
+    rules: List[Rule] = []
+    for i in range(n):
+        event_types = rng.sample(types, k=rng.randint(1, 3))
+        argv = rng.sample(_ARGV_POOL, k=rng.randint(1, 3)) if rng.random() < 0.3 else []
+        rules.append(Rule(
+            id=f"B{i:03d}", name=f"bench-rule-{i}",
+            severity=rng.choice(["low", "medium", "high"]),
+            verdict=rng.choice(["suspicious", "unknown", "policy_violation"]),
+            event_types=event_types, argv_contains_any=argv,
+        ))
+    return rules
+
+
+def _make_events(n: int, rng: random.Random) -> List[Event]:
+    events: List[Event] = []
+    for i in range(n):
+        etype = rng.choice(_SYSCALL_TYPES) if rng.random() < 0.9 else rng.choice(_OTHER_TYPES)
+        process = {"syscall": "x"}
+        if etype == "syscall.execve":
+            process["argv"] = rng.sample(_ARGV_POOL, k=rng.randint(1, 4))
+        events.append(Event(type=etype, source="strace", message=f"e{i}", timestamp=f"{i:012d}", process=process))
+    return events
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=200_000)
+    parser.add_argument("--rules", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    rules = _make_rules(args.rules, rng)
+    events = _make_events(args.events, rng)
+
+    baseline, t_loop = _timed(_nested_loop, events, rules)
+    compiled, t_compile = _timed(compile_rules, rules)
+    result, t_eval = _timed(evaluate_events, events, compiled)
+
+    same = (
+        [m.to_dict() for m in baseline.matches] == [m.to_dict() for m in result.matches]
+        and baseline.verdict == result.verdict
+        and baseline.max_severity == result.max_severity
+    )
+    print(f"events={len(events)} rules={len(rules)} matches={len(result.matches)} identical={same}")
+    print(f"nested loop : {t_loop:8.3f}s")
+    print(f"compiled    : {t_eval:8.3f}s (+{t_compile * 1000:.2f}ms compile)")
+    if t_eval > 0:
+        print(f"speedup     : {t_loop / t_eval:8.1f}x")
+    return 0 if same else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set
 import argparse
 import json
 import os
 import sys
+import threading
 import time
 
-from .aws_cli import AwsCli, AwsCliError
+from .aws_cli import AwsCli, AwsCliError, sleep_with_backoff
 from .evaluate import evaluate_report
-from .http_client import request_json
+from .http_client import download_file, request_json
 from .local import run_local_analysis
 from .packaging import package_microvm
 
@@ -181,24 +183,135 @@ def cmd_wait_image(args: argparse.Namespace) -> int:
     return 1
 
 
-def _wait_microvm_running(aws: AwsCli, microvm_id: str, timeout_seconds: int, poll_seconds: int) -> Dict[str, Any]:
+_MICROVM_TERMINAL_STATES = {"FAILED", "TERMINATED"}
+
+
+def _check_microvm_state(microvm_id: str, resp: Dict[str, Any]) -> bool:
+    """True once RUNNING; raises if the MicroVM reached a terminal state."""
+    state = str(resp.get("state"))
+    if state in _MICROVM_TERMINAL_STATES:
+        raise RuntimeError(f"MicroVM {microvm_id} entered terminal state {state}: {resp}")
+    return state == "RUNNING"
+
+
+def _wait_microvm_running(
+    aws: AwsCli,
+    microvm_id: str,
+    timeout_seconds: int,
+    poll_seconds: float,
+    max_poll_seconds: float = 30.0,
+) -> Dict[str, Any]:
+    """Poll get-microvm until RUNNING, backing off from poll_seconds to max_poll_seconds."""
     deadline = time.monotonic() + timeout_seconds
     last: Dict[str, Any] = {}
+    attempt = 0
     while time.monotonic() < deadline:
         resp = aws.microvms(["get-microvm", "--microvm-identifier", microvm_id])
         if not isinstance(resp, dict):
             raise RuntimeError("Unexpected non-JSON response")
         last = resp
-        state = str(resp.get("state"))
-        print(f"microvm state={state}", file=sys.stderr)
-        if state == "RUNNING":
+        print(f"microvm state={resp.get('state')}", file=sys.stderr)
+        if _check_microvm_state(microvm_id, resp):
             return resp
-        if state in {"FAILED", "TERMINATED"}:
-            raise RuntimeError(f"MicroVM entered terminal state {state}: {resp}")
-        time.sleep(poll_seconds)
+        attempt += 1
+        sleep_with_backoff(attempt, base=poll_seconds, cap=max(poll_seconds, max_poll_seconds))
     raise TimeoutError(f"Timed out waiting for MicroVM to RUNNING. Last response: {last}")
 
 
+class _MicrovmStatePoller:
+    """Shared RUNNING-waiter for many MicroVMs launched at once.
+
+    One background thread answers every waiter with a single ``list-microvms``
+    call per round (``get-microvm`` only for ids the listing does not contain),
+    instead of each launch polling ``get-microvm`` on its own. The interval
+    starts at ``poll_seconds``, doubles up to ``max_poll_seconds`` and resets
+    whenever a new MicroVM starts waiting, since fresh launches are the ones
+    about to change state. If the poller thread dies, the error is recorded
+    and every waiter falls back to polling ``get-microvm`` on its own.
+    """
+
+    def __init__(self, aws: AwsCli, poll_seconds: float, max_poll_seconds: float) -> None:
+        self._aws = aws
+        self._initial = poll_seconds
+        self._max = max(poll_seconds, max_poll_seconds)
+        self._delay = poll_seconds
+        self._cond = threading.Condition()
+        self._waiting: Set[str] = set()
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def wait_running(self, microvm_id: str, timeout_seconds: int) -> Dict[str, Any]:
+        deadline = time.monotonic() + timeout_seconds
+        with self._cond:
+            self._waiting.add(microvm_id)
+            self._delay = self._initial
+            if self._thread is None and self._error is None:
+                self._thread = threading.Thread(target=self._poll_loop, daemon=True)
+                self._thread.start()
+            self._cond.notify_all()  # cut the poller's current back-off short
+            try:
+                while self._error is None:
+                    resp = self._states.get(microvm_id)
+                    if resp is not None and _check_microvm_state(microvm_id, resp):
+                        return resp
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"Timed out waiting for MicroVM {microvm_id} to RUNNING. Last response: {resp}")
+                    self._cond.wait(remaining)
+            finally:
+                self._waiting.discard(microvm_id)
+        remaining = max(0, int(deadline - time.monotonic()))
+        return _wait_microvm_running(self._aws, microvm_id, remaining, self._initial, self._max)
+
+    def _poll_loop(self) -> None:
+        try:
+            while True:
+                with self._cond:
+                    ids = set(self._waiting)
+                    if not ids:
+                        self._thread = None
+                        return
+                states = self._poll(ids)
+                with self._cond:
+                    for mid, resp in states.items():
+                        previous = self._states.get(mid, {}).get("state")
+                        if resp.get("state") != previous:
+                            print(f"microvm {mid} state={resp.get('state')}", file=sys.stderr)
+                    self._states.update(states)
+                    self._cond.notify_all()
+                    delay = self._delay
+                    self._delay = min(self._max, delay * 2)
+                    self._cond.wait(delay)
+        except Exception as exc:  # noqa: BLE001 - waiters fall back to get-microvm
+            print(f"WARNING: MicroVM state poller failed, polling individually: {exc!r}", file=sys.stderr)
+            with self._cond:
+                self._error = exc
+                self._thread = None
+                self._cond.notify_all()
+
+    def _poll(self, ids: Set[str]) -> Dict[str, Dict[str, Any]]:
+        states: Dict[str, Dict[str, Any]] = {}
+        try:
+            resp = self._aws.microvms(["list-microvms"])
+            items = resp.get("items", resp.get("microvms", [])) if isinstance(resp, dict) else []
+            for item in items:
+                mid = str(item.get("microvmId") or item.get("microVmId") or "")
+                if mid in ids:
+                    states[mid] = item
+        except (AwsCliError, AttributeError, TypeError) as exc:
+            print(f"WARNING: list-microvms failed, polling individually: {exc}", file=sys.stderr)
+        for mid in ids - states.keys():
+            try:
+                resp = self._aws.microvms(["get-microvm", "--microvm-identifier", mid])
+            except AwsCliError as exc:
+                print(f"WARNING: get-microvm {mid} failed: {exc}", file=sys.stderr)
+                continue
+            if isinstance(resp, dict):
+                states[mid] = resp
+        return states
+
+
 def _extract_token(auth_resp: Dict[str, Any]) -> str:
     token_obj = auth_resp.get("authToken")
     if isinstance(token_obj, dict) and "X-aws-proxy-auth" in token_obj:
@@ -211,14 +324,15 @@ def _extract_token(auth_resp: Dict[str, Any]) -> str:
     )
 
 
-def _build_run_hook_payload(args: argparse.Namespace) -> Optional[str]:
+def _build_run_hook_payload(args: argparse.Namespace, target_config: Optional[str] = None) -> Optional[str]:
     payload: Dict[str, Any] = {}
     if args.correlation_id:
         payload["correlationId"] = args.correlation_id
     if args.commit_sha:
         payload["commitSha"] = args.commit_sha
-    if getattr(args, "target_config", None):
-        payload["targetConfig"] = json.loads(_target_config_as_json(args.target_config))
+    target_config = target_config or getattr(args, "target_config", None)
+    if target_config:
+        payload["targetConfig"] = json.loads(_target_config_as_json(target_config))
     return json.dumps(payload) if payload else None
 
 
@@ -239,6 +353,22 @@ def cmd_run(args: argparse.Namespace) -> int:
     """
     _require_aws_mode(args)
     aws = _aws(args)
+    resp = aws.microvms(_run_microvm_args(args))
+    if aws.dry_print:
+        aws.microvms(["get-microvm", "--microvm-identifier", "<microvmId>"])
+        print("print-only: skipped live run")
+        return 0
+    if not isinstance(resp, dict):
+        raise RuntimeError("Unexpected non-JSON response from run-microvm")
+    microvm_id = str(resp["microvmId"])
+    endpoint = str(resp["endpoint"])
+    _wait_microvm_running(aws, microvm_id, args.wait_timeout_seconds, args.poll_seconds, args.max_poll_seconds)
+    _print_json({"microvmId": microvm_id, "endpoint": endpoint})
+    return 0
+
+
+def _run_microvm_args(args: argparse.Namespace, target_config: Optional[str] = None) -> List[str]:
+    """The run-microvm CLI arguments shared by ``run`` and ``run-many``."""
     region = _region_of(args)
     ingress = args.ingress_network_connector or DEFAULT_INGRESS.format(region=region)
     egress = args.egress_network_connector or DEFAULT_INTERNET_EGRESS.format(region=region)
@@ -260,21 +390,10 @@ def cmd_run(args: argparse.Namespace) -> int:
         run_args.extend(["--image-version", args.image_version])
     if args.execution_role_arn:
         run_args.extend(["--execution-role-arn", args.execution_role_arn])
-    payload = _build_run_hook_payload(args)
+    payload = _build_run_hook_payload(args, target_config)
     if payload:
         run_args.extend(["--run-hook-payload", payload])
-    resp = aws.microvms(run_args)
-    if aws.dry_print:
-        aws.microvms(["get-microvm", "--microvm-identifier", "<microvmId>"])
-        print("print-only: skipped live run")
-        return 0
-    if not isinstance(resp, dict):
-        raise RuntimeError("Unexpected non-JSON response from run-microvm")
-    microvm_id = str(resp["microvmId"])
-    endpoint = str(resp["endpoint"])
-    _wait_microvm_running(aws, microvm_id, args.wait_timeout_seconds, args.poll_seconds)
-    _print_json({"microvmId": microvm_id, "endpoint": endpoint})
-    return 0
+    return run_args
 
 
 def _endpoint_session(aws: AwsCli, microvm_id: str, port: int, token_minutes: int):
@@ -290,34 +409,67 @@ def _endpoint_session(aws: AwsCli, microvm_id: str, port: int, token_minutes: in
     return f"https://{endpoint}", token
 
 
+def _start_analysis_body(args: argparse.Namespace, target_config: Optional[str] = None) -> Dict[str, Any]:
+    body: Dict[str, Any] = {"correlationId": args.correlation_id, "commitSha": args.commit_sha}
+    target_config = target_config or getattr(args, "target_config", None)
+    if target_config:
+        body["targetConfig"] = json.loads(_target_config_as_json(target_config))
+    return body
+
+
 def cmd_start_analysis(args: argparse.Namespace) -> int:
     _require_aws_mode(args)
     aws = _aws(args)
     base_url, token = _endpoint_session(aws, args.microvm_identifier, args.port, args.token_expiration_minutes)
-    body: Dict[str, Any] = {"correlationId": args.correlation_id, "commitSha": args.commit_sha}
-    if getattr(args, "target_config", None):
-        body["targetConfig"] = json.loads(_target_config_as_json(args.target_config))
+    body = _start_analysis_body(args)
     resp = request_json("POST", f"{base_url}/analysis/start", token=token, port=args.port, payload=body, retries=3)
     _print_json(resp)
     return 0
 
 
-def cmd_fetch_results(args: argparse.Namespace) -> int:
-    _require_aws_mode(args)
-    aws = _aws(args)
-    base_url, token = _endpoint_session(aws, args.microvm_identifier, args.port, args.token_expiration_minutes)
-    out_dir = Path(args.output_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
+def _check_artifact_names(names: List[str]) -> None:
+    for name in names:
+        if Path(name).is_absolute() or ".." in Path(name).parts:
+            raise SystemExit(f"--artifact must be a relative path inside the analysis root: {name}")
 
-    report = request_json("GET", f"{base_url}/analysis/report", token=token, port=args.port, retries=5)
 
-    # events.jsonl and named artifacts are best-effort.
-    for name, path in (("events.jsonl", "/analysis/events"),):
+def _download_results(
+    base_url: str,
+    token: str,
+    port: int,
+    out_dir: Path,
+    *,
+    gzip_events: bool,
+    artifacts: List[str],
+) -> Dict[str, Any]:
+    """Fetch the report and stream events.jsonl (plus named artifacts) into out_dir."""
+    out_dir.mkdir(parents=True, exist_ok=True)
+    report = request_json("GET", f"{base_url}/analysis/report", token=token, port=port, retries=5)
+
+    # events.jsonl and named artifacts are best-effort. They are streamed to
+    # disk and resume with HTTP Range if the transfer is interrupted.
+    downloads = [("events.jsonl", "/analysis/events", gzip_events)]
+    downloads += [(name, f"/analysis/artifacts/{name}", False) for name in artifacts]
+    for name, path, accept_gzip in downloads:
         try:
-            raw = request_json("GET", f"{base_url}{path}", token=token, port=args.port, retries=3, raw=True)
-            (out_dir / name).write_bytes(raw)
+            download_file(
+                f"{base_url}{path}", out_dir / name,
+                token=token, port=port, retries=5, accept_gzip=accept_gzip,
+            )
         except Exception as exc:  # noqa: BLE001
             print(f"WARNING: could not fetch {name}: {exc}", file=sys.stderr)
+    return report
+
+
+def cmd_fetch_results(args: argparse.Namespace) -> int:
+    _require_aws_mode(args)
+    _check_artifact_names(args.artifact)
+    aws = _aws(args)
+    base_url, token = _endpoint_session(aws, args.microvm_identifier, args.port, args.token_expiration_minutes)
+    out_dir = Path(args.output_dir)
+    report = _download_results(
+        base_url, token, args.port, out_dir, gzip_events=args.gzip_events, artifacts=args.artifact,
+    )
 
     # Optional VPC Flow Logs correlation (post-processing metadata, never fatal).
     if getattr(args, "flow_log_group", None):
@@ -346,6 +498,139 @@ def cmd_fetch_results(args: argparse.Namespace) -> int:
     return 1
 
 
+def _target_names(target_configs: List[str]) -> List[str]:
+    """Unique, filesystem-safe names (config file stems) for per-target output dirs."""
+    names: List[str] = []
+    seen: Dict[str, int] = {}
+    for config in target_configs:
+        stem = "".join(c if c.isalnum() or c in "-_." else "_" for c in Path(config).stem) or "target"
+        seen[stem] = seen.get(stem, 0) + 1
+        names.append(stem if seen[stem] == 1 else f"{stem}-{seen[stem]}")
+    return names
+
+
+def _analyze_target(
+    args: argparse.Namespace,
+    aws: AwsCli,
+    poller: _MicrovmStatePoller,
+    name: str,
+    target_config: str,
+    out_dir: Path,
+) -> Dict[str, Any]:
+    """Run one target end to end on its own MicroVM; never raises.
+
+    Returns the per-target entry of the run-many summary. The MicroVM is
+    terminated in ``finally`` unless --keep-microvms is set.
+    """
+    result: Dict[str, Any] = {"name": name, "targetConfig": target_config, "outputDir": str(out_dir)}
+    timings: Dict[str, float] = {}
+    started = time.monotonic()
+    microvm_id: Optional[str] = None
+
+    def lap(key: str, since: float) -> float:
+        now = time.monotonic()
+        timings[key] = round(now - since, 3)
+        return now
+
+    try:
+        resp = aws.microvms(_run_microvm_args(args, target_config))
+        if not isinstance(resp, dict):
+            raise RuntimeError("Unexpected non-JSON response from run-microvm")
+        microvm_id = str(resp["microvmId"])
+        result["microvmId"] = microvm_id
+        print(f"[{name}] launched {microvm_id}", file=sys.stderr)
+        poller.wait_running(microvm_id, args.wait_timeout_seconds)
+        mark = lap("launchSeconds", started)
+
+        base_url, token = _endpoint_session(aws, microvm_id, args.port, args.token_expiration_minutes)
+        request_json(
+            "POST", f"{base_url}/analysis/start", token=token, port=args.port,
+            payload=_start_analysis_body(args, target_config),
+            timeout=args.analysis_timeout_seconds, retries=3,
+        )
+        mark = lap("analysisSeconds", mark)
+
+        report = _download_results(
+            base_url, token, args.port, out_dir, gzip_events=args.gzip_events, artifacts=args.artifact,
+        )
+        (out_dir / "report.json").write_text(json.dumps(report, indent=2, sort_keys=True), encoding="utf-8")
+        lap("fetchSeconds", mark)
+
+        ok, reasons = evaluate_report(
+            report, fail_on_severity=args.fail_on_severity, fail_on_policy_violation=args.fail_on_policy_violation,
+        )
+        summary = report.get("summary") or {}
+        result.update({
+            "status": summary.get("status"),
+            "verdict": summary.get("verdict"),
+            "maxSeverity": summary.get("maxSeverity"),
+            "policy": "passed" if ok else "failed",
+            "reasons": reasons,
+        })
+    except Exception as exc:  # noqa: BLE001 - one bad target must not sink the batch
+        result.update({"status": "error", "policy": "failed", "error": f"{exc.__class__.__name__}: {exc}"})
+    finally:
+        if microvm_id and not args.keep_microvms:
+            try:
+                aws.microvms(["terminate-microvm", "--microvm-identifier", microvm_id])
+            except AwsCliError as exc:
+                print(f"WARNING: failed to terminate {microvm_id}: {exc}", file=sys.stderr)
+        lap("totalSeconds", started)
+        result["timings"] = timings
+    print(f"[{name}] policy={result['policy']} verdict={result.get('verdict')} "
+          f"in {timings['totalSeconds']:.1f}s", file=sys.stderr)
+    return result
+
+
+def cmd_run_many(args: argparse.Namespace) -> int:
+    """Analyze several targets, each on its own MicroVM, concurrently.
+
+    Writes <output-dir>/<name>/report.json per target and a merged
+    <output-dir>/summary.json with per-target verdicts and timings.
+    """
+    _require_aws_mode(args)
+    _check_artifact_names(args.artifact)
+    aws = _aws(args)
+    names = _target_names(args.targets)
+    if aws.dry_print:
+        for config in args.targets:
+            aws.microvms(_run_microvm_args(args, config))
+        print(f"print-only: skipped {len(args.targets)} live run(s)")
+        return 0
+
+    out_root = Path(args.output_dir)
+    poller = _MicrovmStatePoller(aws, args.poll_seconds, args.max_poll_seconds)
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, args.max_concurrency), thread_name_prefix="run-many") as pool:
+        futures = [
+            pool.submit(_analyze_target, args, aws, poller, name, config, out_root / name)
+            for name, config in zip(names, args.targets)
+        ]
+        results = [f.result() for f in futures]
+    wall_clock = round(time.monotonic() - started, 3)
+
+    counts: Dict[str, int] = {}
+    for result in results:
+        counts[result["policy"]] = counts.get(result["policy"], 0) + 1
+    merged = {
+        "targets": results,
+        "counts": counts,
+        "maxConcurrency": args.max_concurrency,
+        "wallClockSeconds": wall_clock,
+        "sumOfTargetSeconds": round(sum(r["timings"]["totalSeconds"] for r in results), 3),
+        "policy": "passed" if all(r["policy"] == "passed" for r in results) else "failed",
+    }
+    out_root.mkdir(parents=True, exist_ok=True)
+    (out_root / "summary.json").write_text(json.dumps(merged, indent=2, sort_keys=True), encoding="utf-8")
+    _print_json({k: v for k, v in merged.items() if k != "targets"})
+    for result in results:
+        if result["policy"] != "passed":
+            detail = result.get("error") or "; ".join(result.get("reasons", []))
+            print(f"- {result['name']}: {detail}")
+    print(f"summary written to {out_root/'summary.json'}")
+    return 0 if merged["policy"] == "passed" else 1
+
+
 def cmd_terminate(args: argparse.Namespace) -> int:
     _require_aws_mode(args)
     aws = _aws(args)
@@ -382,6 +667,31 @@ def _add_aws_safety_flags(p: argparse.ArgumentParser) -> None:
     p.add_argument("--print-only", action="store_true", help="Print the planned AWS CLI calls without executing")
 
 
+def _add_run_microvm_flags(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--profile-mode", choices=["public", "production"], default="public")
+    p.add_argument("--max-duration-seconds", type=int, default=900)
+    p.add_argument("--idle-seconds", type=int, default=600)
+    p.add_argument("--suspended-seconds", type=int, default=300)
+    p.add_argument("--wait-timeout-seconds", type=int, default=300)
+    p.add_argument("--poll-seconds", type=float, default=5, help="Initial MicroVM state poll interval")
+    p.add_argument("--max-poll-seconds", type=float, default=30, help="Poll interval back-off ceiling")
+    p.add_argument("--ingress-network-connector", default=None)
+    p.add_argument("--egress-network-connector", default=None)
+    p.add_argument("--correlation-id", default=os.environ.get("GITHUB_RUN_ID"))
+    p.add_argument("--commit-sha", default=os.environ.get("GITHUB_SHA"))
+
+
+def _add_results_flags(p: argparse.ArgumentParser) -> None:
+    p.add_argument("--port", type=int, default=8080)
+    p.add_argument("--token-expiration-minutes", type=int, default=15)
+    p.add_argument("--fail-on-severity", default="high")
+    p.add_argument("--fail-on-policy-violation", action=argparse.BooleanOptionalAction, default=True)
+    p.add_argument("--gzip-events", action=argparse.BooleanOptionalAction, default=True,
+                   help="Request events.jsonl gzip-encoded (decompressed locally)")
+    p.add_argument("--artifact", action="append", default=[],
+                   help="Also download this artifact path (relative to the analysis root), e.g. artifacts/strace/trace.123")
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="microvm-dta")
     parser.add_argument("--profile", default=None, help="AWS profile for AWS commands")
@@ -430,19 +740,25 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--image-version", default=None)
     p.add_argument("--execution-role-arn", default=None)
     p.add_argument("--target-config", default=None, help="Embed target config in the run hook payload")
-    p.add_argument("--profile-mode", choices=["public", "production"], default="public")
-    p.add_argument("--max-duration-seconds", type=int, default=900)
-    p.add_argument("--idle-seconds", type=int, default=600)
-    p.add_argument("--suspended-seconds", type=int, default=300)
-    p.add_argument("--wait-timeout-seconds", type=int, default=300)
-    p.add_argument("--poll-seconds", type=int, default=5)
-    p.add_argument("--ingress-network-connector", default=None)
-    p.add_argument("--egress-network-connector", default=None)
-    p.add_argument("--correlation-id", default=os.environ.get("GITHUB_RUN_ID"))
-    p.add_argument("--commit-sha", default=os.environ.get("GITHUB_SHA"))
+    _add_run_microvm_flags(p)
     _add_aws_safety_flags(p)
     p.set_defaults(func=cmd_run)
 
+    p = sub.add_parser("run-many", help="Analyze several targets concurrently, one MicroVM each")
+    p.add_argument("--image-identifier", required=True)
+    p.add_argument("--image-version", default=None)
+    p.add_argument("--execution-role-arn", default=None)
+    p.add_argument("--target-config", dest="targets", action="append", required=True,
+                   help="Target config to analyze (repeat for each target)")
+    p.add_argument("--max-concurrency", type=int, default=4, help="MicroVMs in flight at once")
+    p.add_argument("--output-dir", default="out")
+    p.add_argument("--analysis-timeout-seconds", type=int, default=900)
+    p.add_argument("--keep-microvms", action="store_true", help="Do not terminate MicroVMs after fetching results")
+    _add_run_microvm_flags(p)
+    _add_results_flags(p)
+    _add_aws_safety_flags(p)
+    p.set_defaults(func=cmd_run_many)
+
     p = sub.add_parser("start-analysis", help="Call /analysis/start on a running MicroVM")
     p.add_argument("--microvm-identifier", required=True)
     p.add_argument("--target-config", default=None)
@@ -456,12 +772,9 @@ def build_parser() -> argparse.ArgumentParser:
     p = sub.add_parser("fetch-results", help="Download report/events from a MicroVM and evaluate")
     p.add_argument("--microvm-identifier", required=True)
     p.add_argument("--output-dir", default="out")
-    p.add_argument("--port", type=int, default=8080)
-    p.add_argument("--token-expiration-minutes", type=int, default=15)
-    p.add_argument("--fail-on-severity", default="high")
-    p.add_argument("--fail-on-policy-violation", action=argparse.BooleanOptionalAction, default=True)
     p.add_argument("--flow-log-group", default=None, help="CloudWatch log group for optional VPC Flow Logs correlation")
     p.add_argument("--flow-log-eni", default=None, help="Restrict flow-log correlation to this ENI id")
+    _add_results_flags(p)
     _add_aws_safety_flags(p)
     p.set_defaults(func=cmd_fetch_results)
 
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from http.client import IncompleteRead
+from pathlib import Path
 from typing import Any, Dict, Optional
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
+import gzip
 import json
+import os
+import re
+import shutil
 import time
 
 
@@ -67,3 +73,113 @@ def request_json(
                 continue
             raise EndpointError(f"Request to {url} failed after {retries} attempts: {exc}") from exc
     raise EndpointError(f"Request to {url} failed: {last_error}")
+
+
+_DOWNLOAD_CHUNK = 1024 * 1024
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/(\d+|\*)")
+
+
+def _expected_part_size(resp, offset: int) -> Optional[int]:
+    """Size ``.part`` must reach for this response to be complete, if the server says.
+
+    For a 206 that is the total from ``Content-Range`` (or the end of the span
+    when the total is unknown); for a 200 it is ``Content-Length``.
+    """
+    if resp.status == 206:
+        match = _CONTENT_RANGE.fullmatch(resp.headers.get("Content-Range", "").strip())
+        if not match:
+            return None
+        start, end, total = match.groups()
+        if int(start) != offset:
+            raise EndpointError(f"Server resumed at byte {start}, expected {offset}")
+        return int(total) if total != "*" else int(end) + 1
+    length = resp.headers.get("Content-Length")
+    return int(length) if length and length.isdigit() else None
+
+
+def download_file(
+    url: str,
+    dest: str | Path,
+    *,
+    token: Optional[str] = None,
+    port: int = 8080,
+    timeout: float = 60.0,
+    retries: int = 5,
+    accept_gzip: bool = False,
+) -> Path:
+    """Stream a MicroVM artifact to ``dest``, resuming with HTTP Range.
+
+    Bytes land in ``<dest>.part`` (with the server's ETag and content encoding
+    beside it in ``<dest>.part.meta``), so an interrupted transfer — in this call or a later
+    one — continues from where it stopped. ``If-Range`` makes the server send
+    the whole file again if it changed in between. With ``accept_gzip`` the
+    transfer is gzip-encoded and decompressed into ``dest`` at the end.
+
+    A body shorter than ``Content-Length`` / ``Content-Range`` announced is
+    treated like a dropped connection: ``.part`` is kept and the rest is
+    requested with ``Range``, so a truncated file is never renamed into place.
+    """
+    out = Path(dest)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    part = out.with_name(out.name + ".part")
+    meta_file = out.with_name(out.name + ".part.meta")
+    meta: Dict[str, Any] = {}
+    if meta_file.is_file() and part.is_file():
+        meta = json.loads(meta_file.read_text(encoding="utf-8"))
+    etag: Optional[str] = meta.get("etag")
+    encoding: Optional[str] = meta.get("encoding")
+    last_error: Optional[BaseException] = None
+
+    for attempt in range(1, retries + 1):
+        offset = part.stat().st_size if part.is_file() else 0
+        headers = {"Accept": "application/octet-stream", "X-aws-proxy-port": str(port)}
+        if token:
+            headers["X-aws-proxy-auth"] = token
+        if accept_gzip:
+            headers["Accept-Encoding"] = "gzip"
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+            if etag:
+                headers["If-Range"] = etag
+        try:
+            req = Request(url, headers=headers, method="GET")
+            with urlopen(req, timeout=timeout) as resp:  # nosec B310 - endpoint is Lambda MicroVM URL from AWS
+                etag = resp.headers.get("ETag") or etag
+                encoding = resp.headers.get("Content-Encoding")
+                meta_file.write_text(json.dumps({"etag": etag, "encoding": encoding}), encoding="utf-8")
+                mode = "ab" if resp.status == 206 else "wb"  # 200: server sent it whole
+                expected = _expected_part_size(resp, offset if mode == "ab" else 0)
+                with open(part, mode) as f:
+                    shutil.copyfileobj(resp, f, _DOWNLOAD_CHUNK)
+            # http.client does not raise on a short body; check it ourselves.
+            written = part.stat().st_size
+            if expected is not None and written < expected:
+                raise IncompleteRead(b"", expected - written)
+            break
+        except HTTPError as exc:
+            if exc.code == 416 and offset:
+                # Nothing past our offset: the .part file is already complete.
+                break
+            body = exc.read().decode("utf-8", errors="replace")
+            if exc.code in _RETRIABLE_STATUS and attempt < retries:
+                last_error = exc
+                time.sleep(min(10.0, 2 ** attempt))
+                continue
+            raise EndpointError(f"HTTP {exc.code} from {url}: {body}") from exc
+        except (URLError, TimeoutError, OSError, IncompleteRead) as exc:
+            last_error = exc
+            if attempt < retries:
+                time.sleep(min(10.0, 2 ** attempt))
+                continue
+            raise EndpointError(f"Download of {url} failed after {retries} attempts: {exc}") from exc
+    else:
+        raise EndpointError(f"Download of {url} failed: {last_error}")
+
+    if encoding == "gzip":
+        with gzip.open(part, "rb") as src, open(out, "wb") as dst:
+            shutil.copyfileobj(src, dst, _DOWNLOAD_CHUNK)
+        part.unlink()
+    else:
+        os.replace(part, out)
+    meta_file.unlink(missing_ok=True)
+    return out
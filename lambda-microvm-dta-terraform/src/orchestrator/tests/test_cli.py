@@ -0,0 +1,34 @@
+import threading
+
+from microvm_dta import cli
+
+
+class _FakeAws:
+    """list-microvms blows up with a non-CLI error; get-microvm reports RUNNING."""
+
+    def __init__(self):
+        self.calls = []
+
+    def microvms(self, args):
+        self.calls.append(args[0])
+        if args[0] == "list-microvms":
+            raise RuntimeError("unexpected list-microvms response")
+        return {"microvmId": args[-1], "state": "RUNNING"}
+
+
+def test_poller_failure_falls_back_to_get_microvm():
+    aws = _FakeAws()
+    poller = cli._MicrovmStatePoller(aws, poll_seconds=0.01, max_poll_seconds=0.01)
+    results = []
+    waiters = [
+        threading.Thread(target=lambda mid=mid: results.append(poller.wait_running(mid, 5)))
+        for mid in ("vm-1", "vm-2")
+    ]
+    for waiter in waiters:
+        waiter.start()
+    for waiter in waiters:
+        waiter.join(10)
+
+    assert sorted(r["microvmId"] for r in results) == ["vm-1", "vm-2"]
+    assert "get-microvm" in aws.calls
+    assert isinstance(poller._error, RuntimeError)
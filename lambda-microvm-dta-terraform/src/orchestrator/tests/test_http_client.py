@@ -0,0 +1,67 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from microvm_dta import http_client
+
+BODY = b"hello world"
+
+
+class _TruncatingHandler(BaseHTTPRequestHandler):
+    """First GET announces the full body but sends only 5 bytes; later GETs honour Range."""
+
+    requests = []
+
+    def do_GET(self):
+        self.requests.append(self.headers.get("Range"))
+        range_header = self.headers.get("Range")
+        if range_header:
+            start = int(range_header.split("=")[1].rstrip("-"))
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(BODY) - 1}/{len(BODY)}")
+            self.send_header("Content-Length", str(len(BODY) - start))
+            self.end_headers()
+            self.wfile.write(BODY[start:])
+            return
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY[:5])
+        self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _TruncatingHandler.requests = []
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _TruncatingHandler)
+    Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.shutdown()
+
+
+def test_short_body_is_resumed_not_saved(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client.time, "sleep", lambda _: None)
+    dest = tmp_path / "events.jsonl"
+
+    http_client.download_file(f"http://127.0.0.1:{server.server_address[1]}/events", dest)
+
+    assert dest.read_bytes() == BODY
+    assert _TruncatingHandler.requests == [None, "bytes=5-"]
+    assert not (tmp_path / "events.jsonl.part").exists()
+    assert not (tmp_path / "events.jsonl.part.meta").exists()
+
+
+def test_short_body_keeps_part_when_retries_run_out(server, tmp_path, monkeypatch):
+    monkeypatch.setattr(http_client.time, "sleep", lambda _: None)
+    dest = tmp_path / "events.jsonl"
+
+    with pytest.raises(http_client.EndpointError):
+        http_client.download_file(f"http://127.0.0.1:{server.server_address[1]}/events", dest, retries=1)
+
+    assert not dest.exists()
+    assert (tmp_path / "events.jsonl.part").read_bytes() == BODY[:5]
+    assert (tmp_path / "events.jsonl.part.meta").exists()
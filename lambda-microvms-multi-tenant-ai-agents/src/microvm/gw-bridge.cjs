@@ -6,6 +6,11 @@
 //   POST /agent {m,s,attachments}      -> {"reply": "..."}          (sync, images)
 //   POST /agent-async {m,s,attachments}-> {"turnId": "..."}         (returns at once)
 //   GET /progress?id=<turnId>          -> {"text","done","reply"?}  (poll for stream)
+//   GET /progress?id=<turnId>&since=<n>&wait=<s>
+//                                      -> same, but held open (long-poll) until the
+//                                         text is longer than n (JS string length, i.e.
+//                                         UTF-16 code units), the turn is
+//                                         done, or <s> seconds (max 30) pass
 //   GET /ready                         -> {"connected": true}
 //
 // Frame protocol (reverse-engineered + verified against gateway 2026.6.11):
@@ -29,7 +34,10 @@ const PORT = 8090;
 let ws = null;
 let connected = false;
 const pending = new Map(); // requestId -> {resolve, reject, timer}
-// Async turns for the poll-based streaming path: turnId -> {text, done, reply, error, at}
+// Async turns for the poll-based streaming path:
+// turnId -> {text, done, reply, error, at, waiters}
+// waiters are parked long-poll /progress requests; each is offered every change
+// and stays parked until the turn has what it is waiting for.
 const turns = new Map();
 // Gateway assigns its own runId per run (returned on the ack frame); delta
 // events are keyed by that runId, so map it back to our turnId.
@@ -38,6 +46,13 @@ const TURN_TTL_MS = 10 * 60 * 1000;
 // Async turns may legitimately run for hours (the Lambda pollers chain across
 // invocations); the VM's 8h max lifetime is the real bound, not a poll timeout.
 const ASYNC_TURN_TIMEOUT_MS = 8 * 60 * 60 * 1000;
+const MAX_PROGRESS_WAIT_MS = 30 * 1000;
+
+// Offer a change (new text, completion or error) to every long-poll parked on a
+// turn; a waiter returns false to stay parked.
+function notifyTurn(t) {
+  t.waiters = t.waiters.filter((release) => !release());
+}
 
 // GC: drop turns 10 min after their last activity (progress poll or completion).
 // An in-flight turn being polled keeps refreshing its timestamp, so only turns
@@ -88,6 +103,7 @@ function connect() {
         } else if (typeof pl.data.delta === "string") {
           t.text += pl.data.delta;
         }
+        notifyTurn(t);
       }
       return;
     }
@@ -166,17 +182,17 @@ http.createServer(async (req, res) => {
     }
     gcTurns();
     const turnId = crypto.randomUUID();
-    turns.set(turnId, { text: "", done: false, reply: null, error: null, at: Date.now() });
+    turns.set(turnId, { text: "", done: false, reply: null, error: null, at: Date.now(), waiters: [] });
     runAgent(body.m || "", body.s || "default", body.attachments || null, turnId,
              ASYNC_TURN_TIMEOUT_MS)
       .then((reply) => {
         const t = turns.get(turnId);
-        if (t) { t.done = true; t.reply = reply; t.at = Date.now(); }
+        if (t) { t.done = true; t.reply = reply; t.at = Date.now(); notifyTurn(t); }
       })
       .catch((e) => {
         console.error("[bridge] async agent turn failed:", e);
         const t = turns.get(turnId);
-        if (t) { t.done = true; t.error = "agent turn failed"; t.at = Date.now(); }
+        if (t) { t.done = true; t.error = "agent turn failed"; t.at = Date.now(); notifyTurn(t); }
       });
     res.writeHead(200, { "Content-Type": "application/json" });
     return res.end(JSON.stringify({ turnId }));
@@ -189,12 +205,37 @@ http.createServer(async (req, res) => {
     }
     t.at = Date.now(); // being polled = alive; see gcTurns
 
-    res.writeHead(200, { "Content-Type": "application/json" });
-    return res.end(JSON.stringify({
-      text: t.text, done: t.done,
-      ...(t.reply !== null ? { reply: t.reply } : {}),
-      ...(t.error ? { error: t.error } : {}),
-    }));
+    const respond = () => {
+      t.at = Date.now();
+      res.writeHead(200, { "Content-Type": "application/json" });
+      res.end(JSON.stringify({
+        text: t.text, done: t.done,
+        ...(t.reply !== null ? { reply: t.reply } : {}),
+        ...(t.error ? { error: t.error } : {}),
+      }));
+    };
+    // Long-poll: park the request until there is something new to report.
+    const since = parseInt(u.searchParams.get("since") || "-1", 10);
+    const waitMs = Math.min(parseFloat(u.searchParams.get("wait") || "0") * 1000 || 0,
+                            MAX_PROGRESS_WAIT_MS);
+    if (t.done || waitMs <= 0 || t.text.length > since) return respond();
+    let timer = null;
+    const release = () => {
+      if (!t.done && t.text.length <= since) return false;
+      clearTimeout(timer);
+      respond();
+      return true;
+    };
+    timer = setTimeout(() => {
+      t.waiters = t.waiters.filter((w) => w !== release);
+      respond();
+    }, waitMs);
+    t.waiters.push(release);
+    res.on("close", () => {
+      // Client went away before anything happened — drop the waiter.
+      if (!res.writableEnded) { clearTimeout(timer); t.waiters = t.waiters.filter((w) => w !== release); }
+    });
+    return;
   }
   if (u.pathname === "/agent") {
     let msg = u.searchParams.get("m") || "";
@@ -66,9 +66,14 @@ def state_report() -> bytes:
 
 
 class H(BaseHTTPRequestHandler):
+    # Keep-alive, so the orchestrator's /progress long-polls reuse one connection
+    # end to end; every reply therefore carries a Content-Length.
+    protocol_version = "HTTP/1.1"
+
     def _send(self, code, body=b""):
         self.send_response(code)
         self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
         self.wfile.write(body)
 
@@ -84,9 +89,15 @@ class H(BaseHTTPRequestHandler):
             self._send(200, state_report())
         elif self.path.startswith("/progress"):
             # Proxy to the bridge: poll accumulated stream text for an async turn.
+            # With &wait=<s> the bridge holds the request (long-poll) up to 30s.
+            q = urllib.parse.parse_qs(urllib.parse.urlparse(self.path).query)
+            try:
+                wait = min(float((q.get("wait") or ["0"])[0]), 30.0)
+            except ValueError:
+                wait = 0.0
             try:
                 with urllib.request.urlopen(
-                        "http://127.0.0.1:8090" + self.path, timeout=10) as r:
+                        "http://127.0.0.1:8090" + self.path, timeout=10 + wait) as r:
                     self._send(200, r.read())
             except urllib.error.HTTPError as e:
                 self._send(e.code, e.read())
@@ -142,11 +153,17 @@ class H(BaseHTTPRequestHandler):
             print(f"[hooks] tenant assigned: {tid}", flush=True)
             self._send(200, json.dumps({"tenant": tid}).encode())
         elif self.path.startswith(HOOK):
+            self._discard_body()
             print(f"[hooks] POST {self.path} -> 200", flush=True)
             self._send(200)
         else:
+            self._discard_body()
             self._send(200)
 
+    def _discard_body(self):
+        # An unread body would be parsed as the next request on a kept-alive connection.
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+
     def log_message(self, *a):
         pass
 
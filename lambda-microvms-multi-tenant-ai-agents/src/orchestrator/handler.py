@@ -14,6 +14,7 @@ State lifecycle: a tenant's VM is disposable; state lives on per-tenant EFS subd
 Router NEVER proactively renews (see design-orchestrator.md). Two branches only:
 alive -> forward; dead -> cold-start.
 """
+import http.client
 import json
 import os
 import time
@@ -36,6 +37,17 @@ IDLE_REAP_SECONDS = int(os.environ.get("IDLE_REAP_SECONDS", "3600"))
 # A turn that outlives one worker invocation is handed to a fresh one (chained
 # self-invoke). 120 hops x ~4.5min (300s timeout) covers the VM's full 8h life.
 MAX_TURN_HOPS = int(os.environ.get("MAX_TURN_HOPS", "120"))
+# Streaming: /progress is long-polled (held by the VM until new text arrives)
+# for up to PROGRESS_WAIT_SECONDS; placeholder edits are coalesced to at most
+# one per TG_EDIT_INTERVAL seconds (Telegram allows ~1 edit/sec/chat).
+PROGRESS_WAIT_SECONDS = float(os.environ.get("PROGRESS_WAIT_SECONDS", "25"))
+TG_EDIT_INTERVAL = float(os.environ.get("TG_EDIT_INTERVAL", "1.0"))
+# Interval polling bounds, used when the VM answers without holding the
+# request (image without long-poll support) or after a failed poll.
+POLL_MIN_SECONDS, POLL_MAX_SECONDS = 0.5, 3.0
+# /progress "since" no text can exceed: the long-poll is then only released by
+# completion or its wait, which is how text waiting for an edit slot is held.
+SINCE_DONE_ONLY = 2 ** 31 - 1
 
 mv = boto3.client("lambda-microvms", region_name=REGION)
 lam = boto3.client("lambda", region_name=REGION)
@@ -69,6 +81,39 @@ def call_vm(endpoint, path, token, method="GET", body=None, port=8080, timeout=2
         return r.status, r.read()
 
 
+class VmConnection:
+    """Kept-alive HTTPS connection to one VM's sidecar, for repeated /progress polls.
+
+    call_vm opens a new TLS connection per request; a streaming turn makes many
+    small requests, so this reuses one and reconnects once if it was dropped.
+    """
+
+    def __init__(self, endpoint, token, port=8080):
+        self.endpoint = endpoint
+        self.headers = {"X-aws-proxy-auth": token, "X-aws-proxy-port": str(port)}
+        self.conn = None
+
+    def get(self, path, timeout):
+        for attempt in (0, 1):
+            try:
+                if self.conn is None:
+                    self.conn = http.client.HTTPSConnection(self.endpoint, timeout=timeout)
+                    self.conn.connect()
+                self.conn.sock.settimeout(timeout)
+                self.conn.request("GET", path, headers=self.headers)
+                r = self.conn.getresponse()
+                return r.status, r.read()
+            except (http.client.HTTPException, OSError):
+                self.close()
+                if attempt:
+                    raise
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
 def run_turn(endpoint, token, text, session, attachments=None):
     """One agent turn via the sidecar. Images go as a POST body (too big for a URL)."""
     if attachments:
@@ -137,13 +182,24 @@ def tg_edit(bot_token, chat_id, message_id, text):
         return False
 
 
+def _js_length(text):
+    """Length of text as JavaScript counts it (UTF-16 code units), for the bridge's
+    `since` comparison with t.text.length; len() counts code points, so any emoji
+    would make every long-poll return at once."""
+    return len(text.encode("utf-16-le")) // 2
+
+
 def stream_turn_to_telegram(endpoint, token, text, session, attachments,
                             bot, chat_id, tid, ctx, resume=None):
-    """Pseudo-streaming: async turn + poll /progress, growing one Telegram message.
+    """Pseudo-streaming: async turn + long-poll /progress, growing one Telegram message.
 
     Telegram has no true streaming — the standard technique is a placeholder
-    message repeatedly edited via editMessageText (~1 edit/sec/chat allowed;
-    we edit every ~2s). Falls back to the sync path if the async start fails.
+    message repeatedly edited via editMessageText (~1 edit/sec/chat allowed).
+    /progress is long-polled over one kept-alive connection: the VM holds the
+    request until the turn has new text or finishes, so partial text arrives
+    as soon as it exists instead of on a fixed poll tick. New text that arrives
+    faster than the edit rate is coalesced into the next allowed edit. Falls
+    back to the sync path if the async start fails.
 
     A turn that outlives this Lambda invocation is NOT lost: just before the
     invocation times out, polling is handed to a fresh async self-invoke
@@ -151,6 +207,7 @@ def stream_turn_to_telegram(endpoint, token, text, session, attachments,
     the webhook handoff. Returns None on handoff — the successor owns delivery.
     A single turn is thus bounded by the VM's 8h lifetime, not Lambda's 15 min.
     """
+    started = time.monotonic()
     if resume:
         turn_id = resume["turnId"]
         msg_id = resume.get("msgId")
@@ -166,51 +223,103 @@ def stream_turn_to_telegram(endpoint, token, text, session, attachments,
         msg_id = tg_send_placeholder(bot, chat_id)
         last_len, hops = 0, 0
 
+    vm = VmConnection(endpoint, token)
     reply = None
-    # 1.2s ≈ Telegram's per-chat edit ceiling (~1/s) with headroom; a failed
-    # edit (e.g. 429) leaves last_len unchanged so the next cycle retries.
-    while True:
-        # Hand off before this invocation's timeout would silently kill polling.
-        # 20s leaves room for one in-flight poll + the invoke round-trip.
-        if ctx.get_remaining_time_in_millis() < 20_000:
-            if hops + 1 >= MAX_TURN_HOPS:
-                reply = "(turn exceeded the relay budget — increase MAX_TURN_HOPS)"
-                break
-            lam.invoke(FunctionName=FN_NAME, InvocationType="Event",
-                       Payload=json.dumps({"_worker": {"tenantId": tid, "resume": {
-                           "turnId": turn_id, "chatId": chat_id, "msgId": msg_id,
-                           "lastLen": last_len, "hops": hops + 1}}}).encode())
-            print(f"[worker] turn {turn_id} handed off (hop {hops + 1})", flush=True)
-            return None
-        time.sleep(1.2)
-        try:
-            st, body = call_vm(endpoint, f"/progress?id={turn_id}", token, timeout=15)
-            prog = json.loads(body)
-        except urllib.error.HTTPError as e:
-            if e.code == 404:
-                # Bridge no longer knows the turn (VM replaced / bridge restarted
-                # mid-turn) — retrying or relaying can never recover it.
-                reply = "(turn lost — the VM was replaced mid-turn, please retry)"
+    cur = ""
+    polls = edits = 0
+    first_text_at = None
+    next_edit_at = 0.0
+    edit_interval = TG_EDIT_INTERVAL
+    idle_sleep = POLL_MIN_SECONDS
+    interval_polling = False  # VM image answers /progress at once (no long-poll)
+    try:
+        while True:
+            # Hand off before this invocation's timeout would silently kill polling.
+            # 20s leaves room for one in-flight poll + the invoke round-trip.
+            budget = ctx.get_remaining_time_in_millis() / 1000 - 20
+            if budget <= 0:
+                if hops + 1 >= MAX_TURN_HOPS:
+                    reply = "(turn exceeded the relay budget — increase MAX_TURN_HOPS)"
+                    break
+                lam.invoke(FunctionName=FN_NAME, InvocationType="Event",
+                           Payload=json.dumps({"_worker": {"tenantId": tid, "resume": {
+                               "turnId": turn_id, "chatId": chat_id, "msgId": msg_id,
+                               "lastLen": last_len, "hops": hops + 1}}}).encode())
+                print(f"[worker] turn {turn_id} handed off (hop {hops + 1}) after "
+                      f"{polls} polls, {edits} edits", flush=True)
+                return None
+
+            # Grow the placeholder with partial text; "▌" cursor marks in-progress.
+            # Stop editing once past Telegram's 4096-char message cap: tg_edit
+            # truncates, so further edits would be byte-identical -> 400 spam.
+            unsent = bool(msg_id) and len(cur) > last_len and last_len < 3990
+            if unsent and time.monotonic() >= next_edit_at:
+                edits += 1
+                if tg_edit(bot, chat_id, msg_id, cur + " ▌"):
+                    last_len = len(cur)
+                    edit_interval = TG_EDIT_INTERVAL
+                else:
+                    # e.g. 429: back off; the unsent text goes out in a later edit
+                    edit_interval = min(edit_interval * 2, 8 * TG_EDIT_INTERVAL)
+                next_edit_at = time.monotonic() + edit_interval
+                continue
+
+            # Hold the poll open until new text. If coalesced text is already
+            # waiting to go out, more text cannot be shown before the next edit
+            # slot anyway, so hold it until then unless the turn finishes.
+            if unsent:
+                wait, since = next_edit_at - time.monotonic(), SINCE_DONE_ONLY
+            else:
+                wait, since = PROGRESS_WAIT_SECONDS, _js_length(cur)
+            wait = round(max(0.1, min(wait, PROGRESS_WAIT_SECONDS, budget)), 1)
+            if interval_polling:
+                # The VM answers at once: pace the requests here instead, and
+                # no faster than the edit slot while text is waiting for it.
+                time.sleep(max(idle_sleep, wait if unsent else 0))
+            polled = time.monotonic()
+            polls += 1
+            try:
+                st, body = vm.get(f"/progress?id={urllib.parse.quote(turn_id)}"
+                                  f"&since={since}&wait={wait}", timeout=wait + 15)
+                if st == 404:
+                    # Bridge no longer knows the turn (VM replaced / bridge restarted
+                    # mid-turn) — retrying or relaying can never recover it.
+                    reply = "(turn lost — the VM was replaced mid-turn, please retry)"
+                    break
+                if st != 200:
+                    raise RuntimeError(f"/progress returned {st}")
+                prog = json.loads(body)
+            except Exception:
+                time.sleep(idle_sleep)
+                idle_sleep = min(idle_sleep * 2, POLL_MAX_SECONDS)
+                continue
+            if prog.get("done"):
+                reply = prog.get("reply") or prog.get("text") or "(no reply)"
+                if prog.get("error"):
+                    reply = "(agent error — try again)"
                 break
-            continue
-        except Exception:
-            continue
-        if prog.get("done"):
-            reply = prog.get("reply") or prog.get("text") or "(no reply)"
-            if prog.get("error"):
-                reply = "(agent error — try again)"
-            break
-        cur = prog.get("text") or ""
-        # Grow the placeholder with partial text; "▌" cursor marks in-progress.
-        # Stop editing once past Telegram's 4096-char message cap: tg_edit
-        # truncates, so further edits would be byte-identical -> 400 spam.
-        if msg_id and len(cur) > last_len and last_len < 3990:
-            if tg_edit(bot, chat_id, msg_id, cur + " ▌"):
-                last_len = len(cur)
+            new = prog.get("text") or ""
+            grew = len(new) > len(cur)
+            if grew:
+                cur = new
+                if first_text_at is None:
+                    first_text_at = time.monotonic()
+            if not interval_polling and not grew and time.monotonic() - polled < wait / 2:
+                # Answered early with nothing new: this VM image does not hold
+                # the request, so fall back to adaptive interval polling.
+                interval_polling = True
+            if interval_polling:
+                idle_sleep = POLL_MIN_SECONDS if grew else min(idle_sleep * 1.5, POLL_MAX_SECONDS)
+    finally:
+        vm.close()
     if msg_id:
         tg_edit(bot, chat_id, msg_id, reply)
     else:
         tg_send(bot, chat_id, reply)
+    first_text = f"{first_text_at - started:.2f}s" if first_text_at else "n/a"
+    print(f"[worker] turn {turn_id} delivered: {polls} polls, {edits + 1} edits, "
+          f"first partial text after {first_text}, {time.monotonic() - started:.1f}s in this invocation",
+          flush=True)
     return reply
 
 
@@ -0,0 +1,209 @@
+from aws_durable_execution_sdk_python.config import CompletionConfig, ParallelConfig
+from aws_durable_execution_sdk_python.context import DurableContext
+from aws_durable_execution_sdk_python.exceptions import UnrecoverableError
+from dataclasses import dataclass, field
+import time
+
+
+@dataclass(frozen=True)
+class SagaStep:
+    """
+    One reservation in a saga and its compensating cancellation.
+    Checkpoint names are derived from the step name, e.g. "flight" ->
+    "reserve_flight_invocation" / "cancel_flight_invocation".
+    """
+    name: str
+    reserve_function: str
+    cancel_function: str
+    payload: dict
+    # Field of the reserve result that identifies the reservation; it is also
+    # the only field sent to the cancel function
+    id_field: str
+    # Steps whose reservations must succeed before this one starts
+    depends_on: tuple = ()
+
+    @property
+    def reserve_checkpoint(self) -> str:
+        return f"reserve_{self.name}_invocation"
+
+    @property
+    def cancel_checkpoint(self) -> str:
+        return f"cancel_{self.name}_invocation"
+
+
+@dataclass(frozen=True)
+class SagaDefinition:
+    """
+    Ordered saga steps. With parallel=False (the default) steps run one after
+    another in list order and compensate in reverse order. With parallel=True
+    steps without ordering constraints (depends_on) run concurrently and
+    compensations fan out, dependents being cancelled before what they depend on.
+    """
+    steps: tuple
+    parallel: bool = False
+
+    def waves(self) -> list:
+        """Group steps into levels where each level depends only on earlier ones."""
+        names = [step.name for step in self.steps]
+        for step in self.steps:
+            unknown = [dep for dep in step.depends_on if dep not in names]
+            if unknown:
+                raise ValueError(f"Saga step '{step.name}' depends on unknown steps: {unknown}")
+
+        waves, placed = [], set()
+        remaining = list(self.steps)
+        while remaining:
+            wave = [step for step in remaining if set(step.depends_on) <= placed]
+            if not wave:
+                raise ValueError(f"Saga steps have a dependency cycle: {[s.name for s in remaining]}")
+            waves.append(wave)
+            placed.update(step.name for step in wave)
+            remaining = [step for step in remaining if step.name not in placed]
+        return waves
+
+
+class SagaFailedError(Exception):
+    """A reservation failed; successful reservations have been compensated."""
+
+    def __init__(self, original_error: str, compensations: list, timings: dict):
+        super().__init__(original_error)
+        self.original_error = original_error
+        self.compensations = compensations
+        self.timings = timings
+
+
+@dataclass
+class SagaExecutor:
+    """
+    Runs a SagaDefinition on a durable context.
+    Every reservation and cancellation keeps its context.invoke() checkpoint
+    name, and no other durable operations are added, so sequential sagas
+    replay exactly as before. Per-step timings are measured in-process
+    around each invoke; for a call replayed from its checkpoint they cover
+    the replay only.
+    """
+    context: DurableContext
+    definition: SagaDefinition
+    timings: dict = field(default_factory=dict)
+
+    def execute(self) -> dict:
+        """
+        Reserve every step. Returns {step name: reservation id}, leaving out
+        steps whose result had no id (there is nothing to cancel); raises
+        SagaFailedError after compensating if any reservation fails.
+        """
+        reserved, error = {}, None
+        if self.definition.parallel:
+            for index, wave in enumerate(self.definition.waves()):
+                results = self._run_concurrently(
+                    [lambda ctx, step=step: self._reserve(ctx, step) for step in wave],
+                    name=f"reserve_wave_{index + 1}"
+                )
+                for step, result in zip(wave, results):
+                    if "error" in result:
+                        error = error or result["error"]
+                    elif result["id"]:
+                        reserved[step.name] = result["id"]
+                if error:
+                    break
+        else:
+            for step in self.definition.steps:
+                result = self._reserve(self.context, step)
+                if "error" in result:
+                    error = result["error"]
+                    break
+                if result["id"]:
+                    reserved[step.name] = result["id"]
+
+        if error:
+            self.context.logger.error(f"Error in saga workflow: {error}")
+            compensations = self.compensate(reserved)
+            raise SagaFailedError(error, compensations, self.timings)
+        return reserved
+
+    def compensate(self, reserved: dict) -> list:
+        """Cancel every reservation in reserved, in reverse dependency order."""
+        self.context.logger.info("Starting compensation (rollback) process...")
+        steps = [step for step in self.definition.steps if step.name in reserved]
+        compensations = []
+        if self.definition.parallel:
+            for index, wave in reversed(list(enumerate(self.definition.waves()))):
+                to_cancel = [step for step in wave if step.name in reserved]
+                compensations += self._run_concurrently(
+                    [lambda ctx, step=step: self._cancel(ctx, step, reserved[step.name]) for step in to_cancel],
+                    name=f"cancel_wave_{index + 1}"
+                )
+        else:
+            for step in reversed(steps):
+                compensations.append(self._cancel(self.context, step, reserved[step.name]))
+        self.context.logger.info("Compensation process completed")
+        return compensations
+
+    def _run_concurrently(self, branches: list, name: str) -> list:
+        """Run branches with context.parallel, waiting for all; a single branch runs inline."""
+        if not branches:
+            return []
+        if len(branches) == 1:
+            return [branches[0](self.context)]
+        batch = self.context.parallel(
+            branches,
+            name=name,
+            config=ParallelConfig(completion_config=CompletionConfig.all_completed())
+        )
+        results = [{"error": f"{name} branch did not complete"} for _ in branches]
+        for item in batch.all:
+            if item.result is not None:
+                results[item.index] = item.result
+            elif item.error is not None:
+                results[item.index] = {"error": str(item.error)}
+        return results
+
+    def _reserve(self, ctx: DurableContext, step: SagaStep) -> dict:
+        ctx.logger.info(f"Reserving {step.name}...")
+        started = self._clock()
+        try:
+            result = ctx.invoke(
+                function_name=step.reserve_function,
+                payload=step.payload,
+                name=step.reserve_checkpoint
+            )
+        except UnrecoverableError:
+            raise
+        except Exception as e:
+            self._record_timing(step.reserve_checkpoint, started, "failed")
+            return {"error": str(e)}
+        self._record_timing(step.reserve_checkpoint, started, "succeeded")
+        reservation_id = result.get(step.id_field)
+        ctx.logger.info(f"{step.name.capitalize()} reserved successfully: {reservation_id}")
+        return {"id": reservation_id}
+
+    def _cancel(self, ctx: DurableContext, step: SagaStep, reservation_id: str) -> dict:
+        ctx.logger.info(f"Compensating: Cancelling {step.name} {reservation_id}")
+        started = self._clock()
+        try:
+            ctx.invoke(
+                function_name=step.cancel_function,
+                payload={step.id_field: reservation_id},
+                name=step.cancel_checkpoint
+            )
+        except UnrecoverableError:
+            raise
+        except Exception as cancel_error:
+            self._record_timing(step.cancel_checkpoint, started, "failed")
+            ctx.logger.error(f"Failed to cancel {step.name}: {str(cancel_error)}")
+            return {step.name: "cancellation_failed", "error": str(cancel_error)}
+        self._record_timing(step.cancel_checkpoint, started, "succeeded")
+        return {step.name: "cancelled", step.id_field: reservation_id}
+
+    def _record_timing(self, checkpoint: str, started: tuple, outcome: str) -> None:
+        started_at, started_monotonic = started
+        self.timings[checkpoint] = {
+            "startedAt": started_at,
+            "durationMs": round((time.monotonic() - started_monotonic) * 1000),
+            "outcome": outcome
+        }
+
+    @staticmethod
+    def _clock() -> tuple:
+        # Deliberately not a ctx.step: timings must not add checkpoints
+        return time.time(), time.monotonic()
@@ -4,10 +4,13 @@ import uuid
 from typing import Optional, Tuple
 
 import boto3
+from strands import Agent
+from strands.models.bedrock import BedrockModel
 
 from shared.models import UserContext
 from shared.logging_utils import StructuredLogger
 
+from .session_pool import ClientKey, SessionPool, get_session_pool
 from .strands_client import create_mcp_client, create_agent
 
 
@@ -20,22 +23,25 @@ class AgentProcessor:
         model_id: str,
         region: str,
         logger: StructuredLogger,
+        pool: Optional[SessionPool] = None,
     ):
         """Initialize processor.
 
-        Caches gateway_url across invocations within the same Lambda container.
+        Caches gateway_url, MCP clients, tool schemas and the BedrockModel
+        across invocations within the same Lambda container (via SessionPool).
 
         Args:
             gateway_id: AgentCore Gateway identifier
             model_id: Bedrock model identifier
             region: AWS region
             logger: Structured logger with user context
+            pool: Session pool (defaults to the container-wide pool)
         """
         self.gateway_id = gateway_id
         self.model_id = model_id
         self.region = region
         self.logger = logger
-        self._gateway_url: Optional[str] = None
+        self._pool = pool if pool is not None else get_session_pool()
 
         logger.info("Agent processor initialized")
 
@@ -50,11 +56,12 @@ class AgentProcessor:
 
         1. Generate session_id if not provided
         2. Get gateway URL (cached)
-        3. Create MCPClient with jwt_token
-        4. Create Agent with MCPClient
+        3. Reuse a warm MCPClient for this JWT identity and expiry, or create one
+        4. Create Agent with the pooled BedrockModel and cached tool schemas
         5. Call agent(prompt)
         6. Return (str(result), session_id)
-        7. Always stop MCPClient in finally block
+        7. Stop the MCPClient if it is not pooled, or discard it from the pool
+           if the invocation failed
 
         Args:
             prompt: User's natural language prompt
@@ -75,33 +82,65 @@ class AgentProcessor:
             self.logger.info("Continuing conversation", session_id=session_id)
 
         gateway_url = self._get_gateway_url()
+        model = self._pool.model_for(self.model_id, self.region)
+        key = self._pool.client_key(jwt_token, user_context)
+        try:
+            if key is None:
+                return self._process_unpooled(prompt, gateway_url, jwt_token, model), session_id
+            return self._process_pooled(prompt, key, gateway_url, jwt_token, model), session_id
+        finally:
+            self.logger.info("Session pool stats", pooled=key is not None, **self._pool.stats())
+
+    def _process_pooled(
+        self, prompt: str, key: ClientKey, gateway_url: str, jwt_token: str, model: BedrockModel
+    ) -> str:
+        """Run the agent on a pooled MCPClient that stays open afterwards."""
+        try:
+            mcp_client = self._pool.acquire_mcp_client(key, gateway_url, jwt_token)
+            tools = self._pool.tools_for(key, mcp_client)
+            agent = create_agent(self.model_id, self.region, mcp_client, model=model, tools=tools)
+            return self._invoke(agent, prompt)
+        except Exception:
+            # The session may be broken; the next invocation reconnects
+            self._pool.discard_mcp_client(key)
+            raise
+
+    def _process_unpooled(
+        self, prompt: str, gateway_url: str, jwt_token: str, model: BedrockModel
+    ) -> str:
+        """Run the agent on a per-request MCPClient, stopped in finally."""
         mcp_client = create_mcp_client(gateway_url, jwt_token)
 
         try:
-            agent = create_agent(self.model_id, self.region, mcp_client)
-            self.logger.info("Invoking agent")
-            result = agent(prompt)
-            response_text = str(result)
-            self.logger.info("Agent invocation completed")
-            return response_text, session_id
+            agent = create_agent(self.model_id, self.region, mcp_client, model=model)
+            return self._invoke(agent, prompt)
         finally:
             try:
                 mcp_client.stop(None, None, None)
             except Exception:
                 pass  # Suppress to avoid masking original error
 
+    def _invoke(self, agent: Agent, prompt: str) -> str:
+        self.logger.info("Invoking agent")
+        result = agent(prompt)
+        response_text = str(result)
+        self.logger.info("Agent invocation completed")
+        return response_text
+
     def _get_gateway_url(self) -> str:
         """Retrieve and cache Gateway MCP endpoint URL via get_gateway API.
 
         Returns:
             Gateway MCP endpoint URL
         """
-        if self._gateway_url is not None:
-            return self._gateway_url
+        gateway_url = self._pool.gateway_urls.get(self.gateway_id)
+        if gateway_url is not None:
+            return gateway_url
 
         self.logger.info("Retrieving gateway URL", gateway_id=self.gateway_id)
         client = boto3.client("bedrock-agentcore-control", region_name=self.region)
         response = client.get_gateway(gatewayIdentifier=self.gateway_id)
-        self._gateway_url = response["gatewayUrl"]
-        self.logger.info("Gateway URL cached", gateway_url=self._gateway_url)
-        return self._gateway_url
+        gateway_url = str(response["gatewayUrl"])
+        self._pool.gateway_urls[self.gateway_id] = gateway_url
+        self.logger.info("Gateway URL cached", gateway_url=gateway_url)
+        return gateway_url
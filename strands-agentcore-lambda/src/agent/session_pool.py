@@ -0,0 +1,259 @@
+"""Container-scoped reuse of MCP clients, tool catalogs and Bedrock models.
+
+A warm Lambda container serves many invocations. Re-creating the MCPClient on
+every prompt repeats the streamable HTTP handshake and ``tools/list`` against
+the Gateway, and re-creating the BedrockModel rebuilds its boto3 client. The
+SessionPool keeps those objects alive between invocations:
+
+- MCP clients are keyed by JWT identity (``sub``, ``client_id``) and token
+  expiry, so a client only ever sends the token it was created with and is
+  retired before that token expires.
+- Discovered tool schemas are cached per identity with a TTL and re-bound to
+  whichever client serves the request.
+- One BedrockModel is kept per model ID.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from strands.models.bedrock import BedrockModel
+from strands.tools.mcp import MCPClient
+
+from shared.jwt_utils import decode_jwt_payload
+from shared.models import UserContext
+
+from .strands_client import (
+    bind_mcp_tools,
+    create_bedrock_model,
+    create_mcp_client,
+    list_mcp_tools,
+)
+
+
+# Pool sizing for a single Lambda container
+MAX_POOLED_CLIENTS = 8
+TOOL_CATALOG_TTL_SECONDS = 300
+# Retire a client this long before its token's exp so a call never starts
+# with a token that expires mid-request
+TOKEN_EXPIRY_SKEW_SECONDS = 60
+# Gateway MCP sessions idle longer than this are not reused
+MAX_CLIENT_IDLE_SECONDS = 300
+
+ClientKey = Tuple[str, str, int]
+
+
+@dataclass
+class _PooledClient:
+    """A started MCPClient and the token expiry it is bound to."""
+    client: MCPClient
+    expires_at: int
+    last_used: float
+
+
+class SessionPool:
+    """Warm MCP clients, tool schemas and models shared across invocations."""
+
+    def __init__(
+        self,
+        max_clients: int = MAX_POOLED_CLIENTS,
+        tool_ttl_seconds: float = TOOL_CATALOG_TTL_SECONDS,
+        expiry_skew_seconds: int = TOKEN_EXPIRY_SKEW_SECONDS,
+        max_idle_seconds: float = MAX_CLIENT_IDLE_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            max_clients: Maximum open MCP clients (least recently used is stopped)
+            tool_ttl_seconds: How long discovered tool schemas are reused
+            expiry_skew_seconds: Retire clients this long before token expiry
+            max_idle_seconds: Do not reuse clients idle longer than this
+            clock: Wall-clock source (seconds since epoch), for tests
+        """
+        self.max_clients = max_clients
+        self.tool_ttl_seconds = tool_ttl_seconds
+        self.expiry_skew_seconds = expiry_skew_seconds
+        self.max_idle_seconds = max_idle_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._clients: "OrderedDict[ClientKey, _PooledClient]" = OrderedDict()
+        self._tools: Dict[Tuple[str, str], Tuple[float, List[Any]]] = {}
+        self._models: Dict[Tuple[str, str], BedrockModel] = {}
+        self.gateway_urls: Dict[str, str] = {}
+        self._counters: Dict[str, List[int]] = {
+            "mcp_client": [0, 0],
+            "tool_catalog": [0, 0],
+            "model": [0, 0],
+        }
+
+    def client_key(self, jwt_token: str, user_context: UserContext) -> Optional[ClientKey]:
+        """Pool key for a token, or None if its client should not be pooled.
+
+        The token has already been verified by the handler; it is decoded
+        again here only to read ``exp``. Tokens without a numeric exp, or that
+        expire within the skew window, get a per-request client instead.
+
+        Args:
+            jwt_token: Verified JWT access token
+            user_context: User identity extracted from the token
+
+        Returns:
+            (user_id, client_id, exp) or None
+        """
+        try:
+            exp = decode_jwt_payload(jwt_token).get("exp")
+        except ValueError:
+            return None
+        if not isinstance(exp, (int, float)) or exp - self.expiry_skew_seconds <= self._clock():
+            return None
+        return (user_context.user_id, user_context.client_id, int(exp))
+
+    def acquire_mcp_client(self, key: ClientKey, gateway_url: str, jwt_token: str) -> MCPClient:
+        """Return a started MCPClient for key, reusing a warm one when possible.
+
+        Args:
+            key: Pool key from client_key()
+            gateway_url: AgentCore Gateway MCP endpoint URL
+            jwt_token: Token the client sends (must match key)
+
+        Returns:
+            Started MCPClient; the caller must not stop it (use discard_mcp_client)
+        """
+        now = self._clock()
+        with self._lock:
+            retired = self._evict_stale(now)
+            pooled = self._clients.get(key)
+            if pooled is not None:
+                self._clients.move_to_end(key)
+                pooled.last_used = now
+                self._count("mcp_client", hit=True)
+            else:
+                self._count("mcp_client", hit=False)
+        _stop_all(retired)
+        if pooled is not None:
+            return pooled.client
+
+        client = create_mcp_client(gateway_url, jwt_token)
+        client.start()
+        with self._lock:
+            self._clients[key] = _PooledClient(client=client, expires_at=key[2], last_used=now)
+            self._clients.move_to_end(key)
+            overflow = []
+            while len(self._clients) > self.max_clients:
+                _, evicted = self._clients.popitem(last=False)
+                overflow.append(evicted.client)
+        _stop_all(overflow)
+        return client
+
+    def discard_mcp_client(self, key: ClientKey) -> None:
+        """Stop and forget the client for key (e.g. after a failed invocation).
+
+        Args:
+            key: Pool key from client_key()
+        """
+        with self._lock:
+            pooled = self._clients.pop(key, None)
+        if pooled is not None:
+            _stop_all([pooled.client])
+
+    def tools_for(self, key: ClientKey, mcp_client: MCPClient) -> List[Any]:
+        """Agent tools for an identity, bound to mcp_client.
+
+        Tool schemas are discovered with ``tools/list`` at most once per
+        identity per TTL; cached schemas are re-bound to the current client.
+
+        Args:
+            key: Pool key from client_key()
+            mcp_client: Started MCPClient serving this request
+
+        Returns:
+            Agent tools that execute through mcp_client
+        """
+        identity = key[:2]
+        now = self._clock()
+        with self._lock:
+            cached = self._tools.get(identity)
+            if cached is not None and now - cached[0] >= self.tool_ttl_seconds:
+                cached = None
+            self._count("tool_catalog", hit=cached is not None)
+        if cached is not None:
+            schemas = cached[1]
+        else:
+            schemas = list_mcp_tools(mcp_client)
+            with self._lock:
+                self._tools[identity] = (now, schemas)
+        return bind_mcp_tools(mcp_client, schemas)
+
+    def model_for(self, model_id: str, region: str) -> BedrockModel:
+        """Shared BedrockModel for model_id in region.
+
+        Args:
+            model_id: Bedrock model ID
+            region: AWS region for Bedrock
+
+        Returns:
+            BedrockModel reused across invocations
+        """
+        with self._lock:
+            model = self._models.get((model_id, region))
+            self._count("model", hit=model is not None)
+            if model is None:
+                model = create_bedrock_model(model_id, region)
+                self._models[(model_id, region)] = model
+        return model
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and hit rates for structured logging.
+
+        Returns:
+            Flat dict, e.g. {'mcp_client_hits': 3, 'mcp_client_hit_rate': 0.75, ...}
+        """
+        with self._lock:
+            stats: Dict[str, Any] = {"pooled_mcp_clients": len(self._clients)}
+            for name, (hits, misses) in self._counters.items():
+                total = hits + misses
+                stats[f"{name}_hits"] = hits
+                stats[f"{name}_misses"] = misses
+                stats[f"{name}_hit_rate"] = round(hits / total, 3) if total else 0.0
+        return stats
+
+    def close(self) -> None:
+        """Stop every pooled client."""
+        with self._lock:
+            clients = [p.client for p in self._clients.values()]
+            self._clients.clear()
+        _stop_all(clients)
+
+    def _evict_stale(self, now: float) -> List[MCPClient]:
+        """Remove clients near token expiry or idle too long (lock held)."""
+        stale = [
+            key for key, pooled in self._clients.items()
+            if pooled.expires_at - self.expiry_skew_seconds <= now
+            or now - pooled.last_used > self.max_idle_seconds
+        ]
+        return [self._clients.pop(key).client for key in stale]
+
+    def _count(self, name: str, hit: bool) -> None:
+        self._counters[name][0 if hit else 1] += 1
+
+
+def _stop_all(clients: List[MCPClient]) -> None:
+    for client in clients:
+        try:
+            client.stop(None, None, None)
+        except Exception:
+            pass  # A dead session must not fail the current request
+
+
+_session_pool: Optional[SessionPool] = None
+
+
+def get_session_pool() -> SessionPool:
+    """Return the container-wide SessionPool (created on first use)."""
+    global _session_pool
+    if _session_pool is None:
+        _session_pool = SessionPool()
+    return _session_pool
@@ -1,11 +1,11 @@
 """Strands SDK factory functions for AI agent orchestration."""
 
-from typing import Optional
+from typing import Any, List, Optional
 
 from mcp.client.streamable_http import streamablehttp_client
 from strands import Agent
 from strands.models.bedrock import BedrockModel
-from strands.tools.mcp import MCPClient
+from strands.tools.mcp import MCPAgentTool, MCPClient
 
 
 SYSTEM_PROMPT = (
@@ -33,11 +33,65 @@ def create_mcp_client(gateway_url: str, jwt_token: str) -> MCPClient:
     )
 
 
+def create_bedrock_model(model_id: str, region: str) -> BedrockModel:
+    """Create the BedrockModel used by every Agent.
+
+    Args:
+        model_id: Bedrock model ID (e.g., us.anthropic.claude-sonnet-4-6)
+        region: AWS region for Bedrock
+
+    Returns:
+        Configured BedrockModel (safe to share across Agents)
+    """
+    return BedrockModel(
+        model_id=model_id,
+        region_name=region,
+        max_tokens=4096,
+    )
+
+
+def list_mcp_tools(mcp_client: MCPClient) -> List[Any]:
+    """Discover the Gateway's tool schemas over a started MCPClient.
+
+    Follows ``tools/list`` pagination and returns the raw MCP tool
+    definitions, which can be cached and re-bound with bind_mcp_tools().
+
+    Args:
+        mcp_client: Started MCPClient
+
+    Returns:
+        List of MCP tool definitions
+    """
+    schemas: List[Any] = []
+    pagination_token: Optional[str] = None
+    while True:
+        page = mcp_client.list_tools_sync(pagination_token=pagination_token)
+        schemas.extend(tool.mcp_tool for tool in page)
+        pagination_token = page.pagination_token
+        if not pagination_token:
+            return schemas
+
+
+def bind_mcp_tools(mcp_client: MCPClient, mcp_tools: List[Any]) -> List[MCPAgentTool]:
+    """Wrap cached MCP tool definitions as Agent tools executed via mcp_client.
+
+    Args:
+        mcp_client: Started MCPClient that will execute tool calls
+        mcp_tools: MCP tool definitions from list_mcp_tools()
+
+    Returns:
+        Agent tools bound to mcp_client
+    """
+    return [MCPAgentTool(mcp_tool, mcp_client) for mcp_tool in mcp_tools]
+
+
 def create_agent(
     model_id: str,
     region: str,
     mcp_client: MCPClient,
     system_prompt: Optional[str] = None,
+    model: Optional[BedrockModel] = None,
+    tools: Optional[List[Any]] = None,
 ) -> Agent:
     """Create a Strands Agent with BedrockModel and MCPClient tool source.
 
@@ -46,18 +100,15 @@ def create_agent(
         region: AWS region for Bedrock
         mcp_client: MCPClient instance for tool discovery/execution
         system_prompt: Optional override for SYSTEM_PROMPT
+        model: Optional pre-built BedrockModel to reuse instead of creating one
+        tools: Optional pre-discovered tools (bound to mcp_client) to use
+            instead of letting the Agent run tools/list on mcp_client
 
     Returns:
         Configured Agent ready to be called with a prompt
     """
-    bedrock_model = BedrockModel(
-        model_id=model_id,
-        region_name=region,
-        max_tokens=4096,
-    )
-
     return Agent(
-        model=bedrock_model,
-        tools=[mcp_client],
+        model=model or create_bedrock_model(model_id, region),
+        tools=tools if tools is not None else [mcp_client],
         system_prompt=system_prompt or SYSTEM_PROMPT,
     )
@@ -1,9 +1,10 @@
 """JWT validation and user context extraction utilities."""
 
-import json
+import hashlib
+import threading
 import time
-from typing import Dict, Optional
-from functools import lru_cache
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
 
 import jwt
 import requests
@@ -12,24 +13,214 @@ from jwt import PyJWK
 from .models import UserContext
 
 
-@lru_cache(maxsize=1)
-def _get_jwks_with_cache(jwks_url: str, cache_time: int) -> tuple:
-    """Fetch and cache JWKS keys.
-    
+# JWKS are re-fetched after this long; refreshed in the background once they
+# are older than JWKS_TTL_SECONDS - JWKS_REFRESH_AHEAD_SECONDS
+JWKS_TTL_SECONDS = 3600
+JWKS_REFRESH_AHEAD_SECONDS = 300
+# Minimum spacing between forced refreshes for unknown 'kid' values, so a
+# flood of tokens with a bogus kid cannot hammer the JWKS endpoint
+JWKS_MIN_REFRESH_INTERVAL_SECONDS = 30
+# Verified-claims cache size (tokens), per container
+VERIFIED_CLAIMS_CACHE_SIZE = 1024
+
+
+def _fetch_jwks(jwks_url: str) -> dict:
+    """Fetch the JWKS document.
+
     Args:
         jwks_url: Cognito JWKS URL
-        cache_time: Cache timestamp for TTL management
-        
+
     Returns:
-        Tuple of (jwks, cache_time)
+        JWKS dictionary
     """
     response = requests.get(jwks_url, timeout=5)
     response.raise_for_status()
-    jwks = response.json()
-    return jwks, cache_time
+    return response.json()
+
+
+class JwksKeyStore:
+    """Signing keys for one JWKS URL, indexed by 'kid' as pre-built PyJWK objects.
+
+    Keys are fetched once and reused until the TTL expires. Near the end of
+    the TTL a single background thread refreshes them while requests keep
+    using the current keys; an unknown 'kid' (key rotation) forces a
+    synchronous refresh, rate-limited by min_refresh_interval. Concurrent
+    callers never fetch more than once at a time.
+    """
+
+    def __init__(
+        self,
+        jwks_url: str,
+        ttl: int = JWKS_TTL_SECONDS,
+        refresh_ahead: int = JWKS_REFRESH_AHEAD_SECONDS,
+        min_refresh_interval: int = JWKS_MIN_REFRESH_INTERVAL_SECONDS,
+        fetch: Callable[[str], dict] = _fetch_jwks,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty key store (keys are fetched on first use).
+
+        Args:
+            jwks_url: Cognito JWKS URL
+            ttl: Seconds before fetched keys must be refreshed
+            refresh_ahead: Start a background refresh this long before ttl
+            min_refresh_interval: Minimum seconds between unknown-kid refreshes
+            fetch: JWKS fetch function, for tests
+            clock: Monotonic clock, for tests
+        """
+        self.jwks_url = jwks_url
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.min_refresh_interval = min_refresh_interval
+        self._fetch = fetch
+        self._clock = clock
+        self._keys: Dict[str, PyJWK] = {}
+        self._jwks: Optional[dict] = None
+        self._fetched_at: Optional[float] = None
+        self._fetch_lock = threading.Lock()
+        self._refreshing = False
+
+    @property
+    def jwks(self) -> dict:
+        """Current JWKS document, fetching it if missing or expired."""
+        self._ensure_fresh()
+        return self._jwks or {"keys": []}
+
+    def get_key(self, kid: str) -> PyJWK:
+        """Return the pre-built signing key for kid.
+
+        Args:
+            kid: Key ID from the token header
+
+        Returns:
+            PyJWK for kid
+
+        Raises:
+            ValueError: If kid is not in the JWKS even after a refresh
+        """
+        self._ensure_fresh()
+        key = self._keys.get(kid)
+        if key is None:
+            self._refresh(min_age=self.min_refresh_interval)
+            key = self._keys.get(kid)
+        if key is None:
+            raise ValueError("Key not found in JWKS")
+        return key
+
+    def _ensure_fresh(self) -> None:
+        fetched_at = self._fetched_at
+        if fetched_at is None or self._clock() - fetched_at >= self.ttl:
+            self._refresh(min_age=self.ttl)
+        elif self._clock() - fetched_at >= self.ttl - self.refresh_ahead:
+            self._refresh_in_background()
+
+    def _refresh(self, min_age: float) -> None:
+        """Fetch and rebuild keys unless another caller did so within min_age."""
+        with self._fetch_lock:
+            if self._fetched_at is not None and self._clock() - self._fetched_at < min_age:
+                return  # refreshed by a concurrent caller (or throttled)
+            jwks = self._fetch(self.jwks_url)
+            keys: Dict[str, PyJWK] = {}
+            for jwk in jwks.get("keys", []):
+                try:
+                    keys[jwk["kid"]] = PyJWK.from_dict(jwk)
+                except (KeyError, jwt.PyJWKError):
+                    continue  # unusable key entries are skipped, not fatal
+            self._jwks, self._keys = jwks, keys
+            self._fetched_at = self._clock()
+
+    def _refresh_in_background(self) -> None:
+        with self._fetch_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run() -> None:
+            try:
+                self._refresh(min_age=self.ttl - self.refresh_ahead)
+            except Exception:
+                pass  # keep serving current keys; the TTL forces a retry
+            finally:
+                self._refreshing = False
+
+        threading.Thread(target=run, daemon=True).start()
+
 
+class VerifiedClaimsCache:
+    """Bounded LRU of verified claims keyed by token digest.
 
-def get_jwks(jwks_url: str, ttl: int = 3600) -> dict:
+    An entry is only returned while the token's 'exp' is in the future, so a
+    cached token expires exactly when a full verification would reject it.
+    """
+
+    def __init__(self, maxsize: int = VERIFIED_CLAIMS_CACHE_SIZE, clock: Callable[[], float] = time.time):
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum cached tokens (least recently used is evicted)
+            clock: Wall-clock source (seconds since epoch), for tests
+        """
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: "OrderedDict[str, dict]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(token: str, jwks_url: str) -> str:
+        """Cache key: SHA-256 of the issuer's JWKS URL and the token."""
+        return hashlib.sha256(f"{jwks_url}\n{token}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Return a copy of the cached claims, or None if absent or expired."""
+        with self._lock:
+            claims = self._entries.get(key)
+            if claims is not None and claims.get("exp", 0) > self._clock():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(claims)
+            if claims is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: str, claims: dict) -> None:
+        """Cache verified claims (ignored if they carry no numeric 'exp')."""
+        if not isinstance(claims.get("exp"), (int, float)):
+            return
+        with self._lock:
+            self._entries[key] = dict(claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+_key_stores: Dict[str, JwksKeyStore] = {}
+_key_stores_lock = threading.Lock()
+_verified_claims = VerifiedClaimsCache()
+
+
+def get_key_store(jwks_url: str) -> JwksKeyStore:
+    """Return the container-wide key store for jwks_url.
+
+    Args:
+        jwks_url: Cognito JWKS URL
+
+    Returns:
+        JwksKeyStore shared by all invocations in this container
+    """
+    with _key_stores_lock:
+        store = _key_stores.get(jwks_url)
+        if store is None:
+            store = _key_stores[jwks_url] = JwksKeyStore(jwks_url)
+        return store
+
+
+def get_jwks(jwks_url: str, ttl: int = JWKS_TTL_SECONDS) -> dict:
     """Get JWKS with caching and TTL.
     
     Args:
@@ -39,15 +230,17 @@ def get_jwks(jwks_url: str, ttl: int = 3600) -> dict:
     Returns:
         JWKS dictionary
     """
-    current_time = int(time.time())
-    cache_time = current_time - (current_time % ttl)
-    
-    jwks, _ = _get_jwks_with_cache(jwks_url, cache_time)
-    return jwks
+    store = get_key_store(jwks_url)
+    store.ttl = ttl
+    return store.jwks
 
 
 def validate_jwt(token: str, jwks_url: str) -> dict:
     """Validate JWT token using JWKS from Cognito.
+
+    Tokens verified earlier in this container are answered from the
+    verified-claims cache until their 'exp'; otherwise the signature is
+    checked against the pre-built key for the token's 'kid'.
     
     Args:
         token: JWT access token
@@ -59,10 +252,12 @@ def validate_jwt(token: str, jwks_url: str) -> dict:
     Raises:
         ValueError: If token is invalid, expired, or malformed
     """
+    cache_key = VerifiedClaimsCache.key(token, jwks_url)
+    cached = _verified_claims.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        # Fetch JWKS
-        jwks = get_jwks(jwks_url)
-        
         # Get token header
         unverified_header = jwt.get_unverified_header(token)
         kid = unverified_header.get('kid')
@@ -70,13 +265,8 @@ def validate_jwt(token: str, jwks_url: str) -> dict:
         if not kid:
             raise ValueError("Token missing 'kid' in header")
         
-        # Find matching key
-        key = next((k for k in jwks['keys'] if k['kid'] == kid), None)
-        if not key:
-            raise ValueError("Key not found in JWKS")
-        
-        # Construct public key using PyJWK
-        public_key = PyJWK.from_dict(key).key
+        # Pre-built public key for this kid (refreshes JWKS on an unknown kid)
+        public_key = get_key_store(jwks_url).get_key(kid).key
         
         # Validate token
         claims = jwt.decode(
@@ -90,6 +280,7 @@ def validate_jwt(token: str, jwks_url: str) -> dict:
         if claims.get('token_use') != 'access':
             raise ValueError("Must use access token, not ID token")
         
+        _verified_claims.put(cache_key, claims)
         return claims
         
     except jwt.ExpiredSignatureError:
@@ -17,17 +17,19 @@ for mod_name in [
         sys.modules[mod_name] = _mock_modules[mod_name]
 
 from src.agent.agent_processor import AgentProcessor  # noqa: E402
+from src.agent.session_pool import SessionPool  # noqa: E402
 from src.shared.models import UserContext  # noqa: E402
 
 
 def _make_processor(gateway_id: str = "gw-test", model_id: str = "model-test", region: str = "us-east-1") -> AgentProcessor:
-    """Create an AgentProcessor with a mock logger."""
+    """Create an AgentProcessor with a mock logger and an isolated session pool."""
     mock_logger = MagicMock()
     return AgentProcessor(
         gateway_id=gateway_id,
         model_id=model_id,
         region=region,
         logger=mock_logger,
+        pool=SessionPool(),
     )
 
 
@@ -47,8 +49,9 @@ def _make_user_context() -> UserContext:
 def test_per_request_mcp_client_lifecycle(jwt_tokens: list[str]) -> None:
     """Property 3: Per-request MCPClient lifecycle.
 
-    For any sequence of process() calls with different JWT tokens, each call
-    creates a new MCPClient instance (never reuses a previous client).
+    For any sequence of process() calls with tokens that carry no usable exp
+    (so they cannot be pooled), each call creates a new MCPClient instance
+    (never reuses a previous client).
 
     **Validates: Requirements 3.1**
     """
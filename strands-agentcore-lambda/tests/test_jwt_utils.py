@@ -0,0 +1,134 @@
+"""Tests for JWKS key store and verified-claims cache in jwt_utils.py."""
+
+import json
+import time
+from unittest.mock import MagicMock, patch
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from hypothesis import given, settings, strategies as st
+
+from src.shared import jwt_utils
+from src.shared.jwt_utils import JwksKeyStore, VerifiedClaimsCache, validate_jwt
+
+JWKS_URL = "https://cognito-idp.us-east-1.amazonaws.com/pool/.well-known/jwks.json"
+
+
+def _rsa_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+PRIVATE_KEYS = {"kid-1": _rsa_key(), "kid-2": _rsa_key()}
+
+
+def _jwk(kid: str) -> dict:
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(PRIVATE_KEYS[kid].public_key()))
+    jwk.update({"kid": kid, "alg": "RS256", "use": "sig"})
+    return jwk
+
+
+def _token(kid: str = "kid-1", exp_in: int = 3600, token_use: str = "access") -> str:
+    claims = {
+        "sub": "u-1",
+        "username": "tester",
+        "client_id": "c-1",
+        "token_use": token_use,
+        "exp": int(time.time()) + exp_in,
+    }
+    return jwt.encode(claims, PRIVATE_KEYS[kid], algorithm="RS256", headers={"kid": kid})
+
+
+@pytest.fixture(autouse=True)
+def _reset_caches():
+    jwt_utils._key_stores.clear()
+    jwt_utils._verified_claims.clear()
+    yield
+    jwt_utils._key_stores.clear()
+    jwt_utils._verified_claims.clear()
+
+
+def _install_store(kids: list, **kwargs) -> MagicMock:
+    fetch = MagicMock(return_value={"keys": [_jwk(k) for k in kids]})
+    jwt_utils._key_stores[JWKS_URL] = JwksKeyStore(JWKS_URL, fetch=fetch, **kwargs)
+    return fetch
+
+
+def test_repeat_token_is_served_from_verified_cache() -> None:
+    """The same bearer token is verified once; later calls skip jwt.decode."""
+    fetch = _install_store(["kid-1"])
+    token = _token()
+    claims = validate_jwt(token, JWKS_URL)
+
+    with patch("src.shared.jwt_utils.jwt.decode") as mock_decode:
+        for _ in range(5):
+            assert validate_jwt(token, JWKS_URL) == claims
+        mock_decode.assert_not_called()
+    assert fetch.call_count == 1
+
+
+def test_cached_claims_honor_exp() -> None:
+    """A cached token stops validating once its exp passes."""
+    now = [1_000.0]
+    cache = VerifiedClaimsCache(clock=lambda: now[0])
+    cache.put("k", {"sub": "u-1", "exp": 1_010})
+    assert cache.get("k") == {"sub": "u-1", "exp": 1_010}
+    now[0] = 1_010
+    assert cache.get("k") is None
+
+
+@settings(max_examples=25)
+@given(maxsize=st.integers(min_value=1, max_value=10), n=st.integers(min_value=1, max_value=30))
+def test_verified_cache_is_bounded(maxsize: int, n: int) -> None:
+    """The LRU never holds more than maxsize tokens and keeps the most recent."""
+    cache = VerifiedClaimsCache(maxsize=maxsize, clock=lambda: 0)
+    for i in range(n):
+        cache.put(f"k{i}", {"exp": 10})
+    assert len(cache._entries) == min(n, maxsize)
+    assert cache.get(f"k{n - 1}") is not None
+
+
+def test_unknown_kid_forces_refresh() -> None:
+    """A token signed by a rotated-in key triggers one JWKS refresh."""
+    store = JwksKeyStore(JWKS_URL, min_refresh_interval=0, fetch=MagicMock())
+    store._fetch.side_effect = [{"keys": [_jwk("kid-1")]}, {"keys": [_jwk("kid-1"), _jwk("kid-2")]}]
+    jwt_utils._key_stores[JWKS_URL] = store
+
+    validate_jwt(_token("kid-1"), JWKS_URL)
+    validate_jwt(_token("kid-2"), JWKS_URL)
+    assert store._fetch.call_count == 2
+
+
+def test_unknown_kid_refresh_is_rate_limited() -> None:
+    """Bogus kids cannot trigger a JWKS fetch per request."""
+    fetch = _install_store(["kid-1"], min_refresh_interval=30)
+    validate_jwt(_token("kid-1"), JWKS_URL)
+    for _ in range(5):
+        with pytest.raises(ValueError, match="Key not found"):
+            validate_jwt(_token("kid-2"), JWKS_URL)
+    assert fetch.call_count == 1
+
+
+def test_keys_refresh_in_background_before_ttl() -> None:
+    """Near the TTL the current keys keep serving while one refresh runs."""
+    now = [0.0]
+    fetch = MagicMock(return_value={"keys": [_jwk("kid-1")]})
+    store = JwksKeyStore(JWKS_URL, ttl=100, refresh_ahead=10, fetch=fetch, clock=lambda: now[0])
+    store.get_key("kid-1")
+    now[0] = 95
+    with patch("src.shared.jwt_utils.threading.Thread") as mock_thread:
+        store.get_key("kid-1")
+        store.get_key("kid-1")
+    assert mock_thread.call_count == 1  # single in-flight background refresh
+    mock_thread.call_args.kwargs["target"]()
+    assert fetch.call_count == 2
+
+
+def test_id_token_is_rejected_and_not_cached() -> None:
+    """Only fully validated access tokens enter the verified cache."""
+    _install_store(["kid-1"])
+    token = _token(token_use="id")
+    for _ in range(2):
+        with pytest.raises(ValueError, match="access token"):
+            validate_jwt(token, JWKS_URL)
+    assert len(jwt_utils._verified_claims._entries) == 0
@@ -0,0 +1,174 @@
+"""Property-based tests for session_pool.py and pooled AgentProcessor invocations."""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import jwt
+from hypothesis import given, settings, strategies as st
+
+# Mock external SDK modules before importing session_pool
+_mock_modules = {}
+for mod_name in [
+    "mcp", "mcp.client", "mcp.client.streamable_http",
+    "strands", "strands.models", "strands.models.bedrock",
+    "strands.tools", "strands.tools.mcp",
+]:
+    if mod_name not in sys.modules:
+        _mock_modules[mod_name] = MagicMock()
+        sys.modules[mod_name] = _mock_modules[mod_name]
+
+from src.agent.agent_processor import AgentProcessor  # noqa: E402
+from src.agent.session_pool import SessionPool  # noqa: E402
+from src.shared.models import UserContext  # noqa: E402
+
+NOW = 1_700_000_000
+
+
+def _token(sub: str = "u-1", exp: int = NOW + 3600) -> str:
+    """Create a test JWT carrying sub and exp (the pool never verifies it)."""
+    return jwt.encode({"sub": sub, "exp": exp}, "test-secret", algorithm="HS256")
+
+
+def _user(user_id: str = "u-1") -> UserContext:
+    return UserContext(user_id=user_id, username="tester", client_id="c-1")
+
+
+def _pool(**kwargs) -> SessionPool:
+    return SessionPool(clock=lambda: NOW, **kwargs)
+
+
+def _new_client(*args, **kwargs) -> MagicMock:
+    return MagicMock()
+
+
+@settings(max_examples=50)
+@given(num_calls=st.integers(min_value=1, max_value=10))
+def test_pooled_client_reused_for_same_identity_and_expiry(num_calls: int) -> None:
+    """Property 7: Warm MCPClient reuse.
+
+    For N process() calls with the same JWT identity and expiry, one MCPClient
+    is created, tools/list runs once and one BedrockModel is built.
+    """
+    # Feature: session-pool, Property 7: Warm MCPClient reuse
+    pool = _pool()
+    processor = AgentProcessor("gw-1", "model-1", "us-east-1", MagicMock(), pool=pool)
+    pool.gateway_urls["gw-1"] = "https://gw.example.com/mcp"
+
+    with (
+        patch("src.agent.session_pool.create_mcp_client", side_effect=_new_client) as mock_create_mcp,
+        patch("src.agent.session_pool.list_mcp_tools", return_value=["tool-schema"]) as mock_list,
+        patch("src.agent.session_pool.bind_mcp_tools", return_value=["bound-tool"]),
+        patch("src.agent.session_pool.create_bedrock_model") as mock_model,
+        patch("src.agent.agent_processor.create_agent") as mock_create_agent,
+    ):
+        mock_create_agent.return_value = MagicMock(return_value="ok")
+        token = _token()
+        for _ in range(num_calls):
+            processor.process("hi", token, _user(), session_id=None)
+
+        assert mock_create_mcp.call_count == 1
+        assert mock_list.call_count == 1
+        assert mock_model.call_count == 1
+        for agent_call in mock_create_agent.call_args_list:
+            assert agent_call.kwargs["tools"] == ["bound-tool"]
+            assert agent_call.kwargs["model"] is mock_model.return_value
+
+        stats = pool.stats()
+        assert stats["mcp_client_hits"] == num_calls - 1
+        assert stats["mcp_client_misses"] == 1
+        assert stats["tool_catalog_hits"] == num_calls - 1
+        assert stats["model_hits"] == num_calls - 1
+
+
+def test_new_expiry_gets_new_client_and_reuses_tool_catalog() -> None:
+    """A refreshed token (new exp) gets its own client; tool schemas are re-bound."""
+    pool = _pool()
+    with (
+        patch("src.agent.session_pool.create_mcp_client", side_effect=_new_client) as mock_create_mcp,
+        patch("src.agent.session_pool.list_mcp_tools", return_value=["schema"]) as mock_list,
+        patch("src.agent.session_pool.bind_mcp_tools") as mock_bind,
+    ):
+        first = pool.client_key(_token(exp=NOW + 600), _user())
+        second = pool.client_key(_token(exp=NOW + 4200), _user())
+        client_a = pool.acquire_mcp_client(first, "https://gw", "t1")
+        pool.tools_for(first, client_a)
+        client_b = pool.acquire_mcp_client(second, "https://gw", "t2")
+        pool.tools_for(second, client_b)
+
+        assert client_a is not client_b
+        assert mock_create_mcp.call_count == 2
+        assert mock_list.call_count == 1
+        mock_bind.assert_called_with(client_b, ["schema"])
+
+
+def test_tool_catalog_expires_after_ttl() -> None:
+    """tools/list runs again once the cached catalog is older than the TTL."""
+    now = [NOW]
+    pool = SessionPool(tool_ttl_seconds=300, clock=lambda: now[0])
+    client = MagicMock()
+    key = ("u-1", "c-1", NOW + 3600)
+    with (
+        patch("src.agent.session_pool.list_mcp_tools", return_value=[]) as mock_list,
+        patch("src.agent.session_pool.bind_mcp_tools", return_value=[]),
+    ):
+        pool.tools_for(key, client)
+        now[0] += 299
+        pool.tools_for(key, client)
+        now[0] += 2
+        pool.tools_for(key, client)
+    assert mock_list.call_count == 2
+
+
+@settings(max_examples=50)
+@given(seconds_left=st.integers(min_value=-3600, max_value=60))
+def test_tokens_near_expiry_are_not_pooled(seconds_left: int) -> None:
+    """Tokens expiring within the skew window (or undecodable) get no pool key."""
+    pool = _pool(expiry_skew_seconds=60)
+    assert pool.client_key(_token(exp=NOW + seconds_left), _user()) is None
+    assert pool.client_key("not-a-jwt", _user()) is None
+
+
+def test_expired_and_lru_clients_are_stopped() -> None:
+    """Clients past token expiry or beyond max_clients are stopped and dropped."""
+    now = [NOW]
+    pool = SessionPool(max_clients=2, expiry_skew_seconds=60, clock=lambda: now[0])
+    with patch("src.agent.session_pool.create_mcp_client", side_effect=_new_client):
+        short = ("u-1", "c-1", NOW + 120)
+        a = pool.acquire_mcp_client(short, "https://gw", "t")
+        b = pool.acquire_mcp_client(("u-2", "c-1", NOW + 3600), "https://gw", "t")
+        c = pool.acquire_mcp_client(("u-3", "c-1", NOW + 3600), "https://gw", "t")
+        a.stop.assert_called_once_with(None, None, None)  # LRU overflow
+
+        now[0] += 3600 - 30
+        pool.acquire_mcp_client(("u-4", "c-1", NOW + 7200), "https://gw", "t")
+        b.stop.assert_called_once_with(None, None, None)  # near token expiry and idle
+        c.stop.assert_called_once_with(None, None, None)
+
+
+def test_failed_invocation_discards_pooled_client() -> None:
+    """A failed pooled invocation stops the client so the next call reconnects."""
+    pool = _pool()
+    pool.gateway_urls["gw-1"] = "https://gw.example.com/mcp"
+    processor = AgentProcessor("gw-1", "model-1", "us-east-1", MagicMock(), pool=pool)
+    agent_error = RuntimeError("agent boom")
+    with (
+        patch("src.agent.session_pool.create_mcp_client", side_effect=_new_client) as mock_create_mcp,
+        patch("src.agent.session_pool.list_mcp_tools", return_value=[]),
+        patch("src.agent.session_pool.bind_mcp_tools", return_value=[]),
+        patch("src.agent.session_pool.create_bedrock_model"),
+        patch("src.agent.agent_processor.create_agent") as mock_create_agent,
+    ):
+        mock_create_agent.return_value = MagicMock(side_effect=agent_error)
+        token = _token()
+        try:
+            processor.process("hi", token, _user(), session_id=None)
+            assert False, "Expected RuntimeError from agent"
+        except RuntimeError as exc:
+            assert exc is agent_error
+
+        assert pool.stats()["pooled_mcp_clients"] == 0
+
+        mock_create_agent.return_value = MagicMock(return_value="ok")
+        response, _ = processor.process("hi", token, _user(), session_id=None)
+        assert response == "ok"
+        assert mock_create_mcp.call_count == 2